@@ -10,6 +10,8 @@ Students will learn about:
 
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 # Get the project root directory (parent of config directory)
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -21,11 +23,20 @@ DATABASE_PATH = PROJECT_ROOT / "data" / "learning_project.db"
 # Ensure the data directory exists
 DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-# Database configuration settings
-DATABASE_CONFIG = {
-    "path": str(DATABASE_PATH),
+# The same location as a plain absolute string, computed once
+# sqlite3.connect() accepts strings directly, so no Path conversion is needed later
+DATABASE_PATH_STR = str(DATABASE_PATH.resolve())
+
+# Database configuration settings (constant - never reassigned)
+DATABASE_CONFIG: Dict[str, Any] = {
+    "path": DATABASE_PATH_STR,
     "timeout": 10.0,  # Connection timeout in seconds
     "check_same_thread": False,  # Allow multi-threaded access (for learning purposes)
+    "pool_size": 5,  # Maximum number of idle connections kept open for reuse
+    "reader_pool_size": os.cpu_count() or 4,  # Idle read-only connections kept for SELECTs
+    "cached_statements": 200,  # Prepared statements SQLite keeps per connection
+    "wal": True,  # Use write-ahead logging so readers don't block the writer
+    "cache_spill": False,  # Keep dirty pages in memory until commit (small database)
 }
 
 
@@ -40,21 +51,26 @@ def get_database_path() -> str:
         >>> db_path = get_database_path()
         >>> print(f"Database located at: {db_path}")
     """
-    return DATABASE_CONFIG["path"]
+    return DATABASE_PATH_STR
 
 
-def get_database_config() -> dict:
+def get_database_config() -> Mapping[str, Any]:
     """
-    Get the complete database configuration dictionary.
+    Get the complete database configuration.
     
     Returns:
-        dict: Configuration settings for database connection
+        Mapping: Read-only view of the configuration settings
     
     Example:
         >>> config = get_database_config()
         >>> print(f"Timeout: {config['timeout']} seconds")
+    
+    Learning Note:
+    - MappingProxyType is a read-only "window" onto a dictionary
+    - Callers can read settings but can't change them by accident,
+      and no copy of the dictionary has to be made
     """
-    return DATABASE_CONFIG.copy()
+    return MappingProxyType(DATABASE_CONFIG)
 
 
 # Learning Note:
@@ -17,12 +17,111 @@ Key Concepts:
 5. Transaction Management: Committing changes or rolling back on errors
 """
 
+import atexit
+import contextlib
+import os
+import queue
+import re
 import sqlite3
-from typing import List, Optional, Any, Dict
+import threading
+from typing import List, Optional, Any, Dict, Iterable, Iterator, Union
 from pathlib import Path
 
 # Import database configuration
-from config.database import get_database_path, get_database_config
+from config.database import get_database_path, DATABASE_CONFIG
+
+# Read the settings once at import time instead of on every new connection
+_DB_PATH = get_database_path()
+_DB_TIMEOUT = DATABASE_CONFIG["timeout"]
+_DB_CHECK_SAME_THREAD = DATABASE_CONFIG["check_same_thread"]
+# Size the prepared-statement cache for the app's set of distinct queries.
+# One-off DDL should go through execute_script(), which never enters the cache.
+_DB_CACHED_STATEMENTS = max(100, DATABASE_CONFIG.get("cached_statements", 256))
+_DB_CACHE_SPILL = DATABASE_CONFIG.get("cache_spill", True)
+_DB_WAL = DATABASE_CONFIG["wal"]
+# Read-only connections open the database through a "file:" URI with mode=ro
+_DB_READONLY_URI = Path(_DB_PATH).as_uri() + "?mode=ro"
+
+
+# Connection Pool
+# Opening a SQLite connection means opening the file, running PRAGMAs and
+# configuring the row factory. Instead of paying that cost on every query,
+# we keep a small stack of ready-to-use connections and hand them out again.
+# LifoQueue returns the most recently used connection first, which keeps
+# its page cache "warm".
+_POOL: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+    maxsize=DATABASE_CONFIG["pool_size"]
+)
+
+# Read-only connections used by execute_query(). In WAL mode readers never
+# wait for the writer (or for each other), so SELECTs keep running while
+# an INSERT/UPDATE/DELETE is in progress.
+_READERS: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+    maxsize=DATABASE_CONFIG.get("reader_pool_size") or os.cpu_count() or 4
+)
+
+# SQLite allows only one writer at a time. Writers in this process take
+# turns on a lock instead of retrying inside SQLite's busy handler.
+# An RLock lets a thread that already holds it acquire it again.
+_WRITE_LOCK = threading.RLock()
+
+# Bumped every time the schema changes. Each connection remembers the value
+# it last saw and throws away its prepared cursors when it is out of date.
+_schema_generation = 0
+
+# The connection owned by an open DatabaseConnection block, per thread.
+# Nested blocks and the execute_* helpers called inside a block reuse it
+# instead of borrowing a second connection from the pool.
+_tls = threading.local()
+
+
+# SQL statements that change the schema. After one of these runs, any
+# cursor prepared against the old schema must be thrown away.
+_DDL_PREFIXES = ("CREATE", "DROP", "ALTER")
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    A SQLite connection that remembers a cursor for each SQL string it runs.
+    
+    Re-running the same SQL text through the same cursor lets SQLite reuse
+    the statement it already parsed and planned, instead of compiling it
+    again on every call.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statement_cache: Dict[str, sqlite3.Cursor] = {}
+        self.statement_cache_size = kwargs.get("cached_statements", 128)
+        self.schema_generation = _schema_generation
+        self.readonly = False
+    
+    def cached_cursor(self, query: str) -> sqlite3.Cursor:
+        """Return the cursor used for `query` last time, or a new one."""
+        if self.schema_generation != _schema_generation:
+            # The schema changed since these cursors were prepared
+            self.statement_cache.clear()
+            self.schema_generation = _schema_generation
+        cursor = self.statement_cache.pop(query, None)
+        if cursor is None:
+            cursor = self.cursor()
+            if len(self.statement_cache) >= self.statement_cache_size:
+                # Evict the least recently used statement
+                self.statement_cache.pop(next(iter(self.statement_cache)))
+        # Re-inserting keeps the dict ordered from least to most recently used
+        self.statement_cache[query] = cursor
+        return cursor
+
+
+def _is_ddl(query: str) -> bool:
+    """Check whether a SQL statement changes the database schema."""
+    return query.lstrip()[:6].upper().startswith(_DDL_PREFIXES)
+
+
+def _schema_changed() -> None:
+    """Invalidate the prepared cursors of every connection, in every pool."""
+    global _schema_generation
+    _schema_generation += 1
 
 
 # Custom Exception Classes
@@ -53,15 +152,110 @@ class QueryExecutionError(Exception):
     pass
 
 
+# Integrity errors are classified by the constraint named in SQLite's message.
+# One precompiled pattern finds it in a single pass over the text.
+_INTEGRITY_RE = re.compile(r"unique|foreign key|not null", re.IGNORECASE)
+
+_INTEGRITY_MESSAGES = {
+    "unique": "Duplicate entry: A record with this unique value already exists.",
+    "foreign key": "Invalid reference: The referenced record does not exist.",
+    "not null": "Missing required field: A required value was not provided.",
+}
+
+
+def _raise_integrity(e: sqlite3.IntegrityError) -> None:
+    """
+    Convert a SQLite IntegrityError into a friendly QueryExecutionError.
+    
+    Integrity errors mean a constraint was violated, for example:
+    - UNIQUE: the value already exists (duplicate ISBN or email)
+    - FOREIGN KEY: the referenced record doesn't exist
+    - NOT NULL: a required value is missing
+    
+    Args:
+        e: The IntegrityError raised by sqlite3
+        
+    Raises:
+        QueryExecutionError: Always, with a message explaining the violation
+    """
+    match = _INTEGRITY_RE.search(str(e))
+    message = _INTEGRITY_MESSAGES.get(match.group(0).lower()) if match else None
+    
+    if message is None:
+        raise QueryExecutionError(f"Database constraint violation: {str(e)}")
+    
+    raise QueryExecutionError(f"{message}\nDetails: {str(e)}")
+
+
+def _init_conn(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """
+    Configure a freshly opened connection before it joins the pool.
+    
+    Every connection in the pool gets the same settings, and they are
+    applied exactly once - when the connection is created - instead of
+    on every query.
+    
+    Read-only connections skip the settings that write to the database
+    file (journal_mode, wal_autocheckpoint): a "mode=ro" connection can't
+    switch a fresh database to WAL. The first read-write connection does.
+    
+    Args:
+        conn: A newly opened SQLite connection
+        
+    Returns:
+        sqlite3.Connection: The same connection, ready to use
+    """
+    # Set row_factory to sqlite3.Row
+    # This makes query results behave like dictionaries
+    # Instead of: result[0], result[1]
+    # We can use: result['id'], result['title']
+    conn.row_factory = sqlite3.Row
+    
+    # Enable foreign key constraints
+    # SQLite doesn't enforce foreign keys by default!
+    # This ensures referential integrity (e.g., can't delete a book that's currently loaned)
+    conn.execute("PRAGMA foreign_keys = ON")
+    
+    readonly = getattr(conn, "readonly", False)
+    
+    if _DB_WAL:
+        if not readonly:
+            # Write-Ahead Logging (WAL) lets readers keep reading while a write
+            # is in progress, and needs far fewer disk syncs than the default
+            # rollback journal. The journal mode is stored in the database file,
+            # so re-asserting it on every new connection is cheap.
+            conn.execute("PRAGMA journal_mode = WAL")
+        # NORMAL is safe in WAL mode: a power loss may drop the last commit,
+        # but can never corrupt the database
+        conn.execute("PRAGMA synchronous = NORMAL")
+        # Keep temporary tables and indices in memory instead of temp files
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Negative cache_size means KiB: keep up to ~64 MB of pages cached
+        conn.execute("PRAGMA cache_size = -64000")
+        # Read the database file through memory mapping (up to 256 MB)
+        conn.execute("PRAGMA mmap_size = 268435456")
+        if not readonly:
+            # Copy the WAL back into the database file every ~1000 pages (~4 MB),
+            # so the WAL (which every reader has to search) stays small
+            conn.execute("PRAGMA wal_autocheckpoint = 1000")
+    
+    if not _DB_CACHE_SPILL:
+        # Keep modified pages in memory until the transaction commits instead
+        # of spilling them to the file mid-transaction (fine for small databases)
+        conn.execute("PRAGMA cache_spill = OFF")
+    
+    return conn
+
+
 def get_connection() -> sqlite3.Connection:
     """
-    Create and return a connection to the SQLite database.
+    Get a connection to the SQLite database.
     
     This function:
-    1. Gets the database path from configuration
-    2. Creates a connection with appropriate settings
-    3. Configures the connection to return rows as dictionaries
-    4. Enables foreign key constraint checking
+    1. Reuses an idle connection from the pool if one is available
+    2. Otherwise opens a new connection with appropriate settings
+    3. Configures new connections to return rows as dictionaries
+    4. Enables foreign key constraint checking on new connections
     
     Returns:
         sqlite3.Connection: An active database connection
@@ -72,67 +266,205 @@ def get_connection() -> sqlite3.Connection:
     Example:
         >>> conn = get_connection()
         >>> # Use the connection for queries
-        >>> conn.close()  # Always close when done!
+        >>> release_connection(conn)  # Give it back to the pool when done!
     
     Learning Notes:
-    - SQLite connections are lightweight but should still be closed properly
-    - The row_factory setting makes results easier to work with
-    - Foreign keys must be explicitly enabled in SQLite
-    - In production, you might use connection pooling for better performance
+    - Opening a connection has a cost (file open, PRAGMAs, setup)
+    - A connection pool keeps connections open so they can be reused
+    - Hand connections back with release_connection() so others can reuse them
+    - Calling conn.close() is still safe - the connection just isn't reused
+    
+    Note - reading your own writes:
+    execute_query() and the other read helpers run on separate read-only
+    connections. They only see changes that have been COMMITTED. If you
+    write through a connection from get_connection() and haven't called
+    conn.commit() yet, read through that same connection (conn.execute)
+    - or use a DatabaseConnection / transaction() block instead, where the
+    helpers automatically run on the block's connection and see its
+    uncommitted changes.
     """
     try:
-        # Get the database path from our configuration
-        db_path = get_database_path()
-        config = get_database_config()
-        
-        # Create the connection with timeout setting
-        # timeout: how long to wait if database is locked (in seconds)
-        conn = sqlite3.connect(
-            db_path,
-            timeout=config.get("timeout", 10.0),
-            check_same_thread=config.get("check_same_thread", False)
-        )
-        
-        # Set row_factory to sqlite3.Row
-        # This makes query results behave like dictionaries
-        # Instead of: result[0], result[1]
-        # We can use: result['id'], result['title']
-        conn.row_factory = sqlite3.Row
+        # Fast path: reuse an idle, already-configured connection
+        return _POOL.get_nowait()
+    except queue.Empty:
+        return _connect()
+
+
+def _get_reader() -> sqlite3.Connection:
+    """Borrow a read-only connection (give it back with release_connection)."""
+    try:
+        return _READERS.get_nowait()
+    except queue.Empty:
+        return _connect(readonly=True)
+
+
+def _open(readonly: bool) -> sqlite3.Connection:
+    """Open a configured connection; raises sqlite3.Error on failure."""
+    # Create the connection with timeout setting
+    # timeout: how long to wait if database is locked (in seconds)
+    # cached_statements: how many prepared statements SQLite remembers
+    # A read-only connection opens a "file:...?mode=ro" URI instead,
+    # so SQLite itself refuses any attempt to write through it
+    conn = sqlite3.connect(
+        _DB_READONLY_URI if readonly else _DB_PATH,
+        timeout=_DB_TIMEOUT,
+        check_same_thread=_DB_CHECK_SAME_THREAD,
+        cached_statements=_DB_CACHED_STATEMENTS,
+        factory=_PooledConnection,
+        uri=readonly
+    )
+    try:
+        conn.readonly = readonly
+        _init_conn(conn)
+        if readonly:
+            # Opening is lazy: read the schema version now, so a database
+            # that can't be read in mode=ro fails here and not in a query
+            conn.execute("PRAGMA schema_version")
+        return conn
+    except sqlite3.Error:
+        conn.close()
+        raise
+
+
+def _connect(readonly: bool = False) -> sqlite3.Connection:
+    """Open and configure a new read-write (or read-only) connection."""
+    try:
+        if not readonly:
+            return _open(readonly=False)
         
-        # Enable foreign key constraints
-        # SQLite doesn't enforce foreign keys by default!
-        # This ensures referential integrity (e.g., can't delete a book that's currently loaned)
-        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            conn = _open(readonly=True)
+        except sqlite3.Error:
+            # mode=ro can't create a missing database file, nor (in WAL mode)
+            # the shared-memory file next to it. Fall back to a normal
+            # connection, which can - like every connection used to.
+            conn = _open(readonly=False)
+            # It still belongs to the readers' pool
+            conn.readonly = True
         
+        # mode=ro protects the database file; query_only also refuses
+        # changes to TEMP tables, so a reader never holds private state
+        conn.execute("PRAGMA query_only = ON")
         return conn
         
     except sqlite3.Error as e:
         # Convert SQLite-specific error to our custom error
         # This provides a cleaner interface for the rest of our application
         raise DatabaseConnectionError(
-            f"Failed to connect to database at {db_path}: {str(e)}"
+            f"Failed to connect to database at {_DB_PATH}: {str(e)}"
         )
 
 
-def execute_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+def release_connection(conn: sqlite3.Connection) -> None:
+    """
+    Return a connection to the pool so it can be reused.
+    
+    If the pool is already full, the connection is closed instead.
+    Any transaction left open by the borrower is rolled back first, so the
+    next user always starts with a clean connection.
+    
+    Args:
+        conn: A connection previously obtained from get_connection()
+        
+    Example:
+        >>> conn = get_connection()
+        >>> try:
+        ...     rows = conn.execute("SELECT * FROM books").fetchall()
+        ... finally:
+        ...     release_connection(conn)
+    """
+    # Read-only connections go back to the readers' pool
+    pool = _READERS if getattr(conn, "readonly", False) else _POOL
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+        pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+    except sqlite3.ProgrammingError:
+        # The connection was already closed by the caller - nothing to reuse
+        pass
+
+
+def close_pool() -> None:
+    """
+    Close every idle connection held by the pool.
+    
+    Useful at program shutdown, or in tests that need to delete or
+    recreate the database file.
+    """
+    for pool in (_POOL, _READERS):
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# Close pooled connections when the program exits. Closing the last
+# connection lets SQLite checkpoint the WAL file back into the database.
+atexit.register(close_pool)
+
+
+def _borrow(readonly: bool = False) -> sqlite3.Connection:
+    """Return this thread's active connection, or one from the right pool."""
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
+        return conn
+    return _get_reader() if readonly else get_connection()
+
+
+def _write_block(conn: sqlite3.Connection):
+    """
+    The "with" block the write helpers commit through.
+    
+    Normally this is the connection itself ("with conn:" commits or rolls
+    back). Inside transaction() the helpers must not commit on their own -
+    transaction() commits everything once at the end - so they get a block
+    that does nothing.
+    """
+    if getattr(_tls, "in_transaction", False):
+        return contextlib.nullcontext(conn)
+    return conn
+
+
+def _give_back(conn: sqlite3.Connection) -> None:
+    """Release `conn` unless an enclosing DatabaseConnection block owns it."""
+    if conn is not getattr(_tls, "conn", None):
+        release_connection(conn)
+
+
+def execute_query(
+    query: str,
+    params: tuple = (),
+    as_dict: bool = True,
+    *,
+    # Bound once at definition time: local names are faster than globals
+    _borrow=_borrow,
+    _give_back=_give_back,
+    _dict=dict
+) -> Union[List[Dict[str, Any]], List[sqlite3.Row]]:
     """
     Execute a SELECT query and return the results.
     
     This function is for READ operations only (SELECT statements).
     It handles:
-    1. Opening a database connection
+    1. Borrowing a database connection from the pool
     2. Executing the query with parameters
     3. Fetching all results
     4. Converting results to a list of dictionaries
-    5. Closing the connection (even if an error occurs)
+    5. Returning the connection to the pool (even if an error occurs)
     
     Args:
         query: SQL SELECT statement with ? placeholders for parameters
         params: Tuple of values to substitute for ? placeholders
+        as_dict: If True (default), convert each row to a plain dictionary.
+                 If False, return the sqlite3.Row objects as they are.
         
     Returns:
         List of dictionaries, where each dictionary represents one row
         Keys are column names, values are the data from that column
+        (or a list of sqlite3.Row objects when as_dict=False)
         Returns empty list if no results found
         
     Raises:
@@ -151,6 +483,10 @@ def execute_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         >>> # Access results
         >>> for book in books:
         ...     print(f"{book['title']} by {book['author']}")
+        >>> 
+        >>> # Skip the dictionary conversion when you only read the rows
+        >>> rows = execute_query("SELECT id, title FROM books", as_dict=False)
+        >>> titles = [row['title'] for row in rows]
     
     Learning Notes:
     - ALWAYS use parameterized queries (with ?) instead of string formatting
@@ -158,17 +494,23 @@ def execute_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
     - GOOD: execute_query("SELECT * FROM books WHERE author = ?", (author,))
     - The ? placeholder is automatically escaped by SQLite
     - Parameters must be a tuple, even for single values: (value,) not (value)
+    - sqlite3.Row already supports row['column'], so as_dict=False saves
+      building one extra dictionary per row on large result sets
+    - The keyword arguments starting with _ are a speed trick, not options:
+      default values are stored with the function, so reading them is a fast
+      local lookup instead of a search through the module's globals
     """
-    # We'll use a connection variable that we can reference in finally block
-    conn = None
+    # Get a database connection
+    # Reads use a read-only connection, so they never wait for writers
+    # Inside a "with DatabaseConnection()" block this is the block's own connection
+    conn = _borrow(readonly=True)
     
     try:
-        # Get a database connection
-        conn = get_connection()
-        
-        # Create a cursor - this is what actually executes SQL statements
+        # Get a cursor - this is what actually executes SQL statements
         # Think of it like a pointer that moves through the database
-        cursor = conn.cursor()
+        # The connection hands back the same cursor for the same SQL text,
+        # so SQLite can skip parsing and planning a query it has seen before
+        cursor = conn.cached_cursor(query)
         
         # Execute the query with parameters
         # SQLite will safely substitute the ? placeholders with values from params
@@ -178,12 +520,13 @@ def execute_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         # fetchall() returns a list of Row objects
         rows = cursor.fetchall()
         
-        # Convert Row objects to dictionaries for easier use
-        # Row objects can be accessed like dictionaries: row['column_name']
-        # But converting to dict makes them more flexible
-        results = [dict(row) for row in rows]
+        if not as_dict:
+            # Row objects can already be accessed like dictionaries: row['column_name']
+            return rows
         
-        return results
+        # Convert Row objects to dictionaries for easier use
+        # Converting to dict makes them more flexible (.get(), JSON, editing)
+        return [_dict(row) for row in rows]
         
     except sqlite3.Error as e:
         # Something went wrong with the query
@@ -195,25 +538,284 @@ def execute_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         )
         
     finally:
-        # ALWAYS close the connection, even if an error occurred
+        # ALWAYS give the connection back, even if an error occurred
         # This is crucial for preventing resource leaks
         # The finally block runs no matter what (success, error, or return)
-        if conn:
-            conn.close()
+        _give_back(conn)
 
 
-def execute_update(query: str, params: tuple = ()) -> int:
+def execute_query_rows(query: str, params: tuple, row_cls: Any) -> List[Any]:
+    """
+    Execute a SELECT query and return each row as a `row_cls` object.
+    
+    Meant for namedtuple classes: row_cls._make(values) is called with the
+    row's values in SELECT order. Plain tuples are smaller and faster to
+    create than dictionaries, which adds up on large result sets.
+    
+    Args:
+        query: SQL SELECT statement with ? placeholders for parameters.
+               List the columns explicitly, in the same order as the
+               fields of row_cls (don't use SELECT *)
+        params: Tuple of values to substitute for ? placeholders
+        row_cls: A namedtuple class (anything with a _make() classmethod)
+        
+    Returns:
+        List of row_cls objects, empty list if no results found
+        
+    Raises:
+        QueryExecutionError: If the query fails to execute
+        
+    Example:
+        >>> from collections import namedtuple
+        >>> BookRow = namedtuple('BookRow', 'id title author')
+        >>> books = execute_query_rows(
+        ...     "SELECT id, title, author FROM books", (), BookRow
+        ... )
+        >>> print(books[0].title)
+    
+    Learning Notes:
+    - Rows are matched to fields by POSITION, not by name - if the SELECT
+      and the namedtuple disagree on column order, the values end up in the
+      wrong fields without any error
+    - Use execute_query() when you need dictionaries (e.g. to send as JSON)
+    """
+    conn = _borrow(readonly=True)
+    cursor = None
+    
+    try:
+        # A fresh cursor with no row factory returns plain tuples.
+        # (Changing conn.row_factory would affect everybody else using
+        # this connection, so we only change it for this one cursor.)
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        
+        make = row_cls._make
+        return [make(row) for row in cursor.fetchall()]
+        
+    except sqlite3.Error as e:
+        raise QueryExecutionError(
+            f"Failed to execute query: {str(e)}\n"
+            f"Query: {query}\n"
+            f"Hint: Check your SQL syntax and table/column names"
+        )
+        
+    finally:
+        if cursor is not None:
+            cursor.close()
+        _give_back(conn)
+
+
+def iter_query(
+    query: str,
+    params: tuple = (),
+    chunk: int = 1000
+) -> Iterator[sqlite3.Row]:
+    """
+    Execute a SELECT query and yield its rows a chunk at a time.
+    
+    execute_query() loads the whole result into one list. For very large
+    results (reports, exports) that list can use a lot of memory. This
+    generator fetches `chunk` rows at a time instead, so memory use stays
+    the same no matter how many rows the query returns.
+    
+    Args:
+        query: SQL SELECT statement with ? placeholders for parameters
+        params: Tuple of values to substitute for ? placeholders
+        chunk: How many rows to fetch from SQLite at once
+        
+    Yields:
+        sqlite3.Row: One row at a time (use row['column'] to read values)
+        
+    Raises:
+        QueryExecutionError: If the query fails to execute
+        
+    Example:
+        >>> for row in iter_query("SELECT id, title FROM books ORDER BY id"):
+        ...     print(f"{row['id']}: {row['title']}")
+    
+    Learning Notes:
+    - A function with "yield" is a generator: it runs a little each time
+      the for loop asks for the next item
+    - The connection is held until the loop finishes (or is abandoned),
+      so don't keep a half-finished loop around
+    - For small results, execute_query() is simpler and a bit faster
+    """
+    conn = _borrow(readonly=True)
+    cursor = None
+    
+    try:
+        cursor = conn.execute(query, params)
+        # arraysize is how many rows fetchmany() returns by default
+        cursor.arraysize = chunk
+        
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+            
+    except sqlite3.Error as e:
+        raise QueryExecutionError(
+            f"Failed to execute query: {str(e)}\n"
+            f"Query: {query}\n"
+            f"Hint: Check your SQL syntax and table/column names"
+        )
+        
+    finally:
+        # Closing the cursor ends the statement even if the loop stopped early
+        if cursor is not None:
+            cursor.close()
+        _give_back(conn)
+
+
+def _json_object_sql(conn: sqlite3.Connection, query: str, params: tuple) -> str:
+    """Build json_object('col', "col", ...) covering every column of `query`."""
+    # LIMIT 0 returns no rows, but the cursor still describes the columns
+    columns = [
+        col[0] for col in
+        conn.execute(f"SELECT * FROM ({query}) LIMIT 0", params).description
+    ]
+    
+    # Keys are SQL strings ('...'), values are column names ("...")
+    pairs = ", ".join(
+        "'{}', \"{}\"".format(name.replace("'", "''"), name.replace('"', '""'))
+        for name in columns
+    )
+    return f"json_object({pairs})"
+
+
+def iter_query_json(
+    query: str,
+    params: tuple = (),
+    chunk: int = 1000
+) -> Iterator[str]:
+    """
+    Like iter_query(), but yield each row as a JSON object string.
+    
+    SQLite writes the JSON for every row itself (json_object()), so no
+    Python dictionary is created per row. Meant for streaming large lists
+    straight into an API response.
+    
+    Args:
+        query: SQL SELECT statement with ? placeholders for parameters
+        params: Tuple of values to substitute for ? placeholders
+        chunk: How many rows to fetch from SQLite at once
+        
+    Yields:
+        str: One row as JSON, e.g. '{"id":1,"title":"1984"}'
+        
+    Raises:
+        QueryExecutionError: If the query fails to execute
+    
+    Learning Notes:
+    - Same rules as execute_query_json(): distinct column names, no BLOBs
+    """
+    conn = _borrow(readonly=True)
+    cursor = None
+    
+    try:
+        cursor = conn.execute(
+            f"SELECT {_json_object_sql(conn, query, params)} FROM ({query})",
+            params
+        )
+        cursor.arraysize = chunk
+        
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield row[0]
+            
+    except sqlite3.Error as e:
+        raise QueryExecutionError(
+            f"Failed to execute query: {str(e)}\n"
+            f"Query: {query}\n"
+            f"Hint: Check your SQL syntax and table/column names"
+        )
+        
+    finally:
+        if cursor is not None:
+            cursor.close()
+        _give_back(conn)
+
+
+def execute_query_json(query: str, params: tuple = ()) -> str:
+    """
+    Execute a SELECT query and return the results as a JSON array string.
+    
+    Instead of building Python dictionaries and then calling json.dumps(),
+    SQLite builds the JSON text itself with its json_object() and
+    json_group_array() functions. The result is ready to send as an API
+    response body.
+    
+    Args:
+        query: SQL SELECT statement with ? placeholders for parameters
+        params: Tuple of values to substitute for ? placeholders
+        
+    Returns:
+        str: A JSON array with one object per row, e.g.
+             '[{"id":1,"title":"1984"},{"id":2,"title":"Dune"}]'
+             Returns '[]' if no results found
+        
+    Raises:
+        QueryExecutionError: If the query fails to execute
+        
+    Example:
+        >>> body = execute_query_json(
+        ...     "SELECT id, title FROM books WHERE available = ?",
+        ...     (1,)
+        ... )
+        >>> # In Flask: return Response(body, mimetype="application/json")
+    
+    Learning Notes:
+    - The query runs twice: once with LIMIT 0 to learn the column names
+      (cursor.description), then wrapped in the JSON aggregate
+    - Every column needs a distinct name - use aliases (AS ...) for expressions
+    - BLOB columns cannot be converted to JSON
+    """
+    conn = _borrow(readonly=True)
+    
+    try:
+        row = conn.execute(
+            f"SELECT json_group_array({_json_object_sql(conn, query, params)}) FROM ({query})",
+            params
+        ).fetchone()
+        return row[0]
+        
+    except sqlite3.Error as e:
+        raise QueryExecutionError(
+            f"Failed to execute query: {str(e)}\n"
+            f"Query: {query}\n"
+            f"Hint: Check your SQL syntax and table/column names"
+        )
+        
+    finally:
+        _give_back(conn)
+
+
+def execute_update(
+    query: str,
+    params: tuple = (),
+    *,
+    # Bound once at definition time: local names are faster than globals
+    _borrow=_borrow,
+    _give_back=_give_back,
+    _is_ddl=_is_ddl,
+    _lock=_WRITE_LOCK
+) -> int:
     """
     Execute an INSERT, UPDATE, or DELETE query.
     
     This function is for WRITE operations (INSERT, UPDATE, DELETE).
     It handles:
-    1. Opening a database connection
+    1. Borrowing a database connection from the pool
     2. Executing the query with parameters
     3. Committing the transaction (saving changes)
     4. Returning the number of affected rows
     5. Rolling back on error (undoing changes)
-    6. Closing the connection
+    6. Returning the connection to the pool
     
     Args:
         query: SQL INSERT, UPDATE, or DELETE statement with ? placeholders
@@ -251,78 +853,51 @@ def execute_update(query: str, params: tuple = ()) -> int:
         >>> print(f"Deleted {affected} row(s)")
     
     Learning Notes:
-    - Changes are not permanent until we call commit()
-    - If an error occurs, we call rollback() to undo changes
+    - Changes are not permanent until they are committed
+    - "with conn:" commits on success and rolls back if an error occurs
     - This is called "transaction management"
     - Transactions ensure data consistency (all changes succeed or all fail)
     - rowcount tells us how many rows were affected
     - For INSERT, you can get the new row's ID with cursor.lastrowid
     """
-    conn = None
+    # Only one writer at a time
+    with _lock:
+        conn = _borrow()
     
-    try:
-        # Get a database connection
-        conn = get_connection()
+        try:
+            # "with conn:" is a transaction block:
+            # - if the block finishes normally, the changes are committed (saved)
+            # - if an exception escapes, the changes are rolled back (undone)
+            # Without a commit, changes are only in memory and will be lost!
+            with _write_block(conn):
+                cursor = conn.execute(query, params)
         
-        # Create a cursor to execute the query
-        cursor = conn.cursor()
+            # Statements prepared before a schema change may be out of date
+            if _is_ddl(query):
+                _schema_changed()
         
-        # Execute the query with parameters
-        cursor.execute(query, params)
+            # Return the number of affected rows
+            # This is useful for checking if the operation actually did something
+            # For example, UPDATE might affect 0 rows if no records matched the WHERE clause
+            return cursor.rowcount
         
-        # Commit the transaction
-        # This makes the changes permanent in the database
-        # Without commit(), changes are only in memory and will be lost!
-        conn.commit()
-        
-        # Return the number of affected rows
-        # This is useful for checking if the operation actually did something
-        # For example, UPDATE might affect 0 rows if no records matched the WHERE clause
-        return cursor.rowcount
-        
-    except sqlite3.IntegrityError as e:
-        # Integrity errors are special - they mean a constraint was violated
-        # Examples: unique constraint, foreign key constraint, not null constraint
-        if conn:
-            conn.rollback()  # Undo any changes
-        
-        # Provide a helpful error message
-        error_msg = str(e).lower()
-        if "unique" in error_msg:
-            raise QueryExecutionError(
-                f"Duplicate entry: A record with this unique value already exists.\n"
-                f"Details: {str(e)}"
-            )
-        elif "foreign key" in error_msg:
-            raise QueryExecutionError(
-                f"Invalid reference: The referenced record does not exist.\n"
-                f"Details: {str(e)}"
-            )
-        elif "not null" in error_msg:
-            raise QueryExecutionError(
-                f"Missing required field: A required value was not provided.\n"
-                f"Details: {str(e)}"
-            )
-        else:
+        except sqlite3.IntegrityError as e:
+            # Integrity errors are special - they mean a constraint was violated
+            # Examples: unique constraint, foreign key constraint, not null constraint
+            # The "with conn:" block has already rolled the changes back
+            _raise_integrity(e)
+            
+        except sqlite3.Error as e:
+            # Other database errors (already rolled back as well)
             raise QueryExecutionError(
-                f"Database constraint violation: {str(e)}"
+                f"Failed to execute update: {str(e)}\n"
+                f"Query: {query}\n"
+                f"Hint: Check your SQL syntax and ensure the table exists"
             )
-            
-    except sqlite3.Error as e:
-        # Other database errors
-        if conn:
-            conn.rollback()  # Undo any changes
-            
-        raise QueryExecutionError(
-            f"Failed to execute update: {str(e)}\n"
-            f"Query: {query}\n"
-            f"Hint: Check your SQL syntax and ensure the table exists"
-        )
         
-    finally:
-        # ALWAYS close the connection
-        if conn:
-            conn.close()
+        finally:
+            # ALWAYS give the connection back to the pool
+            _give_back(conn)
 
 
 # Additional helper function for getting the last inserted ID
@@ -362,57 +937,200 @@ def execute_insert(query: str, params: tuple = ()) -> int:
     - This only works for tables with INTEGER PRIMARY KEY AUTOINCREMENT
     - Very useful for creating related records (foreign key relationships)
     - In other databases (MySQL, PostgreSQL), the syntax might be different
+    - Reading lastrowid does not send another query: sqlite3 asks the SQLite
+      library in this same process, so it costs about as much as reading
+      an attribute. "INSERT ... RETURNING id" (SQLite 3.35+) saves a real
+      round trip on client/server databases such as PostgreSQL, but here it
+      would gain nothing (and executemany() throws the returned rows away)
     """
-    conn = None
+    # Only one writer at a time
+    with _WRITE_LOCK:
+        conn = _borrow()
     
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        try:
+            # Commits on success, rolls back on error
+            with _write_block(conn):
+                cursor = conn.execute(query, params)
         
-        # Execute the INSERT query
-        cursor.execute(query, params)
+            # Get the ID of the newly inserted row
+            # lastrowid is set by SQLite after an INSERT
+            return cursor.lastrowid
+        
+        except sqlite3.IntegrityError as e:
+            _raise_integrity(e)
+            
+        except sqlite3.Error as e:
+            raise QueryExecutionError(
+                f"Failed to execute insert: {str(e)}\n"
+                f"Query: {query}"
+            )
         
-        # Get the ID of the newly inserted row
-        # lastrowid is set by SQLite after an INSERT
-        new_id = cursor.lastrowid
+        finally:
+            _give_back(conn)
+
+
+# Bulk helpers: run many statements with a single commit
+def execute_many(query: str, seq_of_params: Iterable[tuple]) -> int:
+    """
+    Execute the same INSERT, UPDATE, or DELETE for many sets of parameters.
+    
+    Instead of calling execute_update() once per row (one commit each),
+    this runs the whole batch in ONE transaction:
+    1. The SQL is parsed and prepared once
+    2. Each tuple of parameters is bound and executed
+    3. Everything is committed together (or rolled back together)
+    
+    Args:
+        query: SQL statement with ? placeholders
+        seq_of_params: Any iterable of parameter tuples (a list, a generator, ...)
         
-        # Commit the transaction
-        conn.commit()
+    Returns:
+        int: Total number of rows affected by the batch
         
-        return new_id
+    Raises:
+        QueryExecutionError: If any statement in the batch fails
+                             (none of the rows are saved in that case)
         
-    except sqlite3.IntegrityError as e:
-        if conn:
-            conn.rollback()
+    Example:
+        >>> books = [
+        ...     ("Fluent Python", "Luciano Ramalho", "978-1492056355", 2022),
+        ...     ("Effective Python", "Brett Slatkin", "978-0134853987", 2019),
+        ... ]
+        >>> inserted = execute_many(
+        ...     "INSERT INTO books (title, author, isbn, published_year) VALUES (?, ?, ?, ?)",
+        ...     books
+        ... )
+        >>> print(f"Inserted {inserted} book(s)")
+    
+    Learning Notes:
+    - Every commit forces SQLite to write to disk, which is slow
+    - One commit for 1000 rows is MUCH faster than 1000 commits
+    - Transactions are "all or nothing": one bad row undoes the whole batch
+    """
+    # Only one writer at a time
+    with _WRITE_LOCK:
+        conn = _borrow()
+    
+        try:
+            # sqlite3 opens a transaction before the first INSERT/UPDATE/DELETE,
+            # so the whole batch below belongs to a single transaction,
+            # committed once when the "with" block ends
+            with _write_block(conn):
+                cursor = conn.executemany(query, seq_of_params)
         
-        error_msg = str(e).lower()
-        if "unique" in error_msg:
-            raise QueryExecutionError(
-                f"Duplicate entry: A record with this unique value already exists.\n"
-                f"Details: {str(e)}"
-            )
-        elif "foreign key" in error_msg:
+            return cursor.rowcount
+        
+        except sqlite3.IntegrityError as e:
+            _raise_integrity(e)
+            
+        except sqlite3.Error as e:
             raise QueryExecutionError(
-                f"Invalid reference: The referenced record does not exist.\n"
-                f"Details: {str(e)}"
+                f"Failed to execute batch: {str(e)}\n"
+                f"Query: {query}"
             )
-        else:
+        
+        finally:
+            _give_back(conn)
+
+
+def execute_insert_many(query: str, seq_of_params: Iterable[tuple]) -> List[int]:
+    """
+    Insert many rows in one transaction and return their new IDs.
+    
+    Works like execute_many(), but for INSERTs whose caller needs the IDs.
+    cursor.lastrowid isn't set by executemany(), so we ask SQLite for the
+    last inserted ID and count back: while we hold the write lock nobody
+    else can insert, so the batch received consecutive IDs.
+    
+    Args:
+        query: A single-row INSERT statement with ? placeholders
+               (the table must have an INTEGER PRIMARY KEY that the
+               INSERT doesn't set itself)
+        seq_of_params: Any iterable of parameter tuples
+        
+    Returns:
+        List[int]: The IDs of the new rows, in insertion order
+        
+    Raises:
+        QueryExecutionError: If any row fails (none of the rows are saved)
+        
+    Example:
+        >>> ids = execute_insert_many(
+        ...     "INSERT INTO members (name, email) VALUES (?, ?)",
+        ...     [("Ann", "ann@example.com"), ("Bob", "bob@example.com")]
+        ... )
+        >>> print(ids)  # e.g. [7, 8]
+    """
+    # Only one writer at a time - this is also what keeps the IDs consecutive
+    with _WRITE_LOCK:
+        conn = _borrow()
+    
+        try:
+            with _write_block(conn):
+                cursor = conn.executemany(query, seq_of_params)
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            
+            count = cursor.rowcount
+            return list(range(last_id - count + 1, last_id + 1)) if count > 0 else []
+        
+        except sqlite3.IntegrityError as e:
+            _raise_integrity(e)
+            
+        except sqlite3.Error as e:
             raise QueryExecutionError(
-                f"Database constraint violation: {str(e)}"
+                f"Failed to execute batch insert: {str(e)}\n"
+                f"Query: {query}"
             )
-            
-    except sqlite3.Error as e:
-        if conn:
+        
+        finally:
+            _give_back(conn)
+
+
+def execute_script(sql_script: str) -> None:
+    """
+    Execute a script containing several SQL statements separated by semicolons.
+    
+    This is meant for migrations and schema changes (CREATE TABLE, CREATE INDEX,
+    ...), where you would otherwise loop over execute_update() one statement
+    at a time.
+    
+    Args:
+        sql_script: One or more SQL statements separated by semicolons
+        
+    Raises:
+        QueryExecutionError: If any statement in the script fails
+        
+    Example:
+        >>> execute_script(
+        ...     "CREATE INDEX IF NOT EXISTS idx_books_author ON books(author);"
+        ...     "CREATE INDEX IF NOT EXISTS idx_loans_member ON loans(member_id);"
+        ... )
+    
+    Learning Notes:
+    - executescript() does NOT accept ? parameters - never put user input in it!
+    - It commits any pending transaction before running the script
+    - Scripts usually change the schema, so cached statements are discarded
+    """
+    # Only one writer at a time
+    with _WRITE_LOCK:
+        conn = _borrow()
+    
+        try:
+            conn.executescript(sql_script)
+        
+            # The schema may have changed - previously prepared statements are stale
+            _schema_changed()
+        
+        except sqlite3.Error as e:
             conn.rollback()
             
-        raise QueryExecutionError(
-            f"Failed to execute insert: {str(e)}\n"
-            f"Query: {query}"
-        )
+            raise QueryExecutionError(
+                f"Failed to execute script: {str(e)}\n"
+                f"Hint: Check each statement in the script for SQL errors"
+            )
         
-    finally:
-        if conn:
-            conn.close()
+        finally:
+            _give_back(conn)
 
 
 # Context Manager for Advanced Students
@@ -425,10 +1143,9 @@ class DatabaseConnection:
     
     Example:
         >>> with DatabaseConnection() as conn:
-        ...     cursor = conn.cursor()
-        ...     cursor.execute("SELECT * FROM books")
+        ...     cursor = conn.execute("SELECT * FROM books")
         ...     results = cursor.fetchall()
-        >>> # Connection is automatically closed here!
+        >>> # Connection is automatically returned to the pool here!
     
     Learning Notes:
     - Context managers use __enter__ and __exit__ methods
@@ -436,6 +1153,11 @@ class DatabaseConnection:
     - This is the same pattern used by open() for files
     - More advanced than the execute_query/execute_update functions
     - Useful when you need more control over the connection
+    - Blocks can be nested: an inner block (or an execute_* call made inside
+      the block) reuses the same connection on the same thread
+    - execute_update()/execute_insert() still commit as soon as they run,
+      even inside a block, together with anything the block left pending
+      (use transaction() to commit several writes together)
     """
     
     def __init__(self):
@@ -445,15 +1167,19 @@ class DatabaseConnection:
     def __enter__(self) -> sqlite3.Connection:
         """
         Called when entering the 'with' block.
-        Opens and returns the database connection.
+        Borrows a connection, or reuses the one of an enclosing block.
         """
-        self.conn = get_connection()
+        if getattr(_tls, "conn", None) is None:
+            _tls.conn = get_connection()
+            _tls.depth = 0
+        _tls.depth += 1
+        self.conn = _tls.conn
         return self.conn
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Called when exiting the 'with' block.
-        Closes the connection and handles any errors.
+        The outermost block hands the connection back and handles any errors.
         
         Args:
             exc_type: Type of exception (if one occurred)
@@ -461,24 +1187,93 @@ class DatabaseConnection:
             exc_tb: Exception traceback (if one occurred)
         """
         if self.conn:
-            if exc_type is not None:
-                # An error occurred, rollback any uncommitted changes
-                self.conn.rollback()
-            self.conn.close()
+            _tls.depth -= 1
+            if _tls.depth == 0:
+                _tls.conn = None
+                if exc_type is not None:
+                    # An error occurred, rollback any uncommitted changes
+                    self.conn.rollback()
+                # Hand the connection back to the pool instead of closing it
+                release_connection(self.conn)
+            self.conn = None
         
         # Return False to propagate any exception
         # Return True would suppress the exception
         return False
 
 
+@contextlib.contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Run several writes as ONE transaction, with one commit at the end.
+    
+    On their own, execute_update() and execute_insert() commit straight
+    away. Inside this block they don't: everything is committed together
+    when the block ends, or rolled back together if an exception escapes.
+    
+    Yields:
+        sqlite3.Connection: The connection the transaction runs on
+        
+    Raises:
+        QueryExecutionError: If the transaction cannot be started or committed
+        
+    Example:
+        >>> with transaction():
+        ...     book_id = execute_insert(
+        ...         "INSERT INTO books (title, author, isbn) VALUES (?, ?, ?)",
+        ...         ("Fluent Python", "Luciano Ramalho", "978-1492056355")
+        ...     )
+        ...     execute_update("UPDATE members SET active = 1 WHERE id = ?", (1,))
+        >>> # Both changes are saved here - or neither, if something failed
+    
+    Learning Notes:
+    - Every commit waits for the disk; a burst of writes in one
+      transaction pays that cost once instead of once per statement
+    - "BEGIN IMMEDIATE" takes SQLite's write lock up front, so the
+      transaction can't fail halfway through because another process
+      started writing first
+    - Queries inside the block see the block's own uncommitted changes
+    - Blocks can be nested; only the outermost one commits
+    - Don't call execute_script() inside: executescript() commits first
+    """
+    with _WRITE_LOCK, DatabaseConnection() as conn:
+        if getattr(_tls, "in_transaction", False):
+            # Already inside transaction() - the outer block commits
+            yield conn
+            return
+        
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            raise QueryExecutionError(f"Failed to start transaction: {str(e)}")
+        
+        _tls.in_transaction = True
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            _tls.in_transaction = False
+        
+        try:
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise QueryExecutionError(f"Failed to commit transaction: {str(e)}")
+
+
 # Module-level documentation for students
 """
 SUMMARY OF KEY CONCEPTS:
 
 1. Database Connections:
-   - Must be opened before use and closed after
-   - Use get_connection() to create a connection
-   - Always close connections to prevent resource leaks
+   - Must be obtained before use and given back after
+   - Use get_connection() to borrow a connection from the pool
+   - Use release_connection() to return it so it can be reused
+   - Always release connections to prevent resource leaks
+   - SELECTs use separate read-only connections, so reads don't wait for writes
 
 2. Parameterized Queries:
    - Use ? placeholders instead of string formatting
@@ -487,22 +1282,30 @@ SUMMARY OF KEY CONCEPTS:
 
 3. Query vs Update:
    - execute_query(): For SELECT (reading data)
+   - execute_query_json(): For SELECT when the result goes straight out as JSON
+   - iter_query(): For SELECT with very many rows, a chunk at a time
+   - iter_query_json(): Like iter_query(), with each row already as JSON text
    - execute_update(): For INSERT, UPDATE, DELETE (modifying data)
    - execute_insert(): For INSERT when you need the new record's ID
 
-4. Error Handling:
+4. Bulk Operations:
+   - execute_many(): Same statement for many rows, one commit
+   - execute_insert_many(): Like execute_many(), and returns the new IDs
+   - execute_script(): Several statements at once (migrations, schema changes)
+
+5. Error Handling:
    - DatabaseConnectionError: Can't connect to database
    - QueryExecutionError: Query failed to execute
    - Always includes helpful error messages
 
-5. Transactions:
+6. Transactions:
    - Changes aren't permanent until commit() is called
    - Use rollback() to undo changes if something goes wrong
    - execute_update() handles this automatically
 
-6. Best Practices:
+7. Best Practices:
    - Always use parameterized queries
-   - Always close connections (use try/finally)
+   - Always release connections (use try/finally)
    - Check rowcount to see if operation affected any rows
    - Use meaningful error messages
 
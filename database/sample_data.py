@@ -15,6 +15,7 @@ Students can run this script to:
 
 Usage:
     python database/sample_data.py
+    SEED_VERBOSE=1 python database/sample_data.py   # also list every created row
 
 The script will:
 - Clear existing data (if any)
@@ -23,24 +24,111 @@ The script will:
 - Show examples of active loans and borrowing history
 
 Learning Objectives:
-- See how to use the model classes to create data
+- See how to load many rows efficiently (one connection, batched inserts)
 - Understand relationships between entities
 - Learn about realistic test data for development
 - Practice querying populated tables
 """
 
+import os
+import csv
 import sys
+import sqlite3
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timedelta
 
 # Add parent directory to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models.library import Book, Member, Loan
 from database.connection import get_connection
 
+# Sample books are kept as data, not code
+SAMPLE_BOOKS_CSV = Path(__file__).parent / "sample_books.csv"
 
-def clear_existing_data():
+# Set SEED_VERBOSE=1 to list every created row, not just the totals
+VERBOSE = os.environ.get("SEED_VERBOSE") == "1"
+
+
+# Loan status by (is_returned, is_past_due_date): (label, kind)
+# A returned loan is "completed" whether or not its due date has passed
+LOAN_STATUS = {
+    (True, False): ("✓ Returned", "completed"),
+    (True, True): ("✓ Returned", "completed"),
+    (False, True): ("⚠️  OVERDUE", "overdue"),
+    (False, False): ("📖 Active", "active"),
+}
+
+
+def write_lines(lines):
+    """
+    Print a list of lines with a single write instead of one print() each.
+    
+    Every print() call takes the stdout lock and (when piped) may hit the
+    disk on its own; joining the lines first turns N writes into one.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def open_seed_connection():
+    """
+    Open the one connection shared by every step of this script.
+    
+    Seeding is a one-shot load of data we control, so we can trade some
+    safety for speed on this connection only:
+    - foreign_keys = OFF: no foreign key lookups for every inserted loan
+    - synchronous = OFF: don't wait for the disk after each commit
+    - temp_store = MEMORY: keep temporary data out of temp files
+    
+    The connection is closed (not returned to the pool) at the end, so
+    these settings never leak into the rest of the application.
+    
+    Returns:
+        sqlite3.Connection: A connection tuned for bulk loading
+    
+    Learning Note:
+    - journal_mode is deliberately left alone: it is stored in the database
+      file, and the rest of the application relies on WAL mode
+    """
+    conn = get_connection()
+    conn.executescript("""
+        PRAGMA foreign_keys = OFF;
+        PRAGMA synchronous = OFF;
+        PRAGMA temp_store = MEMORY;
+    """)
+    return conn
+
+
+def check_foreign_keys(conn):
+    """
+    Turn foreign key enforcement back on and check the seeded data.
+    
+    open_seed_connection() switched foreign keys OFF so that every loan
+    INSERT skips the lookup of its book and member. Instead, all references
+    are checked here in one pass, once everything is committed.
+    
+    Args:
+        conn: The connection from open_seed_connection()
+    
+    Returns:
+        int: Number of rows that point to a missing book or member
+    
+    Learning Note:
+    - PRAGMA foreign_key_check lists every row whose foreign key points
+      to a record that doesn't exist (it returns nothing if all is well)
+    """
+    conn.execute("PRAGMA foreign_keys = ON")
+    violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    
+    if violations:
+        print(f"\n   ⚠️  {len(violations)} row(s) reference missing records:")
+        write_lines([f"      - {row[0]} row {row[1]} -> {row[2]}" for row in violations])
+    
+    return len(violations)
+
+
+def clear_existing_data(conn):
     """
     Clear all existing data from the database.
     
@@ -51,99 +139,109 @@ def clear_existing_data():
     Note: We delete in reverse order of dependencies:
     1. First loans (depends on books and members)
     2. Then members and books (no dependencies)
+    
+    Args:
+        conn: The connection from open_seed_connection()
     """
     print("🗑️  Clearing existing data...")
     
-    conn = get_connection()
-    cursor = conn.cursor()
-    
     try:
         # Delete in order: loans first (has foreign keys), then members and books
-        cursor.execute("DELETE FROM loans")
-        cursor.execute("DELETE FROM members")
-        cursor.execute("DELETE FROM books")
-        conn.commit()
+        # executescript() runs all three DELETEs in a single call and transaction
+        conn.executescript("""
+            BEGIN;
+            DELETE FROM loans;
+            DELETE FROM members;
+            DELETE FROM books;
+            COMMIT;
+        """)
         print("   ✓ Existing data cleared")
     except Exception as e:
         print(f"   ⚠️  Warning: Could not clear data: {e}")
         conn.rollback()
-    finally:
-        conn.close()
 
 
-def create_sample_books():
+def create_sample_books(conn):
     """
     Create a diverse collection of sample books.
     
     This demonstrates:
-    - Creating multiple records efficiently
+    - Creating multiple records efficiently (one transaction for all of them)
     - Using realistic data (real book titles and ISBNs)
     - Covering different genres and publication years
     - Handling optional fields (some books have publication year, some don't)
     
+    Args:
+        conn: The connection from open_seed_connection()
+    
     Returns:
         dict: Mapping of book names to their IDs for later reference
     """
     print("\n📚 Creating sample books...")
     
-    # Define sample books with realistic data
-    # Format: (title, author, isbn, published_year)
-    sample_books = [
-        # Programming & Technology
-        ("Python Crash Course", "Eric Matthes", "978-1593279288", 2019),
-        ("Clean Code", "Robert C. Martin", "978-0132350884", 2008),
-        ("The Pragmatic Programmer", "David Thomas", "978-0135957059", 2019),
-        ("Introduction to Algorithms", "Thomas H. Cormen", "978-0262033848", 2009),
-        
-        # Science & Mathematics
-        ("A Brief History of Time", "Stephen Hawking", "978-0553380163", 1988),
-        ("The Selfish Gene", "Richard Dawkins", "978-0198788607", 1976),
-        ("Cosmos", "Carl Sagan", "978-0345539434", 1980),
-        
-        # Fiction
-        ("1984", "George Orwell", "978-0451524935", 1949),
-        ("To Kill a Mockingbird", "Harper Lee", "978-0061120084", 1960),
-        ("The Great Gatsby", "F. Scott Fitzgerald", "978-0743273565", 1925),
-        ("Pride and Prejudice", "Jane Austen", "978-0141439518", 1813),
-        
-        # Non-Fiction
-        ("Sapiens", "Yuval Noah Harari", "978-0062316097", 2015),
-        ("Educated", "Tara Westover", "978-0399590504", 2018),
-        ("Thinking, Fast and Slow", "Daniel Kahneman", "978-0374533557", 2011),
-        
-        # Business & Self-Help
-        ("Atomic Habits", "James Clear", "978-0735211292", 2018),
-        ("The 7 Habits of Highly Effective People", "Stephen Covey", "978-1982137274", 1989),
-    ]
-    
+    # The sample books live in a CSV file next to this script
+    # Columns: title, author, isbn, published_year
+
     book_ids = {}
     
-    for title, author, isbn, year in sample_books:
-        try:
-            book_id = Book.create(
-                title=title,
-                author=author,
-                isbn=isbn,
-                published_year=year
+    # Book.create() commits after every INSERT, and every commit waits for
+    # the disk. Here all books share ONE connection and ONE transaction,
+    # so the disk is synced once at the end instead of once per book.
+    # The sample data is known to be valid, so we insert it directly.
+    created = []
+    
+    try:
+        # "with conn:" commits when the block ends
+        with conn, open(SAMPLE_BOOKS_CSV, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader)  # Skip the header row
+            
+            # executemany() prepares the INSERT once and runs it for every row.
+            # It accepts any iterable, so the CSV rows are streamed straight
+            # from the file without building a list first.
+            # CSV values are text: the INTEGER column converts the year, and
+            # NULLIF turns an empty year into NULL
+            conn.executemany(
+                "INSERT INTO books (title, author, isbn, published_year) "
+                "VALUES (?, ?, ?, NULLIF(?, ''))",
+                reader
             )
-            book_ids[title] = book_id
-            print(f"   ✓ Created: {title} by {author}")
-        except Exception as e:
-            print(f"   ✗ Failed to create '{title}': {e}")
+            
+            # Rebuild the books_fts search index from the books table, in case
+            # it was out of sync before (e.g. created after books already existed)
+            if conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books_fts'"
+            ).fetchone():
+                conn.execute("INSERT INTO books_fts (books_fts) VALUES ('rebuild')")
+        
+        # executemany() has no lastrowid per row, so look the IDs up afterwards
+        for row in conn.execute("SELECT id, title, author FROM books ORDER BY id"):
+            book_ids[row["title"]] = row["id"]
+            created.append(f"   ✓ Created: {row['title']} by {row['author']}")
+            
+    except (sqlite3.Error, OSError) as e:
+        # One bad row rolls back the whole batch
+        print(f"   ✗ Failed to create books: {e}")
+    
+    if VERBOSE:
+        write_lines(created)
     
     print(f"\n   📊 Total books created: {len(book_ids)}")
     return book_ids
 
 
-def create_sample_members():
+def create_sample_members(conn):
     """
     Create sample library members.
     
     This demonstrates:
-    - Creating member records with unique emails
+    - Creating member records with unique emails (in a single transaction)
     - Using realistic names and email formats
     - Building a diverse member base
     
+    Args:
+        conn: The connection from open_seed_connection()
+    
     Returns:
         dict: Mapping of member names to their IDs for later reference
     """
@@ -164,19 +262,32 @@ def create_sample_members():
     
     member_ids = {}
     
-    for name, email in sample_members:
-        try:
-            member_id = Member.create(name=name, email=email)
-            member_ids[name] = member_id
-            print(f"   ✓ Created member: {name} ({email})")
-        except Exception as e:
-            print(f"   ✗ Failed to create member '{name}': {e}")
+    # Same idea as create_sample_books(): one batch, one commit
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO members (name, email) VALUES (?, ?)",
+                sample_members
+            )
+        
+        for row in conn.execute("SELECT id, name FROM members"):
+            member_ids[row["name"]] = row["id"]
+            
+    except sqlite3.Error as e:
+        print(f"   ✗ Failed to create members: {e}")
+    
+    if VERBOSE:
+        write_lines([
+            f"   ✓ Created member: {name} ({email})"
+            for name, email in sample_members
+            if name in member_ids
+        ])
     
     print(f"\n   📊 Total members created: {len(member_ids)}")
     return member_ids
 
 
-def create_sample_loans(book_ids, member_ids):
+def create_sample_loans(conn, book_ids, member_ids):
     """
     Create sample loan records showing both active and completed loans.
     
@@ -191,6 +302,7 @@ def create_sample_loans(book_ids, member_ids):
     purposes, we want to show historical data with various dates.
     
     Args:
+        conn: The connection from open_seed_connection()
         book_ids: Dictionary mapping book titles to IDs
         member_ids: Dictionary mapping member names to IDs
     
@@ -224,81 +336,84 @@ def create_sample_loans(book_ids, member_ids):
         ("Cosmos", "Carol Williams", 20, 14, False),
     ]
     
-    active_count = 0
-    completed_count = 0
-    overdue_count = 0
+    # Counts loans per kind: "active", "overdue", "completed"
+    counts = Counter()
     
-    # Get database connection for direct inserts
-    conn = get_connection()
-    cursor = conn.cursor()
+    # First build the parameters for every loan in plain Python,
+    # then send them to the database in one batch
+    loan_rows = []          # (book_id, member_id, loan_date, due_date, return_date)
+    status_lines = []
+    
+    # The date doesn't change while the script runs, so ask for it once
+    today = datetime.now().date()
     
     for book_title, member_name, days_ago, days_due, is_returned in sample_loans:
-        try:
-            # Get the book and member IDs
-            book_id = book_ids.get(book_title)
-            member_id = member_ids.get(member_name)
-            
-            if not book_id or not member_id:
-                print(f"   ⚠️  Skipping loan: Book or member not found")
-                continue
-            
-            # Calculate dates
-            loan_date = datetime.now().date() - timedelta(days=days_ago)
-            due_date = loan_date + timedelta(days=days_due)
-            return_date = None
-            
-            if is_returned:
-                # Book was returned a few days after borrowing (before due date)
-                return_date = loan_date + timedelta(days=days_due - 2)
-            
-            # Insert loan directly into database
-            # We use direct SQL here to set historical dates
-            # In production code, you'd use Loan.create() for current loans
-            query = """
+        # Get the book and member IDs
+        book_id = book_ids.get(book_title)
+        member_id = member_ids.get(member_name)
+        
+        if not book_id or not member_id:
+            print(f"   ⚠️  Skipping loan: Book or member not found")
+            continue
+        
+        # Calculate dates
+        loan_date = today - timedelta(days=days_ago)
+        due_date = loan_date + timedelta(days=days_due)
+        return_date = None
+        
+        if is_returned:
+            # Book was returned a few days after borrowing (before due date)
+            return_date = loan_date + timedelta(days=days_due - 2)
+        
+        loan_rows.append((
+            book_id,
+            member_id,
+            loan_date.isoformat(),
+            due_date.isoformat(),
+            return_date.isoformat() if return_date else None
+        ))
+        
+        # Determine loan status with one table lookup
+        status, kind = LOAN_STATUS[(is_returned, today > due_date)]
+        counts[kind] += 1
+        
+        if VERBOSE:
+            status_lines.append(f"   {status}: '{book_title}' borrowed by {member_name}")
+    
+    # Insert loans directly into database
+    # We use direct SQL here to set historical dates
+    # In production code, you'd use Loan.create() for current loans
+    try:
+        # One transaction for all loans and availability updates
+        with conn:
+            conn.executemany(
+                """
                 INSERT INTO loans (book_id, member_id, loan_date, due_date, return_date)
                 VALUES (?, ?, ?, ?, ?)
-            """
-            cursor.execute(query, (
-                book_id,
-                member_id,
-                loan_date.isoformat(),
-                due_date.isoformat(),
-                return_date.isoformat() if return_date else None
-            ))
-            
-            # Update book availability if loan is active (not returned)
-            if not is_returned:
-                cursor.execute(
-                    "UPDATE books SET available = 0 WHERE id = ?",
-                    (book_id,)
-                )
-            
-            # Determine loan status
-            if is_returned:
-                status = "✓ Returned"
-                completed_count += 1
-            elif datetime.now().date() > due_date:
-                status = "⚠️  OVERDUE"
-                overdue_count += 1
-                active_count += 1
-            else:
-                status = "📖 Active"
-                active_count += 1
-            
-            print(f"   {status}: '{book_title}' borrowed by {member_name}")
-            
-        except Exception as e:
-            print(f"   ✗ Failed to create loan: {e}")
-            conn.rollback()
-    
-    # Commit all loan records
-    conn.commit()
-    conn.close()
+                """,
+                loan_rows
+            )
+            # A book stays unavailable while its loan is active (not returned).
+            # The loans table already knows which books those are, so one
+            # UPDATE with a subquery marks them all - no list of IDs needed
+            conn.execute("""
+                UPDATE books SET available = 0
+                WHERE id IN (SELECT book_id FROM loans WHERE return_date IS NULL)
+            """)
+    except sqlite3.Error as e:
+        print(f"   ✗ Failed to create loans: {e}")
+        return 0, 0
+    
+    write_lines(status_lines)
     
     print(f"\n   📊 Loan Summary:")
+    # Overdue loans are still active (the book hasn't come back)
+    active_count = counts["active"] + counts["overdue"]
+    completed_count = counts["completed"]
+    
     print(f"      - Active loans: {active_count}")
     print(f"      - Completed loans: {completed_count}")
-    print(f"      - Overdue loans: {overdue_count}")
+    print(f"      - Overdue loans: {counts['overdue']}")
     
     return active_count, completed_count
 
@@ -396,6 +511,8 @@ def main():
     3. Create members
     4. Create loans
     5. Display summary
+    
+    All steps share one connection from open_seed_connection().
     """
     print("="*70)
     print("🎓 LIBRARY SYSTEM - SAMPLE DATA SCRIPT")
@@ -405,18 +522,28 @@ def main():
     print("\nNote: This will clear any existing data in the database!")
     print("="*70)
     
+    try:
+        conn = open_seed_connection()
+    except Exception as e:
+        print(f"\n❌ Could not connect to the database: {e}")
+        print("\nMake sure you have run setup.py to initialize the database")
+        return 1
+    
     try:
         # Step 1: Clear existing data
-        clear_existing_data()
+        clear_existing_data(conn)
         
         # Step 2: Create sample books
-        book_ids = create_sample_books()
+        book_ids = create_sample_books(conn)
         
         # Step 3: Create sample members
-        member_ids = create_sample_members()
+        member_ids = create_sample_members(conn)
         
         # Step 4: Create sample loans
-        active_loans, completed_loans = create_sample_loans(book_ids, member_ids)
+        active_loans, completed_loans = create_sample_loans(conn, book_ids, member_ids)
+        
+        # Step 4b: Check all references at once (foreign keys were off while loading)
+        check_foreign_keys(conn)
         
         # Step 5: Display summary and examples
         display_summary(book_ids, member_ids, active_loans, completed_loans)
@@ -433,6 +560,10 @@ def main():
         print("3. The database file is not locked by another process")
         return 1
     
+    finally:
+        # Closing the connection also drops the seed-only PRAGMA settings
+        conn.close()
+    
     return 0
 
 
@@ -148,6 +148,16 @@ CREATE TABLE IF NOT EXISTS loans (
 -- CREATE INDEX idx_loans_member_id ON loans(member_id);
 -- CREATE INDEX idx_loans_return_date ON loans(return_date);
 
+-- ============================================================================
+-- FULL-TEXT SEARCH INDEX FOR BOOKS
+-- ============================================================================
+-- Book.search() can use an FTS5 full-text index (books_fts) instead of
+-- LIKE '%term%'. It is NOT created here: FTS5 with the trigram tokenizer
+-- needs SQLite 3.34+ compiled with FTS5, and this schema must work on any
+-- SQLite. models/library.py creates the index the first time it is needed
+-- (see ensure_books_fts()) and falls back to LIKE if SQLite can't.
+-- ============================================================================
+
 -- ============================================================================
 -- LEARNING NOTES
 -- ============================================================================
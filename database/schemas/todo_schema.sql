@@ -245,5 +245,10 @@ CREATE TABLE IF NOT EXISTS tasks (
 --
 -- 4. Add an index on the status field to speed up queries filtering by status
 --    (Hint: CREATE INDEX idx_tasks_status ON tasks(status);)
+--    Better still, match the whole query: Task.get_all(status=...) filters
+--    on status AND sorts by created_at, so an index on both columns lets
+--    SQLite skip the sort too:
+--    CREATE INDEX idx_tasks_status_created ON tasks(status, created_at DESC);
+--    (exercises/solutions/todo_complete.py creates this and two more indexes)
 --
 -- ============================================================================
@@ -29,6 +29,15 @@ APIs return data in JSON format, making them perfect for:
 PREREQUISITES:
 You need to install Flask first:
     pip install flask
+Optionally, install orjson for faster JSON responses:
+    pip install orjson
+flask-compress to gzip/Brotli-compress large JSON responses:
+    pip install flask-compress
+and waitress to serve the API with several worker threads:
+    pip install waitress
+or gunicorn to serve it with several worker processes:
+    pip install gunicorn
+    API_SERVER=gunicorn python examples/api_example.py
 
 HOW TO USE THIS FILE:
 1. Install Flask: pip install flask
@@ -41,7 +50,8 @@ HOW TO USE THIS FILE:
    - curl commands (see examples below)
    - Postman or similar API testing tool
 6. Study the code to understand how it works
-7. Complete the TODO sections to add Todo endpoints
+7. Complete models/todo.py - the Task endpoints below run their own SQL,
+   so you can compare your Task methods with working code
 
 EXAMPLE API REQUESTS:
 
@@ -68,15 +78,44 @@ curl -X DELETE http://localhost:5000/api/books/1
 curl "http://localhost:5000/api/books/search?query=Python&field=title"
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from typing import Dict, Any
+import hashlib
+import json
+import os
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+# orjson is an optional, much faster JSON encoder (written in native code)
+# If it isn't installed, we fall back to the standard library's json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Flask-Compress is optional too: it gzip/Brotli-compresses responses
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Row-by-row JSON for the streaming endpoints, batched writes for bulk imports
+from database.connection import (
+    iter_query_json, execute_query, execute_insert, execute_many, execute_update, execute_script,
+    QueryExecutionError
+)
 
 # Import Library System models
 from models.library import Book, Member, Loan, ValidationError, DuplicateError, NotFoundError
 
-# Import Todo System models
-from models.todo import Task
+# Import Todo System errors and validators. The Task endpoints don't call
+# the Task model: most of its methods are exercises (see models/todo.py)
+from models.todo import ValidationError as TaskValidationError, NotFoundError as TaskNotFoundError
+# task_row() checks a task from a request body (shared with async_api_example.py)
+from models.todo import task_row, validate_status
 
 
 # ============================================================================
@@ -85,15 +124,272 @@ from models.todo import Task
 
 app = Flask(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Our own endpoints call dumps() directly, but Flask also turns JSON
+    into text in other places: jsonify(), returning a dict from a view,
+    and request.get_json(). Plugging orjson in here speeds those up too,
+    e.g. parsing the bodies sent to POST/PUT /api/tasks.
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # kwargs (indent, sort_keys, ...) are stdlib json options; orjson
+        # always writes compact JSON and keeps the key order
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        # orjson reads the raw request bytes directly, no decode step needed.
+        # Invalid JSON raises orjson.JSONDecodeError (a ValueError), which
+        # Flask turns into a 400 Bad Request (or None with get_json(silent=True))
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
 # Configure Flask
 app.config['JSON_SORT_KEYS'] = False  # Preserve JSON key order
-app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True  # Pretty-print JSON responses
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False  # Compact JSON: no indentation to generate or send
+
+# Response compression (only if flask_compress is installed)
+# JSON repeats the same keys on every row, so it shrinks 5-10x.
+# Level 4 is a good speed/size balance; tiny bodies aren't worth compressing.
+# Streamed responses (GET /api/books, GET /api/tasks) are left alone:
+# compressing them would mean collecting the whole body in memory first.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_STREAMS'] = False
+if Compress is not None:
+    Compress(app)
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def dumps(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a dictionary to compact JSON bytes.
+    
+    Uses orjson when it is installed, otherwise the json module.
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: accept {1: ...} like json.dumps does
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def json_body(payload: Dict[str, Any]):
+    """
+    Turn a dictionary into a JSON response object.
+    
+    Args:
+        payload: Dictionary to send as JSON
+    
+    Returns:
+        Flask Response with mimetype application/json
+    """
+    # Flask can send bytes as-is
+    return app.response_class(dumps(payload), mimetype="application/json")
+
+
+def cached_json_response(body: bytes, etag: str = None, last_modified: datetime = None):
+    """
+    Send pre-serialized JSON with an ETag, or 304 Not Modified.
+    
+    The ETag is a short fingerprint (hash) of the body. A client that
+    already has this exact body sends it back in an If-None-Match header,
+    and then we answer "304 Not Modified" with no body at all.
+    
+    Args:
+        body: JSON bytes, usually from one of the cached *_body() functions
+        etag: Precomputed ETag for the body (computed here if not given)
+        last_modified: When the data last changed, if known. Sent as the
+                       Last-Modified header, which lets clients ask
+                       "changed since ...?" with If-Modified-Since
+    
+    Returns:
+        Flask Response (200 with the body, or 304 without it)
+    """
+    response = app.response_class(body, mimetype="application/json")
+    response.set_etag(etag or hashlib.blake2b(body, digest_size=8).hexdigest())
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # make_conditional() compares the ETag with the request's If-None-Match
+    return response.make_conditional(request)
+
+
+# ----------------------------------------------------------------------------
+# Cached list responses
+# ----------------------------------------------------------------------------
+# Read-mostly lists are queried and serialized once, then served from memory
+# (library_cache, below). The write endpoints clear the cache so the next
+# read sees the change. Changes made elsewhere - another gunicorn worker,
+# the CLI, scripts - are seen once the entries expire, a few seconds later.
+
+def _stream_rows(rows, page_size: int = None):
+    """
+    Yield a {"success": true, "data": [...]} JSON body piece by piece.
+    
+    Instead of building the whole list (and then the whole JSON string),
+    we send '{"success":true,"data":[', then one row at a time separated
+    by commas, then ']}'. Memory use stays the same for 10 or 100,000 rows.
+    Used by GET /api/books and GET /api/tasks.
+    
+    Args:
+        rows: Rows as JSON object strings, from iter_query_json() - SQLite
+              already wrote the JSON, so no dictionary is built per row
+        page_size: For paginated lists, the LIMIT used in the query. Adds a
+                   "next" field: the ID to pass as ?after_id= for the next
+                   page, or null when this was the last page
+    """
+    yield b'{"success":true,"data":['
+    first = True
+    count = 0
+    last = None
+    for row in rows:
+        if not first:
+            yield b','
+        first = False
+        yield row.encode()
+        count += 1
+        last = row
+    if page_size is None:
+        yield b']}'
+    else:
+        # A full page means there may be more rows after it.
+        # Only the last row is parsed, to read its ID
+        next_id = json.loads(last)['id'] if count == page_size else None
+        yield b'],"next":' + dumps(next_id) + b'}'
+
+
+class TTLCache:
+    """
+    A small thread-safe cache whose entries expire after `ttl` seconds.
+    
+    Used for the Task and Library endpoints: even if a change slips
+    past the explicit clear() calls (e.g. made by another program), cached
+    answers are at most `ttl` seconds old.
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = {}  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+    
+    def set(self, key, value) -> None:
+        """Store a value; the oldest entry is dropped when the cache is full."""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def clear(self) -> None:
+        """Forget everything (call after every write)."""
+        with self._lock:
+            self._entries.clear()
+
+
+def parse_timestamp(value) -> datetime:
+    """
+    Turn an SQLite CURRENT_TIMESTAMP value ('2024-01-31 12:00:00', UTC)
+    into a timezone-aware datetime, or None if it can't be parsed.
+    """
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+# Cached books, search results and the member list, keyed ("book", book_id),
+# ("search", query, field) and ("members",). A book's "available" flag also
+# changes when it is checked out or returned - through the CLI, Loan or
+# sample_data.py, not only this API - and under gunicorn a write clears
+# only its own worker's cache. So entries expire after a few seconds
+# instead of waiting for an API write to clear them.
+library_cache = TTLCache(maxsize=1024, ttl=5)
+
+
+def _search_body(query: str, field: str) -> bytes:
+    """JSON body for GET /api/books/search, remembered for library_cache.ttl seconds."""
+    key = ("search", query, field)
+    body = library_cache.get(key)
+    if body is None:
+        body = dumps({"success": True, "data": Book.search(query, search_field=field)})
+        library_cache.set(key, body)
+    return body
+
+
+def _members_body() -> bytes:
+    """JSON body for GET /api/members, remembered for library_cache.ttl seconds."""
+    body = library_cache.get(("members",))
+    if body is None:
+        body = dumps({"success": True, "data": Member.get_all()})
+        library_cache.set(("members",), body)
+    return body
+
+
+def _book_cached(book_id: int):
+    """Book.get_by_id() for GET /api/books/<id>, remembered for library_cache.ttl seconds."""
+    key = ("book", book_id)
+    book = library_cache.get(key)
+    if book is None:
+        book = Book.get_by_id(book_id)
+        # "Not found" isn't cached, so a new book with this ID shows up at once
+        if book is not None:
+            library_cache.set(key, book)
+    return book
+
+
+# Cached Task responses: key -> (etag, body, last_modified)
+# Keys are ("task", task_id); the task list is streamed instead (see get_tasks)
+task_cache = TTLCache(maxsize=512, ttl=30)
+
+
+def cached_task_response(key: tuple, load):
+    """
+    Serve a Task response from task_cache, building it on a miss.
+    
+    Args:
+        key: Cache key, e.g. ("task", 42)
+        load: Function that reads the data from the database
+    
+    Returns:
+        Flask Response (200 with the body, or 304 Not Modified)
+    """
+    entry = task_cache.get(key)
+    if entry is None:
+        data = load()
+        body = dumps({"success": True, "data": data})
+        # Only an updated_at column says when a task last changed;
+        # created_at alone would hide later edits from If-Modified-Since
+        last_modified = parse_timestamp(data.get('updated_at')) if isinstance(data, dict) else None
+        # Hash once, when the entry is created - not on every request
+        entry = (hashlib.blake2b(body, digest_size=16).hexdigest(), body, last_modified)
+        task_cache.set(key, entry)
+    etag, body, last_modified = entry
+    return cached_json_response(body, etag, last_modified)
+
+
+def invalidate_books_cache() -> None:
+    """Forget every cached book (and book list) after a book changes."""
+    library_cache.clear()
+
+
 def success_response(data: Any, status_code: int = 200) -> tuple:
     """
     Create a successful JSON response.
@@ -105,7 +401,7 @@ def success_response(data: Any, status_code: int = 200) -> tuple:
     Returns:
         Tuple of (response, status_code) for Flask
     """
-    return jsonify({
+    return json_body({
         "success": True,
         "data": data
     }), status_code
@@ -122,12 +418,213 @@ def error_response(message: str, status_code: int = 400) -> tuple:
     Returns:
         Tuple of (response, status_code) for Flask
     """
-    return jsonify({
+    return json_body({
         "success": False,
         "error": message
     }), status_code
 
 
+# Required JSON fields for the create endpoints
+# frozenset: an unchangeable set, built once when the module loads
+BOOK_REQUIRED_FIELDS = frozenset({'title', 'author', 'isbn'})
+MEMBER_REQUIRED_FIELDS = frozenset({'name', 'email'})
+
+# Query-string values that count as "true" (e.g. ?available_only=yes)
+TRUTHY_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+# Page sizes for GET /api/tasks
+TASKS_DEFAULT_LIMIT = 50
+TASKS_MAX_LIMIT = 500
+
+# SQL for the single-task endpoints. They work on every version of the
+# tasks table: only the status update needs a column from the exercise
+TASK_BY_ID_SQL = "SELECT * FROM tasks WHERE id = ?"
+TASK_INSERT_SQL = "INSERT INTO tasks (title, description) VALUES (?, ?)"
+TASK_DELETE_SQL = "DELETE FROM tasks WHERE id = ?"
+
+def ensure_task_indexes() -> None:
+    """
+    Create the index that GET /api/tasks?status=... relies on.
+    
+    Without it, filtering by status reads every row of the tasks table.
+    The status column is part of the todo exercise (todo_schema.sql TODO 1),
+    so this quietly does nothing until that column exists.
+    
+    Learning Notes:
+    - SQLite adds the row ID to every index, so an index on (status) also
+      serves "WHERE status = ? AND id < ? ORDER BY id DESC"
+    - IF NOT EXISTS makes it safe to run on every start
+    """
+    try:
+        execute_update("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
+    except QueryExecutionError:
+        pass
+
+
+def task_columns() -> frozenset:
+    """
+    Names of the tasks table's columns.
+    
+    The todo exercise lets you add columns (status, priority, ...), so a
+    few features below check what your table actually has. This is not
+    cached: the answer changes as soon as you finish a schema TODO, and
+    PRAGMA table_info is a quick lookup.
+    """
+    # as_dict=False: we only read one column, so sqlite3.Row is enough
+    return frozenset(
+        row['name'] for row in execute_query("PRAGMA table_info(tasks)", as_dict=False)
+    )
+
+
+# Per-status task counts, kept up to date by triggers. Reading the counts is
+# then a lookup in a table with at most three rows, instead of a
+# GROUP BY over every task. The counts are rebuilt by init_app(), in case
+# tasks were changed before the triggers existed.
+# Tasks without a status (NULL) are counted under '' - a NULL primary key
+# never conflicts, so NULL keys would each get a row of their own.
+# The table and triggers are dropped and recreated, so a database set up
+# by an older version of this file gets the current definitions.
+TASK_COUNTS_SCRIPT = """
+    BEGIN;
+    DROP TRIGGER IF EXISTS task_counts_insert;
+    DROP TRIGGER IF EXISTS task_counts_delete;
+    DROP TRIGGER IF EXISTS task_counts_update;
+    DROP TABLE IF EXISTS task_counts;
+
+    CREATE TABLE task_counts (
+        status TEXT NOT NULL PRIMARY KEY,
+        n INTEGER NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER task_counts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_counts (status, n) VALUES (COALESCE(NEW.status, ''), 1)
+            ON CONFLICT (status) DO UPDATE SET n = n + 1;
+    END;
+
+    CREATE TRIGGER task_counts_delete AFTER DELETE ON tasks BEGIN
+        UPDATE task_counts SET n = n - 1 WHERE status = COALESCE(OLD.status, '');
+    END;
+
+    CREATE TRIGGER task_counts_update AFTER UPDATE OF status ON tasks
+    WHEN OLD.status IS NOT NEW.status BEGIN
+        UPDATE task_counts SET n = n - 1 WHERE status = COALESCE(OLD.status, '');
+        INSERT INTO task_counts (status, n) VALUES (COALESCE(NEW.status, ''), 1)
+            ON CONFLICT (status) DO UPDATE SET n = n + 1;
+    END;
+
+    INSERT INTO task_counts (status, n)
+        SELECT COALESCE(status, ''), COUNT(*) FROM tasks GROUP BY 1;
+    COMMIT;
+"""
+
+
+def ensure_task_counts() -> bool:
+    """
+    Create the task_counts table and its triggers.
+    
+    Only possible once your tasks table has a status column
+    (todo_schema.sql TODO 1) - without it the triggers would make every
+    INSERT into tasks fail.
+    
+    Returns:
+        bool: True if task counts are available
+    """
+    if "status" not in task_columns():
+        return False
+    try:
+        execute_script(TASK_COUNTS_SCRIPT)
+        return True
+    except QueryExecutionError:
+        return False
+
+
+# A change counter for the tasks table, bumped by triggers on every INSERT,
+# UPDATE and DELETE - no matter which program makes the change (this
+# server, another gunicorn worker, main.py, a script). It is stored in the
+# database, so it survives restarts and is the same for every worker: a
+# safe basis for the GET /api/tasks ETag. It starts at a random number, so
+# a recreated database doesn't hand out ETags an old client may still hold.
+TASKS_VERSION_SCRIPT = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS tasks_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO tasks_version (id, version) VALUES (1, abs(random() % 1000000000));
+
+    CREATE TRIGGER IF NOT EXISTS tasks_version_insert AFTER INSERT ON tasks BEGIN
+        UPDATE tasks_version SET version = version + 1 WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS tasks_version_update AFTER UPDATE ON tasks BEGIN
+        UPDATE tasks_version SET version = version + 1 WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS tasks_version_delete AFTER DELETE ON tasks BEGIN
+        UPDATE tasks_version SET version = version + 1 WHERE id = 1;
+    END;
+    COMMIT;
+"""
+
+
+def ensure_tasks_version() -> None:
+    """Create the tasks_version counter and its triggers (see above)."""
+    try:
+        execute_script(TASKS_VERSION_SCRIPT)
+    except QueryExecutionError:
+        pass
+
+
+def tasks_version():
+    """
+    The tasks table's change counter, or None if it can't be trusted.
+    
+    None means init_app() hasn't created it yet, or the triggers are gone
+    (dropping the tasks table drops its triggers too), so changes would
+    no longer be counted.
+    """
+    try:
+        rows = execute_query(
+            "SELECT version, (SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' "
+            "AND name IN ('tasks_version_insert', 'tasks_version_update', 'tasks_version_delete')"
+            ") AS triggers FROM tasks_version WHERE id = 1",
+            as_dict=False
+        )
+    except QueryExecutionError:
+        return None
+    if not rows or rows[0]['triggers'] != 3:
+        return None
+    return rows[0]['version']
+
+
+def task_counts_available() -> bool:
+    """Whether init_app() has created the task_counts table."""
+    return bool(execute_query(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_counts'",
+        as_dict=False
+    ))
+
+
+def init_app() -> None:
+    """
+    Prepare the database for the Task endpoints (indexes, task counts,
+    the change counter behind the task list's ETag).
+    
+    This changes your database, so it is NOT done when the module is
+    imported - main() calls it once before starting the server. If you
+    serve the app another way (e.g. "gunicorn examples.api_example:app"),
+    run it once yourself first:
+        python -c "from examples.api_example import init_app; init_app()"
+    
+    Everything here is optional: without it, the endpoints still work
+    (only slower), GET /api/tasks never answers 304, and
+    GET /api/tasks/stats answers 404.
+    """
+    ensure_task_indexes()
+    ensure_task_counts()
+    ensure_tasks_version()
+
+
 # ============================================================================
 # LIBRARY SYSTEM API ENDPOINTS (Complete Examples)
 # ============================================================================
@@ -142,7 +639,7 @@ def get_books():
     GET /api/books - Retrieve all books
     
     Query Parameters:
-        available_only (bool): If true, only return available books
+        available_only (bool): If true (or 1, yes, on), only return available books
     
     Response:
         200 OK: List of books
@@ -152,18 +649,22 @@ def get_books():
         GET /api/books
         GET /api/books?available_only=true
     """
-    try:
-        # Get query parameter (defaults to False if not provided)
-        available_only = request.args.get('available_only', 'false').lower() == 'true'
-        
-        # Get books from database
-        books = Book.get_all(available_only=available_only)
-        
-        # Return success response
-        return success_response(books)
-        
-    except Exception as e:
-        return error_response(f"Failed to retrieve books: {str(e)}", 500)
+    # Get query parameter (defaults to False if not provided)
+    available_only = request.args.get('available_only', '').lower() in TRUTHY_VALUES
+    
+    # Same query as Book.get_all(), read in chunks instead of all at once
+    query = "SELECT * FROM books"
+    if available_only:
+        query += " WHERE available = 1"
+    query += " ORDER BY title"
+    
+    # The response is sent while the rows are still being read.
+    # Note: once streaming has started the status code is already sent,
+    # so a database error halfway through can't become a 500 anymore.
+    return app.response_class(
+        stream_with_context(_stream_rows(iter_query_json(query))),
+        mimetype="application/json"
+    )
 
 
 @app.route('/api/books/<int:book_id>', methods=['GET'])
@@ -183,7 +684,8 @@ def get_book(book_id: int):
         GET /api/books/1
     """
     try:
-        book = Book.get_by_id(book_id)
+        # Repeated requests for the same ID skip the database entirely
+        book = _book_cached(book_id)
         
         if book is None:
             return error_response(f"Book with ID {book_id} not found", 404)
@@ -219,17 +721,19 @@ def create_book():
         {"title":"Python Book","author":"John Doe","isbn":"1234567890"}
     """
     try:
-        # Get JSON data from request
-        data = request.get_json()
+        # Get JSON data from request. silent=True returns None for a missing
+        # or invalid body instead of raising - the generic `except` below
+        # would otherwise turn that 400 into a 500
+        data = request.get_json(silent=True)
         
         # Validate required fields
-        if not data:
-            return error_response("Request body must be JSON", 400)
+        if not isinstance(data, dict) or not data:
+            return error_response("Request body must be a JSON object", 400)
         
-        required_fields = ['title', 'author', 'isbn']
-        missing_fields = [field for field in required_fields if field not in data]
+        # Set difference: required fields that are not among the request's keys
+        missing_fields = BOOK_REQUIRED_FIELDS - data.keys()
         if missing_fields:
-            return error_response(f"Missing required fields: {', '.join(missing_fields)}", 400)
+            return error_response(f"Missing required fields: {', '.join(sorted(missing_fields))}", 400)
         
         # Create book
         book_id = Book.create(
@@ -238,6 +742,7 @@ def create_book():
             isbn=data['isbn'],
             published_year=data.get('published_year')  # Optional field
         )
+        invalidate_books_cache()
         
         # Return success response with 201 Created status
         return success_response({
@@ -280,14 +785,15 @@ def update_book(book_id: int):
         {"published_year":2024}
     """
     try:
-        # Get JSON data from request
-        data = request.get_json()
+        # Get JSON data from request (None if missing or invalid)
+        data = request.get_json(silent=True)
         
-        if not data:
-            return error_response("Request body must be JSON", 400)
+        if not isinstance(data, dict) or not data:
+            return error_response("Request body must be a JSON object", 400)
         
         # Update book with provided fields
         success = Book.update(book_id, **data)
+        invalidate_books_cache()
         
         if not success:
             return error_response(f"Book with ID {book_id} not found", 404)
@@ -321,6 +827,7 @@ def delete_book(book_id: int):
     """
     try:
         success = Book.delete(book_id)
+        invalidate_books_cache()
         
         if not success:
             return error_response(f"Book with ID {book_id} not found", 404)
@@ -363,9 +870,7 @@ def search_books():
             return error_response("Field must be 'title' or 'author'", 400)
         
         # Search books
-        books = Book.search(query, search_field=field)
-        
-        return success_response(books)
+        return cached_json_response(_search_body(query, field))
         
     except Exception as e:
         return error_response(f"Failed to search books: {str(e)}", 500)
@@ -379,8 +884,7 @@ def search_books():
 def get_members():
     """GET /api/members - Retrieve all members"""
     try:
-        members = Member.get_all()
-        return success_response(members)
+        return cached_json_response(_members_body())
     except Exception as e:
         return error_response(f"Failed to retrieve members: {str(e)}", 500)
 
@@ -401,17 +905,17 @@ def get_member(member_id: int):
 def create_member():
     """POST /api/members - Create a new member"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
-        if not data:
-            return error_response("Request body must be JSON", 400)
+        if not isinstance(data, dict) or not data:
+            return error_response("Request body must be a JSON object", 400)
         
-        required_fields = ['name', 'email']
-        missing_fields = [field for field in required_fields if field not in data]
+        missing_fields = MEMBER_REQUIRED_FIELDS - data.keys()
         if missing_fields:
-            return error_response(f"Missing required fields: {', '.join(missing_fields)}", 400)
+            return error_response(f"Missing required fields: {', '.join(sorted(missing_fields))}", 400)
         
         member_id = Member.create(name=data['name'], email=data['email'])
+        library_cache.clear()
         
         return success_response({
             "id": member_id,
@@ -427,208 +931,509 @@ def create_member():
 
 
 # ============================================================================
-# TODO SYSTEM API ENDPOINTS (For Students to Implement)
+# TODO SYSTEM API ENDPOINTS (plain SQL - the Task model is an exercise)
 # ============================================================================
 
 @app.route('/api/tasks', methods=['GET'])
 def get_tasks():
     """
-    TODO: GET /api/tasks - Retrieve all tasks
-    
-    This should:
-    1. Get optional 'status' query parameter for filtering
-    2. Call Task.get_all() with status filter
-    3. Return success response with tasks
-    4. Handle errors appropriately
+    GET /api/tasks - Retrieve tasks, one page at a time (newest first)
     
     Query Parameters:
         status (str): Filter by status - 'pending', 'in_progress', or 'completed'
+        limit (int): Tasks per page (default 50, at most 500)
+        after_id (int): Only tasks older than this ID - pass the "next"
+                        value from the previous page
     
     Response:
-        200 OK: List of tasks
+        200 OK: {"success": true, "data": [...], "next": <id or null>}
+                (streamed, like GET /api/books)
+        304 Not Modified: Nothing changed since the client's copy (If-None-Match)
+                          (only once init_app() has run)
+        400 Bad Request: Invalid status filter or paging parameters
         500 Internal Server Error: Database error
     
-    HINTS:
-    - Follow the pattern from get_books()
-    - Use request.args.get('status') to get query parameter
-    - Call Task.get_all(status=status) if status provided
+    Example:
+        GET /api/tasks
+        GET /api/tasks?status=pending&limit=20
+        GET /api/tasks?status=pending&limit=20&after_id=180
     
-    EXAMPLE IMPLEMENTATION:
+    Learning Notes:
+    - "Keyset" pagination (id < after_id) jumps straight to the next page
+      through the primary key; OFFSET would read and skip every earlier row
+    - IDs grow with each insert, so newest-first by id matches created_at
+    """
+    status = request.args.get('status')
+    
+    # Validate before streaming starts, while we can still answer 400
     try:
-        status = request.args.get('status')
-        tasks = Task.get_all(status=status)
-        return success_response(tasks)
-    except Exception as e:
-        return error_response(f"Failed to retrieve tasks: {str(e)}", 500)
+        limit = min(int(request.args.get('limit', TASKS_DEFAULT_LIMIT)), TASKS_MAX_LIMIT)
+        after_id = request.args.get('after_id')
+        after_id = int(after_id) if after_id is not None else None
+    except ValueError:
+        return error_response("limit and after_id must be whole numbers", 400)
+    if limit < 1:
+        return error_response("limit must be at least 1", 400)
+    
+    conditions, params = [], []
+    if status is not None:
+        try:
+            validate_status(status)
+        except TaskValidationError as e:
+            return error_response(str(e), 400)
+        conditions.append("status = ?")
+        params.append(status)
+    if after_id is not None:
+        conditions.append("id < ?")
+        params.append(after_id)
+    
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    
+    # Cheap "has anything changed?" check before reading the page itself:
+    # one small row instead of up to `limit` full rows plus their JSON.
+    # The ETag combines the tasks table's change counter with everything
+    # that selects the page, so two different pages never share one.
+    # Without the counter (init_app() not run) there is no ETag and no 304.
+    version = tasks_version()
+    etag = None
+    if version is not None:
+        etag = f"{version}-{status or ''}-{limit}-{after_id or ''}"
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+    
+    query = f"SELECT * FROM tasks{where} ORDER BY id DESC LIMIT ?"
+    params.append(limit)
+    
+    # Rows go to the client as they are read instead of all being held at once
+    response = app.response_class(
+        stream_with_context(_stream_rows(iter_query_json(query, tuple(params)), page_size=limit)),
+        mimetype="application/json"
+    )
+    # Weak ETag (W/"..."): it describes the data, not the exact bytes
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+@app.route('/api/tasks/stats', methods=['GET'])
+def get_task_stats():
+    """
+    GET /api/tasks/stats - Number of tasks per status
+    
+    Response:
+        200 OK: {"success": true, "data": {"pending": 3, "completed": 5, ...}}
+                Tasks without a status are counted under ""
+        404 Not Found: The tasks table has no status column yet
+        500 Internal Server Error: Database error
     """
-    return error_response("TODO: Implement get_tasks endpoint", 501)
+    try:
+        if not task_counts_available():
+            return error_response(
+                "Task stats need a status column (see todo_schema.sql TODO 1) "
+                "and init_app() to have run", 404
+            )
+        
+        rows = execute_query(
+            "SELECT status, n FROM task_counts WHERE n > 0 ORDER BY status", as_dict=False
+        )
+        return success_response({row['status']: row['n'] for row in rows})
+    except Exception as e:
+        return error_response(f"Failed to retrieve task stats: {str(e)}", 500)
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['GET'])
 def get_task(task_id: int):
     """
-    TODO: GET /api/tasks/<id> - Retrieve a specific task
+    GET /api/tasks/<id> - Retrieve a specific task
     
-    This should:
-    1. Call Task.get_by_id(task_id)
-    2. Return 404 if task not found
-    3. Return success response with task data
+    Response:
+        200 OK: Task data
+        304 Not Modified: The client's copy (If-None-Match or
+                          If-Modified-Since) is still current
+        404 Not Found: Task doesn't exist
+        500 Internal Server Error: Database error
     
-    HINTS:
-    - Follow the pattern from get_book()
-    - Check if task is None and return 404 error
+    Learning Notes:
+    - "Cache-Control: private, max-age=10" lets the client's own cache
+      (not shared proxies) reuse the answer for 10 seconds without asking
+    - Last-Modified is only sent if your tasks table has an updated_at column
     """
-    return error_response("TODO: Implement get_task endpoint", 501)
+    def load():
+        rows = execute_query(TASK_BY_ID_SQL, (task_id,))
+        if not rows:
+            # Raising keeps "not found" out of the cache
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        return rows[0]
+    
+    try:
+        response = cached_task_response(("task", task_id), load)
+        response.cache_control.private = True
+        response.cache_control.max_age = 10
+        return response
+    except TaskNotFoundError as e:
+        return error_response(str(e), 404)
+    except Exception as e:
+        return error_response(f"Failed to retrieve task: {str(e)}", 500)
 
 
 @app.route('/api/tasks', methods=['POST'])
 def create_task():
     """
-    TODO: POST /api/tasks - Create a new task
-    
-    This should:
-    1. Get JSON data from request
-    2. Validate required fields (title)
-    3. Call Task.create() with data
-    4. Return 201 Created with task ID
-    5. Handle ValidationError (400) and other errors (500)
+    POST /api/tasks - Create a new task
     
     Request Body (JSON):
         {
             "title": "Task Title",
-            "description": "Task Description",  // optional
-            "status": "pending",  // optional
-            "priority": "medium"  // optional
+            "description": "Task Description"  // optional
         }
     
     Response:
         201 Created: Task created successfully
         400 Bad Request: Validation error
         500 Internal Server Error: Database error
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, dict) or not data:
+            return error_response("Request body must be a JSON object", 400)
+        
+        if 'title' not in data:
+            return error_response("Missing required fields: title", 400)
+        
+        task_id = execute_insert(TASK_INSERT_SQL, task_row(data))
+        task_cache.clear()
+        
+        return success_response({
+            "id": task_id,
+            "message": "Task created successfully"
+        }, 201)
+        
+    except TaskValidationError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Failed to create task: {str(e)}", 500)
+
+
+@app.route('/api/tasks/bulk', methods=['POST'])
+def create_tasks_bulk():
+    """
+    POST /api/tasks/bulk - Create many tasks in one request
+    
+    Request Body (JSON):
+        [
+            {"title": "First task", "description": "optional"},
+            {"title": "Second task"}
+        ]
     
-    HINTS:
-    - Follow the pattern from create_book()
-    - Required field: title
-    - Optional fields: description, status, priority
-    - Use data.get('field') for optional fields
+    Response:
+        201 Created: All tasks created ({"inserted": <count>})
+        400 Bad Request: Body isn't a list, or a task fails validation
+                         ("Task #<position>: ...", counting from 0)
+        500 Internal Server Error: Database error (no task is saved)
+    
+    Learning Notes:
+    - Importing 500 tasks through POST /api/tasks means 500 HTTP requests
+      and 500 commits; here it's one request and one commit
+    - Every task is validated BEFORE anything is written, so a bad task
+      rejects the whole batch instead of leaving half of it saved
     """
-    return error_response("TODO: Implement create_task endpoint", 501)
+    try:
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, list) or not data:
+            return error_response("Request body must be a non-empty JSON list of tasks", 400)
+        
+        rows = []
+        for position, item in enumerate(data):
+            if not isinstance(item, dict):
+                return error_response(f"Task #{position} must be a JSON object", 400)
+            try:
+                rows.append(task_row(item))
+            except TaskValidationError as e:
+                # Say which task failed: #0 is the first one in the list
+                return error_response(f"Task #{position}: {e}", 400)
+        
+        # One prepared INSERT, one transaction for the whole list
+        inserted = execute_many(TASK_INSERT_SQL, rows)
+        task_cache.clear()
+        
+        return success_response({
+            "inserted": inserted,
+            "message": f"Created {inserted} task(s)"
+        }, 201)
+        
+    except TaskValidationError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Failed to create tasks: {str(e)}", 500)
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 def update_task(task_id: int):
     """
-    TODO: PUT /api/tasks/<id> - Update a task
+    PUT /api/tasks/<id> - Update a task's status
     
-    This should:
-    1. Get JSON data from request
-    2. Call Task.update_status() or Task.update() depending on fields
-    3. Return 404 if task not found
-    4. Return success response
+    Request Body (JSON):
+        {"status": "completed"}
     
-    HINTS:
-    - Follow the pattern from update_book()
-    - Handle status updates specially if needed
+    Response:
+        200 OK: Task updated successfully
+        400 Bad Request: Validation error
+        404 Not Found: Task doesn't exist
+        500 Internal Server Error: Database error
+        501 Not Implemented: The tasks table has no status column yet
+                             (todo_schema.sql TODO 1)
+    
+    Learning Notes:
+    - UPDATE reports how many rows it changed: 0 means no task has this ID,
+      so we learn "not found" without a separate SELECT first
     """
-    return error_response("TODO: Implement update_task endpoint", 501)
+    try:
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, dict) or 'status' not in data:
+            return error_response("Request body must be a JSON object with a 'status' field", 400)
+        
+        validate_status(data['status'])
+        
+        columns = task_columns()
+        if 'status' not in columns:
+            return error_response(
+                "Updating a task's status needs a status column (see todo_schema.sql TODO 1)", 501
+            )
+        
+        # Keep Last-Modified (GET /api/tasks/<id>) honest, if the table tracks it
+        query = "UPDATE tasks SET status = ?"
+        if 'updated_at' in columns:
+            query += ", updated_at = CURRENT_TIMESTAMP"
+        updated = execute_update(query + " WHERE id = ?", (data['status'], task_id))
+        task_cache.clear()
+        
+        if not updated:
+            return error_response(f"Task with ID {task_id} not found", 404)
+        
+        return success_response({
+            "id": task_id,
+            "message": "Task updated successfully"
+        })
+        
+    except TaskValidationError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Failed to update task: {str(e)}", 500)
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
 def delete_task(task_id: int):
     """
-    TODO: DELETE /api/tasks/<id> - Delete a task
-    
-    This should:
-    1. Call Task.delete(task_id)
-    2. Return 404 if task not found
-    3. Return success response
+    DELETE /api/tasks/<id> - Delete a task
     
-    HINTS:
-    - Follow the pattern from delete_book()
-    - Very similar implementation
+    Response:
+        200 OK: Task deleted successfully
+        404 Not Found: Task doesn't exist
+        500 Internal Server Error: Database error
     """
-    return error_response("TODO: Implement delete_task endpoint", 501)
+    try:
+        deleted = execute_update(TASK_DELETE_SQL, (task_id,))
+        task_cache.clear()
+        
+        if not deleted:
+            return error_response(f"Task with ID {task_id} not found", 404)
+        
+        return success_response({
+            "id": task_id,
+            "message": "Task deleted successfully"
+        })
+        
+    except Exception as e:
+        return error_response(f"Failed to delete task: {str(e)}", 500)
 
 
 # ============================================================================
 # ROOT ENDPOINT (API Information)
 # ============================================================================
 
+# The index never changes while the server runs, so it's serialized
+# (and fingerprinted) once, when the module is imported
+_INDEX_BODY = dumps({
+    "name": "Python Backend Learning Project API",
+    "version": "1.0.0",
+    "description": "REST API for Library and Todo systems",
+    "endpoints": {
+        "library_system": {
+            "books": {
+                "GET /api/books": "Get all books",
+                "GET /api/books/<id>": "Get book by ID",
+                "POST /api/books": "Create new book",
+                "PUT /api/books/<id>": "Update book",
+                "DELETE /api/books/<id>": "Delete book",
+                "GET /api/books/search": "Search books"
+            },
+            "members": {
+                "GET /api/members": "Get all members",
+                "GET /api/members/<id>": "Get member by ID",
+                "POST /api/members": "Create new member"
+            }
+        },
+        "todo_system": {
+            "tasks": {
+                "GET /api/tasks": "Get all tasks",
+                "GET /api/tasks/<id>": "Get task by ID",
+                "GET /api/tasks/stats": "Count tasks per status",
+                "POST /api/tasks": "Create new task",
+                "POST /api/tasks/bulk": "Create many tasks at once",
+                "PUT /api/tasks/<id>": "Update task",
+                "DELETE /api/tasks/<id>": "Delete task"
+            }
+        }
+    },
+    "documentation": "See code comments for detailed endpoint documentation"
+})
+_INDEX_ETAG = hashlib.blake2b(_INDEX_BODY, digest_size=8).hexdigest()
+
+
 @app.route('/')
 def index():
     """
     Root endpoint - provides API information and available endpoints.
+    
+    Learning Notes:
+    - No dictionary is built and no JSON is generated per request
+    - Cache-Control lets browsers and proxies reuse the answer for an hour,
+      and the ETag turns a re-check into a body-less 304 Not Modified
     """
-    return jsonify({
-        "name": "Python Backend Learning Project API",
-        "version": "1.0.0",
-        "description": "REST API for Library and Todo systems",
-        "endpoints": {
-            "library_system": {
-                "books": {
-                    "GET /api/books": "Get all books",
-                    "GET /api/books/<id>": "Get book by ID",
-                    "POST /api/books": "Create new book",
-                    "PUT /api/books/<id>": "Update book",
-                    "DELETE /api/books/<id>": "Delete book",
-                    "GET /api/books/search": "Search books"
-                },
-                "members": {
-                    "GET /api/members": "Get all members",
-                    "GET /api/members/<id>": "Get member by ID",
-                    "POST /api/members": "Create new member"
-                }
-            },
-            "todo_system": {
-                "tasks": {
-                    "GET /api/tasks": "Get all tasks (TODO)",
-                    "GET /api/tasks/<id>": "Get task by ID (TODO)",
-                    "POST /api/tasks": "Create new task (TODO)",
-                    "PUT /api/tasks/<id>": "Update task (TODO)",
-                    "DELETE /api/tasks/<id>": "Delete task (TODO)"
-                }
-            }
-        },
-        "documentation": "See code comments for detailed endpoint documentation"
-    })
+    response = cached_json_response(_INDEX_BODY, _INDEX_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response
 
 
 # ============================================================================
 # ERROR HANDLERS
 # ============================================================================
 
+# These answers never change, so their JSON is built once at import.
+# Like the index, we store bytes and wrap them in a new Response per error
+# (Response objects are mutable and shouldn't be shared between threads).
+_BAD_REQUEST_BODY = dumps({"success": False, "error": "Bad request - check that the body is valid JSON"})
+_NOT_FOUND_BODY = dumps({"success": False, "error": "Endpoint not found"})
+_METHOD_NOT_ALLOWED_BODY = dumps({"success": False, "error": "Method not allowed for this endpoint"})
+_INTERNAL_ERROR_BODY = dumps({"success": False, "error": "Internal server error"})
+
+
+@app.errorhandler(400)
+def bad_request(error):
+    """
+    Handle 400 Bad Request errors
+    
+    Flask raises this when request.get_json() can't parse the body
+    (with orjson installed, ORJSONProvider.loads() does the parsing).
+    Our views use get_json(silent=True) and answer with their own message,
+    because their catch-all `except Exception` would turn the raised 400
+    into a 500; this handler covers any other 400 Flask raises.
+    """
+    return app.response_class(_BAD_REQUEST_BODY, status=400, mimetype="application/json")
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 Not Found errors"""
-    return error_response("Endpoint not found", 404)
+    return app.response_class(_NOT_FOUND_BODY, status=404, mimetype="application/json")
 
 
 @app.errorhandler(405)
 def method_not_allowed(error):
     """Handle 405 Method Not Allowed errors"""
-    return error_response("Method not allowed for this endpoint", 405)
+    return app.response_class(_METHOD_NOT_ALLOWED_BODY, status=405, mimetype="application/json")
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 Internal Server Error"""
-    return error_response("Internal server error", 500)
+    return app.response_class(_INTERNAL_ERROR_BODY, status=500, mimetype="application/json")
 
 
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
 
+def run_gunicorn() -> None:
+    """
+    Replace this process with gunicorn serving the app on several processes.
+    
+    Only returns if gunicorn isn't installed (os.execvp raises instead).
+    
+    Learning Notes:
+    - 2 * CPUs + 1 worker processes is gunicorn's usual starting point
+    - gthread workers run 4 threads each, so waiting on the database doesn't
+      block a whole worker
+    - Every worker has its own connection pool and its own caches. A write
+      in one worker clears only that worker's caches, so other workers can
+      serve slightly old data - but every cache expires its entries
+      (task_cache.ttl and library_cache.ttl seconds). The task list's ETag
+      comes from a counter stored in the database, so it is the same in
+      every worker
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    workers = 2 * (os.cpu_count() or 1) + 1
+    # exec replaces this process, so anything still buffered would be lost
+    sys.stdout.flush()
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "--chdir", project_root,
+        "--bind", "0.0.0.0:5000",
+        "--workers", str(workers),
+        "--worker-class", "gthread",
+        "--threads", "4",
+        "examples.api_example:app",
+    ])
+
+
 def main():
     """
     Main entry point for the API server.
     
-    Starts the Flask development server.
+    Picks a server in this order:
+    1. gunicorn (several processes) when API_SERVER=gunicorn is set
+    2. waitress (a production WSGI server) when it is installed
+    3. the Flask development server
+    
+    Learning Notes:
+    - All servers handle each request in its own thread, so while one
+      request waits for the database, others keep running
+    - This is safe because every thread borrows its own pooled connection
+      (see database/connection.py; check_same_thread is False)
+    - Don't use gevent workers with this app: they patch threading and
+      sockets, which doesn't mix with the thread-based connection pool
     """
     print("\n" + "=" * 70)
     print("  PYTHON BACKEND LEARNING PROJECT - REST API")
     print("=" * 70)
-    print("\nStarting Flask development server...")
+    
+    # Indexes and task counts - once here, in the parent process, so that
+    # several gunicorn workers don't all run the same DDL at startup
+    init_app()
+    
+    if os.environ.get("API_SERVER") == "gunicorn":
+        print("\nStarting gunicorn (one worker process per core)...")
+        print("API will be available at: http://localhost:5000\n")
+        try:
+            run_gunicorn()
+        except FileNotFoundError:
+            print("gunicorn is not installed (pip install gunicorn), falling back...")
+    
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    
+    if serve is not None:
+        print("\nStarting waitress server (8 threads)...")
+    else:
+        print("\nStarting Flask development server...")
     print("API will be available at: http://localhost:5000")
     print("\nAvailable endpoints:")
     print("  GET  /                     - API information")
@@ -641,8 +1446,11 @@ def main():
     print("\nPress Ctrl+C to stop the server")
     print("=" * 70 + "\n")
     
-    # Run Flask development server
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if serve is not None:
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        # Run Flask development server (one thread per request)
+        app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
 
 
 # ============================================================================
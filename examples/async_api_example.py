@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Async REST API Example (Quart + aiosqlite)
+
+This is an OPTIONAL advanced example. It serves the same Task endpoints
+as examples/api_example.py, but with async handlers.
+
+LEARNING OBJECTIVES:
+- Understand the difference between sync (one thread per request) and
+  async (one event loop for many requests) web servers
+- Write async endpoints with async def / await
+- Talk to SQLite without blocking the event loop
+
+SYNC VS ASYNC:
+In api_example.py (Flask), each request occupies a thread while it waits
+for the database. With async handlers, a request that is waiting for the
+database gives control back to the event loop ("await"), and the loop
+serves other requests in the meantime. One process can keep hundreds of
+requests in flight without hundreds of threads.
+
+Quart has the same API as Flask (routes, request, jsonify), so the code
+below should look familiar. aiosqlite runs sqlite3 in a background thread
+and lets us "await" each query.
+
+PREREQUISITES:
+    pip install quart aiosqlite
+
+HOW TO USE THIS FILE:
+1. Make sure you've run setup.py and completed the tasks table in
+   database/schemas/todo_schema.sql
+2. Run the development server:
+   python examples/async_api_example.py
+3. Or run it with several worker processes:
+   hypercorn examples.async_api_example:app --workers 4 --worker-class asyncio
+4. Test it just like api_example.py:
+   curl http://localhost:5000/api/tasks
+
+Note: Don't combine this with gevent/eventlet monkey-patching - mixing
+two concurrency models leads to hard-to-debug race conditions.
+"""
+
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import aiosqlite
+from quart import Quart, request, jsonify
+
+from config.database import DATABASE_CONFIG, get_database_path
+# task_row(): the same task checks as the Flask API, so both accept the same tasks
+from models.todo import ValidationError, task_row, validate_status
+
+
+# ============================================================================
+# APP SETUP
+# ============================================================================
+
+app = Quart(__name__)
+
+# Columns the endpoints return. Naming them (instead of SELECT *) keeps the
+# response the same if more columns are added to the table later
+TASK_COLUMNS = "id, title, description, status, created_at"
+
+
+@app.before_serving
+async def enable_wal():
+    """Switch the database to WAL mode once, before the first request."""
+    # WAL is stored in the database file, so one connection is enough
+    async with aiosqlite.connect(get_database_path()) as db:
+        await db.execute("PRAGMA journal_mode = WAL")
+
+
+@asynccontextmanager
+async def connect():
+    """
+    Open a database connection for one request.
+    
+    Every request gets its own connection. A single shared connection
+    would also share one transaction: while one request awaits, another
+    could commit (or roll back) the first request's half-done writes.
+    
+    Learning Notes:
+    - If the request fails, its uncommitted changes are rolled back
+      before the connection is closed
+    - Opening a SQLite connection is cheap (it's a local file, no network)
+    """
+    # timeout: how long to wait while another connection holds the write lock
+    async with aiosqlite.connect(get_database_path(), timeout=DATABASE_CONFIG["timeout"]) as db:
+        # Same settings as database/connection.py
+        db.row_factory = aiosqlite.Row
+        await db.execute("PRAGMA foreign_keys = ON")
+        await db.execute("PRAGMA synchronous = NORMAL")
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+
+
+def success_response(data: Any, status_code: int = 200) -> tuple:
+    """Create a successful JSON response (same shape as api_example.py)."""
+    return jsonify({"success": True, "data": data}), status_code
+
+
+def error_response(message: str, status_code: int = 400) -> tuple:
+    """Create an error JSON response (same shape as api_example.py)."""
+    return jsonify({"success": False, "error": message}), status_code
+
+
+# ============================================================================
+# TASK ENDPOINTS
+# ============================================================================
+
+@app.route('/api/tasks', methods=['GET'])
+async def get_tasks():
+    """GET /api/tasks - Retrieve all tasks (optional ?status= filter)"""
+    try:
+        status = request.args.get('status')
+
+        if status:
+            validate_status(status)
+            query, params = f"SELECT {TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY created_at DESC", (status,)
+        else:
+            query, params = f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY created_at DESC", ()
+
+        # "await" pauses this request (not the whole server) until SQLite answers
+        async with connect() as db:
+            async with db.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+
+        return success_response([dict(row) for row in rows])
+
+    except ValidationError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Failed to retrieve tasks: {str(e)}", 500)
+
+
+@app.route('/api/tasks/<int:task_id>', methods=['GET'])
+async def get_task(task_id: int):
+    """GET /api/tasks/<id> - Retrieve a specific task"""
+    try:
+        async with connect() as db:
+            async with db.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)) as cursor:
+                row = await cursor.fetchone()
+
+        if row is None:
+            return error_response(f"Task with ID {task_id} not found", 404)
+
+        return success_response(dict(row))
+
+    except Exception as e:
+        return error_response(f"Failed to retrieve task: {str(e)}", 500)
+
+
+@app.route('/api/tasks', methods=['POST'])
+async def create_task():
+    """POST /api/tasks - Create a new task from {"title": ..., "description": ...}"""
+    try:
+        # In Quart, reading the request body is awaited too
+        # (silent=True: None for a missing or invalid body, as in api_example.py)
+        data = await request.get_json(silent=True)
+
+        if not isinstance(data, dict) or not data:
+            return error_response("Request body must be a JSON object", 400)
+
+        async with connect() as db:
+            cursor = await db.execute(
+                "INSERT INTO tasks (title, description) VALUES (?, ?)",
+                task_row(data)
+            )
+            await db.commit()
+
+        return success_response({
+            "id": cursor.lastrowid,
+            "message": "Task created successfully"
+        }, 201)
+
+    except ValidationError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Failed to create task: {str(e)}", 500)
+
+
+@app.route('/api/tasks/<int:task_id>', methods=['PUT'])
+async def update_task(task_id: int):
+    """PUT /api/tasks/<id> - Update a task's status from {"status": ...}"""
+    try:
+        data = await request.get_json(silent=True)
+
+        if not isinstance(data, dict) or 'status' not in data:
+            return error_response("Request body must be a JSON object with a 'status' field", 400)
+
+        validate_status(data['status'])
+
+        async with connect() as db:
+            cursor = await db.execute(
+                "UPDATE tasks SET status = ? WHERE id = ?",
+                (data['status'], task_id)
+            )
+            await db.commit()
+
+        if cursor.rowcount == 0:
+            return error_response(f"Task with ID {task_id} not found", 404)
+
+        return success_response({"id": task_id, "message": "Task updated successfully"})
+
+    except ValidationError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Failed to update task: {str(e)}", 500)
+
+
+@app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
+async def delete_task(task_id: int):
+    """DELETE /api/tasks/<id> - Delete a task"""
+    try:
+        async with connect() as db:
+            cursor = await db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            await db.commit()
+
+        if cursor.rowcount == 0:
+            return error_response(f"Task with ID {task_id} not found", 404)
+
+        return success_response({"id": task_id, "message": "Task deleted successfully"})
+
+    except Exception as e:
+        return error_response(f"Failed to delete task: {str(e)}", 500)
+
+
+# ============================================================================
+# SCRIPT ENTRY POINT
+# ============================================================================
+
+def main():
+    """
+    Start the Quart development server.
+
+    For several worker processes, use hypercorn instead (see the top of this file).
+    """
+    print("\nStarting async Task API on http://localhost:5000")
+    print("Press Ctrl+C to stop the server\n")
+    app.run(host='0.0.0.0', port=5000)
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,8 @@ HOW TO USE THIS FILE:
 """
 
 import argparse
+import functools
+import io
 import sys
 from typing import Optional
 
@@ -46,6 +48,19 @@ from models.library import Book, Member, Loan, ValidationError, DuplicateError,
 from models.todo import Task
 
 
+def fit(text: str, width: int) -> str:
+    """
+    Shorten text to at most `width` characters for a table column.
+    
+    Long values end in "..." so it's clear they were cut, e.g.
+    fit("A Very Long Book Title", 10) -> "A Very ..."
+    """
+    # Most values fit: return them untouched, without building a new string
+    if len(text) <= width:
+        return text
+    return text[:width - 3] + "..."
+
+
 # ============================================================================
 # LIBRARY SYSTEM COMMANDS (Complete Examples)
 # ============================================================================
@@ -99,18 +114,22 @@ def cmd_list_books(args) -> None:
             print("No books found.")
             return
         
-        print(f"\n{'ID':<5} {'Title':<40} {'Author':<25} {'Status':<12}")
-        print("-" * 85)
+        # Collect the whole table in memory and write it out once:
+        # one print() per row means one write (and one stdout lock) per row
+        buf = io.StringIO()
+        buf.write(f"\n{'ID':<5} {'Title':<40} {'Author':<25} {'Status':<12}\n")
+        buf.write("-" * 85 + "\n")
         
         for book in books:
             status = "Available" if book['available'] else "Checked Out"
             # Truncate long titles/authors for display
-            title = book['title'][:37] + "..." if len(book['title']) > 40 else book['title']
-            author = book['author'][:22] + "..." if len(book['author']) > 25 else book['author']
+            title = fit(book['title'], 40)
+            author = fit(book['author'], 25)
             
-            print(f"{book['id']:<5} {title:<40} {author:<25} {status:<12}")
+            buf.write(f"{book['id']:<5} {title:<40} {author:<25} {status:<12}\n")
         
-        print(f"\nTotal: {len(books)} book(s)")
+        buf.write(f"\nTotal: {len(books)} book(s)\n")
+        sys.stdout.write(buf.getvalue())
         
     except Exception as e:
         print(f"✗ Error listing books: {e}", file=sys.stderr)
@@ -133,16 +152,18 @@ def cmd_search_books(args) -> None:
             print(f"No books found matching '{args.query}' in {args.field}")
             return
         
-        print(f"\nSearch results for '{args.query}' in {args.field}:")
-        print(f"{'ID':<5} {'Title':<40} {'Author':<25}")
-        print("-" * 70)
+        buf = io.StringIO()
+        buf.write(f"\nSearch results for '{args.query}' in {args.field}:\n")
+        buf.write(f"{'ID':<5} {'Title':<40} {'Author':<25}\n")
+        buf.write("-" * 70 + "\n")
         
         for book in books:
-            title = book['title'][:37] + "..." if len(book['title']) > 40 else book['title']
-            author = book['author'][:22] + "..." if len(book['author']) > 25 else book['author']
-            print(f"{book['id']:<5} {title:<40} {author:<25}")
+            title = fit(book['title'], 40)
+            author = fit(book['author'], 25)
+            buf.write(f"{book['id']:<5} {title:<40} {author:<25}\n")
         
-        print(f"\nFound: {len(books)} book(s)")
+        buf.write(f"\nFound: {len(books)} book(s)\n")
+        sys.stdout.write(buf.getvalue())
         
     except Exception as e:
         print(f"✗ Error searching books: {e}", file=sys.stderr)
@@ -214,15 +235,17 @@ def cmd_list_members(args) -> None:
             print("No members found.")
             return
         
-        print(f"\n{'ID':<5} {'Name':<30} {'Email':<35} {'Join Date':<12}")
-        print("-" * 85)
+        buf = io.StringIO()
+        buf.write(f"\n{'ID':<5} {'Name':<30} {'Email':<35} {'Join Date':<12}\n")
+        buf.write("-" * 85 + "\n")
         
         for member in members:
-            name = member['name'][:27] + "..." if len(member['name']) > 30 else member['name']
-            email = member['email'][:32] + "..." if len(member['email']) > 35 else member['email']
-            print(f"{member['id']:<5} {name:<30} {email:<35} {member['join_date']:<12}")
+            name = fit(member['name'], 30)
+            email = fit(member['email'], 35)
+            buf.write(f"{member['id']:<5} {name:<30} {email:<35} {member['join_date']:<12}\n")
         
-        print(f"\nTotal: {len(members)} member(s)")
+        buf.write(f"\nTotal: {len(members)} member(s)\n")
+        sys.stdout.write(buf.getvalue())
         
     except Exception as e:
         print(f"✗ Error listing members: {e}", file=sys.stderr)
@@ -323,12 +346,18 @@ def cmd_delete_task(args) -> None:
 # ARGUMENT PARSER SETUP
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Create and configure the argument parser.
     
     This function sets up all commands and their arguments.
     Study this to understand how argparse works!
+    
+    Learning Note:
+    - Building a parser with many subcommands takes a moment; lru_cache
+      builds it on the first call and returns the same parser afterwards
+      (handy when main() is called many times, e.g. from tests)
     """
     
     # Main parser
@@ -452,18 +481,22 @@ def create_parser() -> argparse.ArgumentParser:
 # MAIN FUNCTION
 # ============================================================================
 
-def main():
+def main(argv: Optional[list] = None):
     """
     Main entry point for the CLI application.
     
     This function:
-    1. Creates the argument parser
+    1. Gets the (cached) argument parser
     2. Parses command-line arguments
     3. Calls the appropriate command function
+    
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:], e.g.
+              main(["list-books"]) from a script or test
     """
     
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # If no command specified, show help
     if not args.command:
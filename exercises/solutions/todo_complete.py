@@ -33,14 +33,21 @@ IMPORTANT: This solution file is meant for reference and study.
 To use it in your project, you would integrate the patterns into models/todo.py
 """
 
+import contextlib
+import functools
+import re
 import sqlite3
-from typing import Optional, List, Dict, Any
-from datetime import datetime, date
+from collections import namedtuple
+from typing import Optional, List, Dict, Any, Iterator, Callable
+from datetime import datetime, date, timezone
 
 # Import database connection utilities
 # Note: These imports assume you're running from the project root directory
 try:
-    from database.connection import execute_query, execute_insert, execute_update, QueryExecutionError
+    from database.connection import (
+        execute_query, execute_query_rows, iter_query, execute_insert, execute_insert_many,
+        execute_update, execute_many, execute_script, transaction, QueryExecutionError
+    )
 except ModuleNotFoundError:
     # If running from a different directory, provide a helpful message
     import sys
@@ -74,6 +81,18 @@ class NotFoundError(Exception):
 # Validation Helper Functions
 # ============================================================================
 
+# Allowed values, defined once when the module loads.
+# The tuples keep a fixed order for error messages; the frozensets give
+# fast "is it allowed?" checks (a hash lookup instead of scanning a list).
+STATUS_CHOICES = ("pending", "in_progress", "completed")
+PRIORITY_CHOICES = ("low", "medium", "high")
+ALLOWED_STATUSES = frozenset(STATUS_CHOICES)
+ALLOWED_PRIORITIES = frozenset(PRIORITY_CHOICES)
+
+# Shape of a YYYY-MM-DD date, compiled once. [0-9] rather than \d, because
+# \d also matches non-ASCII digits such as '٣'.
+DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
 def validate_not_empty(value: str, field_name: str) -> None:
     """
     Validate that a string field is not empty or whitespace-only.
@@ -99,10 +118,9 @@ def validate_status(status: str) -> None:
     Raises:
         ValidationError: If status is not one of the allowed values
     """
-    allowed_statuses = ["pending", "in_progress", "completed"]
-    if status not in allowed_statuses:
+    if status not in ALLOWED_STATUSES:
         raise ValidationError(
-            f"Status must be one of: {', '.join(allowed_statuses)}. "
+            f"Status must be one of: {', '.join(STATUS_CHOICES)}. "
             f"Got: '{status}'"
         )
 
@@ -119,14 +137,12 @@ def validate_priority(priority: str) -> None:
     Raises:
         ValidationError: If priority is not one of the allowed values
     """
-    # Define the allowed priority values
-    allowed_priorities = ["low", "medium", "high"]
-    
-    # Check if the provided priority is in the allowed list
-    if priority not in allowed_priorities:
+    # Check if the provided priority is one of the allowed values
+    # (ALLOWED_PRIORITIES is built once at module level, not on every call)
+    if priority not in ALLOWED_PRIORITIES:
         # Raise a clear error message showing what values are allowed
         raise ValidationError(
-            f"Priority must be one of: {', '.join(allowed_priorities)}. "
+            f"Priority must be one of: {', '.join(PRIORITY_CHOICES)}. "
             f"Got: '{priority}'"
         )
 
@@ -152,6 +168,35 @@ def validate_title_length(title: str) -> None:
         raise ValidationError("Title must be at most 200 characters long")
 
 
+# Longest title we accept (same limit as validate_title_length)
+TITLE_MAX_LENGTH = 200
+
+
+def validate_title(title: str) -> None:
+    """
+    Validate a task title in one step: not empty and not too long.
+    
+    Does the same job as calling validate_not_empty() and then
+    validate_title_length(), with the same error messages, but valid titles
+    (the usual case) pass a single check instead of two function calls.
+    Used by Task.create(), Task.create_many() and Task.update().
+    
+    Args:
+        title: The title to validate
+        
+    Raises:
+        ValidationError: If title is None, blank, or longer than 200 characters
+    """
+    # Fast path: one combined test for a good title
+    if title and title.strip() and len(title) <= TITLE_MAX_LENGTH:
+        return
+    
+    # Only failures get here - work out which message to show
+    if not title or not title.strip():
+        raise ValidationError("Title cannot be empty")
+    raise ValidationError(f"Title must be at most {TITLE_MAX_LENGTH} characters long")
+
+
 def validate_due_date(due_date: str) -> None:
     """
     Validate that due_date is in the correct format and is a valid date.
@@ -165,9 +210,15 @@ def validate_due_date(due_date: str) -> None:
     Raises:
         ValidationError: If date format is invalid
     """
+    # Step 1: Check the shape. date.fromisoformat() alone would also accept
+    # other ISO forms such as "20240131", which we don't want to store
+    if not isinstance(due_date, str) or not DATE_PATTERN.fullmatch(due_date):
+        raise ValidationError("Due date must be in YYYY-MM-DD format")
+    
+    # Step 2: Check that it's a real date (e.g. no 2024-02-30).
+    # date.fromisoformat() is implemented in C and much faster than strptime()
     try:
-        # Try to parse the date string
-        datetime.strptime(due_date, "%Y-%m-%d")
+        date.fromisoformat(due_date)
     except ValueError:
         raise ValidationError("Due date must be in YYYY-MM-DD format")
 
@@ -176,6 +227,228 @@ def validate_due_date(due_date: str) -> None:
 # Task Model Class - Complete Implementation
 # ============================================================================
 
+# A task as a lightweight, read-only tuple: task.title instead of
+# task['title']. Creating a tuple per row is cheaper than a dictionary
+# and uses less memory, which matters for long lists.
+# Use Task.get_all_rows() to get these; use the dictionary methods when
+# the result is going to be turned into JSON.
+TaskRow = namedtuple(
+    'TaskRow',
+    'id title description status priority due_date created_at category_id'
+)
+
+# Every read names its columns instead of using SELECT *:
+# - SQLite only reads the columns we ask for
+# - the result has the same columns (in the same order) however the
+#   schema was written, which TaskRow relies on
+# - a query that only needs indexed columns can be answered from the
+#   index alone (see get_all_summary())
+_TASK_COLUMNS = ", ".join(TaskRow._fields)
+# The same columns prefixed with "tasks.", for queries that JOIN categories
+_TASK_COLUMNS_QUALIFIED = ", ".join(f"tasks.{column}" for column in TaskRow._fields)
+# What a list view needs - see Task.get_all_summary()
+_TASK_SUMMARY_COLUMNS = "id, title, status, priority, due_date"
+_CATEGORY_COLUMNS = "id, name, created_at"
+
+# The SQL used by the Task methods, written out once when the module loads
+# instead of being rebuilt on every call. Sending the identical SQL text
+# each time also lets the connection reuse its prepared statement.
+_SQL_GET_TASK_BY_ID = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+
+# get_all() and get_all_rows() only ever run one of these two statements
+_SQL_TASKS_ALL = f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY created_at DESC"
+# Uses idx_tasks_status_created (see _SQL_CREATE_TASK_INDEXES below)
+_SQL_TASKS_BY_STATUS = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY created_at DESC"
+)
+
+# get_all_summary(): with a status filter, idx_tasks_status_created
+# contains every column asked for, so SQLite never reads the table itself
+_SQL_TASK_SUMMARIES_ALL = (
+    f"SELECT {_TASK_SUMMARY_COLUMNS} FROM tasks ORDER BY created_at DESC"
+)
+_SQL_TASK_SUMMARIES_BY_STATUS = (
+    f"SELECT {_TASK_SUMMARY_COLUMNS} FROM tasks WHERE status = ? ORDER BY created_at DESC"
+)
+
+# Uses idx_tasks_priority_created
+_SQL_TASKS_BY_PRIORITY = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE priority = ? ORDER BY created_at DESC"
+)
+
+# Uses idx_tasks_open_due. Today's date is passed in as a parameter
+# (see _today() below) instead of calling date('now') inside the query,
+# so the WHERE clause is a plain "column < value" range on the index.
+_SQL_OVERDUE_TASKS = f"""
+    SELECT {_TASK_COLUMNS} FROM tasks
+    WHERE due_date < ?
+    AND status != 'completed'
+    ORDER BY due_date ASC
+"""
+
+# Shared by create() and create_many()
+_SQL_INSERT_TASK = """
+    INSERT INTO tasks (title, description, status, priority, due_date)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_TASK_STATUS = "UPDATE tasks SET status = ? WHERE id = ?"
+
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+# Indexes that match the queries above. Without them, every filtered
+# query reads the whole table and then sorts the matches in memory.
+# With them, SQLite jumps straight to the matching rows, and they are
+# already in the order the query asks for.
+#
+# - idx_tasks_status_created: WHERE status = ? ORDER BY created_at DESC.
+#   It also stores title, priority and due_date (id comes for free), so
+#   it "covers" get_all_summary(status=...): the answer is read from the
+#   index alone. The price is a bigger index to update on every write.
+# - idx_tasks_priority_created: WHERE priority = ? ORDER BY created_at DESC
+# - idx_tasks_open_due: a *partial* index that only contains unfinished
+#   tasks, sorted by due date. An index on (status, due_date) would not
+#   help get_overdue(), because "status != 'completed'" is not an
+#   equality test. The partial index's WHERE matches the query's exactly,
+#   so SQLite can use it for both the filter and the ORDER BY.
+_SQL_CREATE_TASK_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_tasks_status_created
+        ON tasks(status, created_at DESC, title, priority, due_date);
+    CREATE INDEX IF NOT EXISTS idx_tasks_priority_created
+        ON tasks(priority, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_tasks_open_due
+        ON tasks(due_date) WHERE status != 'completed';
+"""
+
+
+def create_task_indexes() -> None:
+    """
+    Create the indexes used by Task.get_all(), get_by_priority() and get_overdue().
+    
+    Safe to call more than once (IF NOT EXISTS). Call it once at startup,
+    after the schema has been created.
+    
+    Raises:
+        QueryExecutionError: If the tasks table is missing the status,
+            priority or due_date columns (schema TODOs not completed yet)
+    
+    Learning Notes:
+    - Check that an index is used with EXPLAIN QUERY PLAN: you want to see
+      "SEARCH tasks USING INDEX ...", not "SCAN tasks"
+    - Indexes make reads faster but every INSERT/UPDATE has to update them
+      too, so only add the ones your queries actually use
+    """
+    execute_script(_SQL_CREATE_TASK_INDEXES)
+
+
+# ----------------------------------------------------------------------------
+# Cached lookups by ID
+# ----------------------------------------------------------------------------
+# The same task or category is often read many times in a row (e.g. a
+# dashboard refreshing). lru_cache remembers up to 1024 results per process,
+# so repeated reads skip the database. Every method that changes tasks or
+# categories calls cache_clear() afterwards, so the cache never serves stale
+# rows - as long as all writes go through this module.
+
+@functools.lru_cache(maxsize=1024)
+def _get_task_cached(task_id: int) -> Optional[Dict[str, Any]]:
+    """Task row by ID (None if missing), remembered until the next write."""
+    results = execute_query(_SQL_GET_TASK_BY_ID, (task_id,))
+    return results[0] if results else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_category_cached(category_id: int) -> Optional[Dict[str, Any]]:
+    """Category row by ID (None if missing), remembered until the next write."""
+    results = execute_query(
+        f"SELECT {_CATEGORY_COLUMNS} FROM categories WHERE id = ?", (category_id,)
+    )
+    return results[0] if results else None
+
+
+def _today() -> str:
+    """
+    Today's date as 'YYYY-MM-DD', the format due_date is stored in.
+    
+    Uses UTC, like SQLite's date('now') which the overdue query used
+    before, so a task does not become overdue at a different moment
+    depending on the server's time zone.
+    """
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _iter_tasks(query: str, params: tuple, error_message: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of a task query as dictionaries, a chunk at a time.
+    
+    Shared by Task.iter_all() and Task.iter_overdue(). iter_query() keeps
+    the connection until the loop finishes and fetches 256 rows per trip.
+    """
+    try:
+        for row in iter_query(query, params, chunk=256):
+            yield dict(row)
+    except QueryExecutionError as e:
+        raise QueryExecutionError(f"{error_message}: {str(e)}")
+
+
+def _task_write(sql: str, execute: Callable[[str, tuple], int], action: str) -> Callable[[tuple], int]:
+    """
+    Build the function that runs one fixed Task write statement.
+    
+    create(), update_status() and delete() only differ in their SQL, the
+    helper that runs it and the error message. Instead of repeating the
+    same try/except/cache_clear() block in each method, we build one small
+    function per statement when the module loads. The methods keep their
+    validation and just call it with the parameters.
+    
+    Args:
+        sql: The statement to run (one of the _SQL_* constants)
+        execute: execute_insert (returns the new ID) or execute_update
+                 (returns the number of affected rows)
+        action: What the statement does, for the error message
+        
+    Returns:
+        A function that takes the parameter tuple and returns what
+        `execute` returned
+    """
+    # Built once here, not on every call
+    error_prefix = f"Failed to {action}: "
+    
+    def write(params: tuple) -> int:
+        try:
+            result = execute(sql, params)
+        except QueryExecutionError as e:
+            raise QueryExecutionError(error_prefix + str(e))
+        # Every write can change what get_by_id() should return
+        _get_task_cached.cache_clear()
+        return result
+    
+    return write
+
+
+# One function per write statement, used by the Task methods below
+_insert_task = _task_write(_SQL_INSERT_TASK, execute_insert, "create task")
+_set_task_status = _task_write(_SQL_UPDATE_TASK_STATUS, execute_update, "update task status")
+_delete_task = _task_write(_SQL_DELETE_TASK, execute_update, "delete task")
+
+
+# The fields Task.update() is allowed to change, built once
+_ALLOWED_UPDATE_FIELDS = frozenset({"title", "description", "status", "priority", "due_date"})
+
+
+@functools.lru_cache(maxsize=64)
+def _update_sql(fields: frozenset) -> str:
+    """
+    UPDATE statement for Task.update() that sets exactly `fields`.
+    
+    There are only 31 possible combinations of the five updatable fields,
+    so each statement is built once and then reused. Columns appear in
+    sorted order - the parameters must be passed in that order too.
+    """
+    set_clauses = ", ".join(f"{field} = ?" for field in sorted(fields))
+    return f"UPDATE tasks SET {set_clauses} WHERE id = ?"
+
+
 class Task:
     """
     Complete implementation of the Task model with all CRUD operations.
@@ -193,8 +466,8 @@ class Task:
         """
         Retrieve a single task by its ID.
         
-        This method is the same as in the exercise file - it's provided
-        as a complete reference example.
+        Works like the exercise file's version, but results are cached
+        (see _get_task_cached above).
         
         Args:
             task_id: The ID of the task to retrieve
@@ -205,11 +478,10 @@ class Task:
         Raises:
             QueryExecutionError: If database operation fails
         """
-        query = "SELECT * FROM tasks WHERE id = ?"
-        
         try:
-            results = execute_query(query, (task_id,))
-            return results[0] if results else None
+            task = _get_task_cached(task_id)
+            # Hand out a copy: a caller changing its dict must not change the cache
+            return dict(task) if task is not None else None
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to retrieve task: {str(e)}")
     
@@ -255,8 +527,7 @@ class Task:
         
         try:
             # Validate title (required field)
-            validate_not_empty(title, "Title")
-            validate_title_length(title)
+            validate_title(title)
             
             # Validate status (must be one of allowed values)
             validate_status(status)
@@ -274,29 +545,77 @@ class Task:
             raise ValidationError(f"Invalid task data: {str(e)}")
         
         # ====================================================================
-        # STEP 2: Prepare the SQL INSERT query
+        # STEP 2: Execute the INSERT and return the new task ID
         # ====================================================================
-        # We use ? placeholders for all values to prevent SQL injection.
-        # NEVER use f-strings or string concatenation for SQL queries!
-        
-        query = """
-            INSERT INTO tasks (title, description, status, priority, due_date)
-            VALUES (?, ?, ?, ?, ?)
+        # _insert_task runs _SQL_INSERT_TASK (? placeholders for all values -
+        # NEVER use f-strings or string concatenation for SQL queries!),
+        # adds "Failed to create task" to any database error and clears
+        # the get_by_id() cache. See _task_write above the class.
+        return _insert_task((title, description, status, priority, due_date))
+    
+    @staticmethod
+    def create_many(tasks: List[Dict[str, Any]]) -> List[int]:
         """
+        Create several tasks at once, in a single transaction.
+        
+        SOLUTION: This shows how to batch many INSERTs together.
+        
+        Key points in this solution:
+        1. EVERY task is validated before anything is written
+        2. All rows go through one prepared INSERT (executemany)
+        3. There's one commit for the whole batch instead of one per task
+        4. If any row fails, no task is saved (all or nothing)
+        
+        Args:
+            tasks: List of dictionaries with the same keys as create()'s
+                   arguments, e.g. [{"title": "Buy milk", "priority": "high"}]
+            
+        Returns:
+            List[int]: The IDs of the new tasks, in the same order
+            
+        Raises:
+            ValidationError: If any task is invalid (message says which one)
+            QueryExecutionError: If database operation fails
         
+        Example:
+            >>> ids = Task.create_many([
+            ...     {"title": "Write report", "due_date": "2024-06-01"},
+            ...     {"title": "Call Sam", "priority": "high"},
+            ... ])
+        """
         # ====================================================================
-        # STEP 3: Execute the query and return the new task ID
+        # STEP 1: Validate every task and build its parameter tuple
         # ====================================================================
-        # We wrap the database operation in try-except to handle errors.
+        rows = []
+        for position, task in enumerate(tasks, start=1):
+            title = task.get("title")
+            status = task.get("status", "pending")
+            priority = task.get("priority", "medium")
+            due_date = task.get("due_date")
+            
+            try:
+                validate_title(title)
+                validate_status(status)
+                validate_priority(priority)
+                if due_date is not None:
+                    validate_due_date(due_date)
+            except ValidationError as e:
+                raise ValidationError(f"Invalid data for task #{position}: {str(e)}")
+            
+            rows.append((title, task.get("description"), status, priority, due_date))
+        
+        if not rows:
+            return []
         
+        # ====================================================================
+        # STEP 2: Insert all rows in one transaction
+        # ====================================================================
         try:
-            # Execute the insert and get the new task's ID
-            task_id = execute_insert(query, (title, description, status, priority, due_date))
-            return task_id
-            
+            task_ids = execute_insert_many(_SQL_INSERT_TASK, rows)
+            _get_task_cached.cache_clear()
+            return task_ids
         except QueryExecutionError as e:
-            # Provide context about what operation failed
-            raise QueryExecutionError(f"Failed to create task: {str(e)}")
+            raise QueryExecutionError(f"Failed to create tasks: {str(e)}")
     
     @staticmethod
     def get_all(status: str = None) -> List[Dict[str, Any]]:
@@ -307,10 +626,10 @@ class Task:
         
         Key points in this solution:
         1. We validate the status parameter if it's provided
-        2. We build the query dynamically based on whether filtering is needed
-        3. We use a list for parameters and convert to tuple when executing
-        4. We always sort by created_at descending (newest first)
-        5. We return an empty list if no tasks are found (not None)
+        2. We pick one of two prebuilt queries (_SQL_TASKS_ALL or
+           _SQL_TASKS_BY_STATUS) depending on whether filtering is needed
+        3. We always sort by created_at descending (newest first)
+        4. We return an empty list if no tasks are found (not None)
         
         Args:
             status: Optional status filter
@@ -332,31 +651,190 @@ class Task:
                 raise ValidationError(f"Invalid filter: {str(e)}")
         
         # ====================================================================
-        # STEP 2: Build the query dynamically
+        # STEP 2: Choose the query
         # ====================================================================
-        # Start with the base query
-        query = "SELECT * FROM tasks"
-        
-        # Add WHERE clause if filtering by status
-        params = []
-        if status is not None:
-            query += " WHERE status = ?"
-            params.append(status)
-        
-        # Always sort by created_at descending (newest first)
-        query += " ORDER BY created_at DESC"
+        # Only two shapes are possible, so there's nothing to build:
+        # with a filter we need the WHERE clause and one parameter
+        if status is None:
+            query, params = _SQL_TASKS_ALL, ()
+        else:
+            query, params = _SQL_TASKS_BY_STATUS, (status,)
         
         # ====================================================================
         # STEP 3: Execute the query and return results
         # ====================================================================
         try:
-            # Convert params list to tuple for execute_query
-            results = execute_query(query, tuple(params))
+            results = execute_query(query, params)
             return results  # Returns empty list [] if no results
             
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to retrieve tasks: {str(e)}")
     
+    @staticmethod
+    def get_all_rows(status: str = None) -> List[TaskRow]:
+        """
+        Like get_all(), but return TaskRow tuples instead of dictionaries.
+        
+        Same query, smaller and faster row objects - useful when you only
+        read the tasks in Python (reports, counting, sorting).
+        
+        Args:
+            status: Optional status filter
+            
+        Returns:
+            List of TaskRow tuples, newest first
+            
+        Raises:
+            ValidationError: If status is provided but invalid
+            QueryExecutionError: If database operation fails
+        
+        Example:
+            >>> for task in Task.get_all_rows(status='pending'):
+            ...     print(task.id, task.title)
+        
+        Learning Notes:
+        - Tuples can't be changed; use task._replace(status='completed')
+          to get a modified copy, or task._asdict() to get a dictionary
+        """
+        if status is not None:
+            try:
+                validate_status(status)
+            except ValidationError as e:
+                raise ValidationError(f"Invalid filter: {str(e)}")
+        
+        if status is None:
+            query, params = _SQL_TASKS_ALL, ()
+        else:
+            query, params = _SQL_TASKS_BY_STATUS, (status,)
+        
+        try:
+            return execute_query_rows(query, params, TaskRow)
+        except QueryExecutionError as e:
+            raise QueryExecutionError(f"Failed to retrieve tasks: {str(e)}")
+    
+    @staticmethod
+    def get_all_summary(status: str = None) -> List[Dict[str, Any]]:
+        """
+        Like get_all(), but only with the columns a task list shows:
+        id, title, status, priority and due_date.
+        
+        Leaving out description (the longest text) means less data to read
+        and send. With a status filter, all of these columns are stored in
+        idx_tasks_status_created, so SQLite answers from the index without
+        reading the table at all (a "covering index").
+        
+        Args:
+            status: Optional status filter
+            
+        Returns:
+            List of task summary dictionaries, newest first
+            
+        Raises:
+            ValidationError: If status is provided but invalid
+            QueryExecutionError: If database operation fails
+        
+        Learning Notes:
+        - EXPLAIN QUERY PLAN shows "USING COVERING INDEX" when the table
+          itself is skipped
+        """
+        if status is not None:
+            try:
+                validate_status(status)
+            except ValidationError as e:
+                raise ValidationError(f"Invalid filter: {str(e)}")
+        
+        if status is None:
+            query, params = _SQL_TASK_SUMMARIES_ALL, ()
+        else:
+            query, params = _SQL_TASK_SUMMARIES_BY_STATUS, (status,)
+        
+        try:
+            return execute_query(query, params)
+        except QueryExecutionError as e:
+            raise QueryExecutionError(f"Failed to retrieve tasks: {str(e)}")
+    
+    @staticmethod
+    def iter_all(status: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Like get_all(), but yield the tasks one at a time instead of
+        returning one big list.
+        
+        get_all() has to build every task dictionary before you see the
+        first one. For a large table that means waiting longer and holding
+        all rows in memory at once. iter_all() reads the rows from SQLite
+        in chunks, so you can start working right away and memory use stays
+        flat.
+        
+        Args:
+            status: Optional status filter
+            
+        Yields:
+            Task dictionaries, newest first
+            
+        Raises:
+            ValidationError: If status is provided but invalid (raised
+                immediately, before you start looping)
+            QueryExecutionError: If database operation fails (raised while
+                looping)
+        
+        Example:
+            >>> for task in Task.iter_all(status='pending'):
+            ...     print(task['title'])
+        
+        Learning Notes:
+        - The database connection stays checked out until the loop ends, so
+          finish (or break out of) the loop before doing other slow work
+        - Use get_all() when you need len() or want to loop twice
+        """
+        # Validate now, not on the first next() - otherwise a bad status
+        # would only be reported once somebody starts looping
+        if status is not None:
+            try:
+                validate_status(status)
+            except ValidationError as e:
+                raise ValidationError(f"Invalid filter: {str(e)}")
+        
+        if status is None:
+            return _iter_tasks(_SQL_TASKS_ALL, (), "Failed to retrieve tasks")
+        return _iter_tasks(_SQL_TASKS_BY_STATUS, (status,), "Failed to retrieve tasks")
+    
+    @staticmethod
+    def get_all_with_category(summary: bool = False) -> List[Dict[str, Any]]:
+        """
+        Retrieve all tasks together with the name of their category.
+        
+        Use this instead of calling Category.get_by_id() for every task:
+        one JOIN in the database replaces one extra query per task.
+        
+        Args:
+            summary: If True, only return id, title, status and
+                     category_name (less data to read and send, e.g. for
+                     a list view)
+            
+        Returns:
+            List of task dictionaries with a 'category_name' key
+            (None for tasks without a category), newest first
+            
+        Raises:
+            QueryExecutionError: If database operation fails
+        
+        Learning Notes:
+        - LEFT JOIN keeps tasks that have no category (category_id is NULL);
+          a plain JOIN would silently drop them
+        """
+        columns = "tasks.id, tasks.title, tasks.status" if summary else _TASK_COLUMNS_QUALIFIED
+        query = f"""
+            SELECT {columns}, categories.name AS category_name
+            FROM tasks
+            LEFT JOIN categories ON categories.id = tasks.category_id
+            ORDER BY tasks.created_at DESC
+        """
+        
+        try:
+            return execute_query(query, ())
+        except QueryExecutionError as e:
+            raise QueryExecutionError(f"Failed to retrieve tasks: {str(e)}")
+    
     @staticmethod
     def update_status(task_id: int, new_status: str) -> bool:
         """
@@ -391,28 +869,97 @@ class Task:
             raise ValidationError(f"Invalid status: {str(e)}")
         
         # ====================================================================
-        # STEP 2: Prepare the UPDATE query
+        # STEP 2: Execute the update and check if task was found
         # ====================================================================
-        # Update the status field for the task with the given ID
-        query = """
-            UPDATE tasks
-            SET status = ?
-            WHERE id = ?
+        # UPDATE tasks SET status = ? WHERE id = ? (see _set_task_status)
+        affected_rows = _set_task_status((new_status, task_id))
+        
+        # If affected_rows is 0, the task_id didn't exist
+        # If affected_rows is 1, the task was updated successfully
+        return affected_rows > 0
+    
+    @staticmethod
+    @contextlib.contextmanager
+    def transaction() -> Iterator[None]:
         """
+        Group several Task writes into one transaction with a single commit.
         
-        # ====================================================================
-        # STEP 3: Execute the update and check if task was found
-        # ====================================================================
+        Each create(), update_status() or delete() normally commits on its
+        own, and every commit waits for the disk. Inside this block they
+        are committed together at the end - or all undone if an error
+        escapes the block.
+        
+        Raises:
+            QueryExecutionError: If the transaction cannot be committed
+        
+        Example:
+            >>> with Task.transaction():
+            ...     task_id = Task.create("Write report")
+            ...     Task.update_status(task_id, "in_progress")
+            ...     Task.delete(old_task_id)
+        
+        Learning Notes:
+        - create_many() and bulk_update_status() already use a single
+          transaction on their own; this is for mixing different writes
+        - get_by_id() inside the block can see (and cache) changes that
+          are later rolled back, so the caches are cleared when the block
+          ends, whatever happened
+        """
         try:
-            # Execute the update
-            affected_rows = execute_update(query, (new_status, task_id))
+            with transaction():
+                yield
+        finally:
+            _get_task_cached.cache_clear()
+            _get_category_cached.cache_clear()
+    
+    @staticmethod
+    def bulk_update_status(task_ids: List[int], new_status: str) -> int:
+        """
+        Set the same status on many tasks at once (e.g. "complete all selected").
+        
+        Calling update_status() in a loop validates the status, runs the
+        UPDATE and commits once per task. This validates once and runs every
+        UPDATE in a single transaction, with a single commit.
+        
+        Args:
+            task_ids: IDs of the tasks to update
+            new_status: New status value for all of them
             
-            # If affected_rows is 0, the task_id didn't exist
-            # If affected_rows is 1, the task was updated successfully
-            return affected_rows > 0
+        Returns:
+            int: Number of tasks updated (IDs that don't exist are skipped)
             
+        Raises:
+            ValidationError: If new_status is invalid
+            QueryExecutionError: If database operation fails (no task is
+                updated in that case)
+        
+        Example:
+            >>> Task.bulk_update_status([1, 2, 5], 'completed')
+            3
+        
+        Learning Notes:
+        - We reuse the prepared "UPDATE ... WHERE id = ?" statement once per
+          ID instead of building "WHERE id IN (?, ?, ...)". That keeps the
+          SQL text fixed and avoids SQLite's limit on the number of ?
+          placeholders in one statement, however many IDs there are
+        """
+        try:
+            validate_status(new_status)
+        except ValidationError as e:
+            raise ValidationError(f"Invalid status: {str(e)}")
+        
+        if not task_ids:
+            return 0
+        
+        try:
+            affected_rows = execute_many(
+                _SQL_UPDATE_TASK_STATUS,
+                ((new_status, task_id) for task_id in task_ids)
+            )
+            _get_task_cached.cache_clear()
+            return affected_rows
         except QueryExecutionError as e:
-            raise QueryExecutionError(f"Failed to update task status: {str(e)}")
+            raise QueryExecutionError(f"Failed to update task statuses: {str(e)}")
     
     @staticmethod
     def update(task_id: int, **kwargs) -> bool:
@@ -441,11 +988,10 @@ class Task:
             # Update multiple fields
             Task.update(1, title="New title", status="completed", priority="high")
         """
-        # Define allowed fields that can be updated
-        allowed_fields = ["title", "description", "status", "priority", "due_date"]
-        
-        # Filter kwargs to only include allowed fields
-        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        # Keep only the fields that may be updated (_ALLOWED_UPDATE_FIELDS).
+        # "&" on dict keys and a set gives the names present in both,
+        # without a Python-level loop over every keyword argument
+        updates = {k: kwargs[k] for k in kwargs.keys() & _ALLOWED_UPDATE_FIELDS}
         
         if not updates:
             raise ValidationError("No valid fields provided for update")
@@ -453,8 +999,7 @@ class Task:
         # Validate each field being updated
         try:
             if "title" in updates:
-                validate_not_empty(updates["title"], "Title")
-                validate_title_length(updates["title"])
+                validate_title(updates["title"])
             
             if "status" in updates:
                 validate_status(updates["status"])
@@ -468,15 +1013,17 @@ class Task:
         except ValidationError as e:
             raise ValidationError(f"Invalid update data: {str(e)}")
         
-        # Build the UPDATE query dynamically
-        set_clauses = [f"{field} = ?" for field in updates.keys()]
-        query = f"UPDATE tasks SET {', '.join(set_clauses)} WHERE id = ?"
+        # Get the UPDATE query for this combination of fields
+        # (built on first use, then cached - see _update_sql above)
+        fields = frozenset(updates)
+        query = _update_sql(fields)
         
-        # Build parameters list: field values + task_id
-        params = list(updates.values()) + [task_id]
+        # Parameters in the same (sorted) order as the SET clauses, then task_id
+        params = tuple(updates[field] for field in sorted(fields)) + (task_id,)
         
         try:
-            affected_rows = execute_update(query, tuple(params))
+            affected_rows = execute_update(query, params)
+            _get_task_cached.cache_clear()
             return affected_rows > 0
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to update task: {str(e)}")
@@ -504,25 +1051,16 @@ class Task:
             QueryExecutionError: If database operation fails
         """
         # ====================================================================
-        # STEP 1: Prepare the DELETE query
+        # Execute the deletion and check if task was found
         # ====================================================================
         # CRITICAL: Always include WHERE clause!
         # DELETE without WHERE would delete ALL tasks!
-        query = "DELETE FROM tasks WHERE id = ?"
+        # (DELETE FROM tasks WHERE id = ?, see _delete_task)
+        affected_rows = _delete_task((task_id,))
         
-        # ====================================================================
-        # STEP 2: Execute the deletion and check if task was found
-        # ====================================================================
-        try:
-            # Execute the delete
-            affected_rows = execute_update(query, (task_id,))
-            
-            # If affected_rows is 0, the task_id didn't exist
-            # If affected_rows is 1, the task was deleted successfully
-            return affected_rows > 0
-            
-        except QueryExecutionError as e:
-            raise QueryExecutionError(f"Failed to delete task: {str(e)}")
+        # If affected_rows is 0, the task_id didn't exist
+        # If affected_rows is 1, the task was deleted successfully
+        return affected_rows > 0
     
     @staticmethod
     def get_by_priority(priority: str) -> List[Dict[str, Any]]:
@@ -548,14 +1086,8 @@ class Task:
             raise ValidationError(f"Invalid priority: {str(e)}")
         
         # Query for tasks with the specified priority
-        query = """
-            SELECT * FROM tasks
-            WHERE priority = ?
-            ORDER BY created_at DESC
-        """
-        
         try:
-            results = execute_query(query, (priority,))
+            results = execute_query(_SQL_TASKS_BY_PRIORITY, (priority,))
             return results
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to retrieve tasks by priority: {str(e)}")
@@ -573,18 +1105,24 @@ class Task:
         Raises:
             QueryExecutionError: If database operation fails
         """
-        query = """
-            SELECT * FROM tasks
-            WHERE due_date < date('now')
-            AND status != 'completed'
-            ORDER BY due_date ASC
-        """
-        
         try:
-            results = execute_query(query, ())
+            results = execute_query(_SQL_OVERDUE_TASKS, (_today(),))
             return results
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to retrieve overdue tasks: {str(e)}")
+    
+    @staticmethod
+    def iter_overdue() -> Iterator[Dict[str, Any]]:
+        """
+        Like get_overdue(), but yield the tasks one at a time (see iter_all()).
+        
+        Yields:
+            Overdue task dictionaries, earliest due date first
+            
+        Raises:
+            QueryExecutionError: If database operation fails
+        """
+        return _iter_tasks(_SQL_OVERDUE_TASKS, (_today(),), "Failed to retrieve overdue tasks")
 
 
 # ============================================================================
@@ -626,6 +1164,7 @@ class Category:
         
         try:
             category_id = execute_insert(query, (name,))
+            _get_category_cached.cache_clear()
             return category_id
         except sqlite3.IntegrityError:
             # UNIQUE constraint failed - category name already exists
@@ -635,19 +1174,17 @@ class Category:
     
     @staticmethod
     def get_by_id(category_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve a category by ID."""
-        query = "SELECT * FROM categories WHERE id = ?"
-        
+        """Retrieve a category by ID (cached, see _get_category_cached above)."""
         try:
-            results = execute_query(query, (category_id,))
-            return results[0] if results else None
+            category = _get_category_cached(category_id)
+            return dict(category) if category is not None else None
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to retrieve category: {str(e)}")
     
     @staticmethod
     def get_all() -> List[Dict[str, Any]]:
         """Retrieve all categories."""
-        query = "SELECT * FROM categories ORDER BY name"
+        query = f"SELECT {_CATEGORY_COLUMNS} FROM categories ORDER BY name"
         
         try:
             results = execute_query(query, ())
@@ -661,19 +1198,25 @@ class Category:
         Retrieve all tasks in a specific category.
         
         This demonstrates a JOIN operation between tasks and categories.
+        Each task comes with its category's name (category_name), so the
+        caller doesn't need a Category.get_by_id() call per task - that
+        would be the "N+1 queries" problem: 1 query for the list, plus
+        N more, one for each row.
         
         Args:
             category_id: ID of the category
             
         Returns:
-            List of task dictionaries in this category
+            List of task dictionaries in this category, each with an
+            extra 'category_name' key
             
         Raises:
             QueryExecutionError: If database operation fails
         """
-        query = """
-            SELECT tasks.*
+        query = f"""
+            SELECT {_TASK_COLUMNS_QUALIFIED}, categories.name AS category_name
             FROM tasks
+            JOIN categories ON categories.id = tasks.category_id
             WHERE tasks.category_id = ?
             ORDER BY tasks.created_at DESC
         """
@@ -708,6 +1251,7 @@ class Category:
         
         try:
             affected_rows = execute_update(query, (category_id,))
+            _get_category_cached.cache_clear()
             return affected_rows > 0
         except QueryExecutionError as e:
             raise QueryExecutionError(f"Failed to delete category: {str(e)}")
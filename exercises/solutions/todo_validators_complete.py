@@ -7,7 +7,7 @@ themselves before looking at this solution.
 
 This solution demonstrates:
 - Using existing validation utilities from validators.py
-- Implementing enum-like validation with validate_choice()
+- Implementing enum-like validation with a set of allowed values
 - Composing multiple validation checks
 - Writing clear, reusable validation functions
 - Proper error handling and messaging
@@ -30,13 +30,17 @@ Or run the tests using:
     python -c "from exercises.solutions.todo_validators_complete import run_tests; run_tests()"
 """
 
+import functools
+import io
+import sys
+from enum import IntEnum
+
 # Import the validation utilities we need
 # Note: These imports assume you're running from the project root directory
 try:
     from validation.validators import (
         validate_not_empty,
         validate_length,
-        validate_choice,
         ValidationError
     )
 except ModuleNotFoundError:
@@ -48,11 +52,39 @@ except ModuleNotFoundError:
     from validation.validators import (
         validate_not_empty,
         validate_length,
-        validate_choice,
         ValidationError
     )
 
 
+class TaskStatus(IntEnum):
+    """A task's status as a small integer code (e.g. for sorting or counting)."""
+    PENDING = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+
+
+class TaskPriority(IntEnum):
+    """A task's priority as a small integer code; higher means more urgent."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+
+# Allowed values, defined once when the module loads instead of on every call.
+# The dictionaries map the text we receive (and store in the database) to
+# its code: one hash lookup both checks the value and converts it.
+# The tuples keep a fixed order for error messages.
+_STATUS_CODES = {member.name.lower(): member for member in TaskStatus}
+_PRIORITY_CODES = {member.name.lower(): member for member in TaskPriority}
+TASK_STATUSES = tuple(_STATUS_CODES)
+TASK_PRIORITIES = tuple(_PRIORITY_CODES)
+
+# Error messages that never change, built once instead of on every failure
+# e.g. "Status must be one of: pending, in_progress, completed"
+_STATUS_ERROR = f"Status must be one of: {', '.join(TASK_STATUSES)}"
+_PRIORITY_ERROR = f"Priority must be one of: {', '.join(TASK_PRIORITIES)}"
+
+
 # ============================================================================
 # Task Field Validation Functions
 # ============================================================================
@@ -79,26 +111,32 @@ def validate_task_title(title: str) -> None:
         validate_task_title("A" * 250)                   # Raises ValidationError
     
     Implementation Notes:
-    - We call validate_not_empty() first to catch empty strings
-    - Then we call validate_length() to check the length constraints
-    - If either validation fails, ValidationError is raised automatically
+    - Most titles are valid, so we first try one combined check that
+      needs no extra function calls; a valid title returns right away
+    - Only if that check fails do we call validate_not_empty() and
+      validate_length(), which find the rule that was broken and raise
+      ValidationError with their usual clear message
     - We don't need to catch and re-raise - let the errors propagate
-    - The error messages from the utility functions are already clear
     """
-    # Check that title is not empty or whitespace-only
+    # Fast path: not empty, not too long, not only whitespace.
+    # isspace() answers "only whitespace?" without building a stripped
+    # copy of the string the way strip() would
+    if title and len(title) <= 200 and not title.isspace():
+        return
+    
+    # Something is wrong - let the utility functions report what.
     # This will raise ValidationError with message: "Title cannot be empty"
     validate_not_empty(title, "Title")
     
-    # Check that title length is within acceptable range
     # This will raise ValidationError if too short or too long
     validate_length(title, "Title", min_len=1, max_len=200)
 
 
-def validate_task_status(status: str) -> None:
+def validate_task_status(status: str) -> TaskStatus:
     """
     Validate that a task status is one of the allowed values.
     
-    SOLUTION: This demonstrates enum-like validation using validate_choice().
+    SOLUTION: This demonstrates enum-like validation with a set of allowed values.
     
     A valid task status must be one of:
     - 'pending': Task has not been started yet
@@ -108,33 +146,39 @@ def validate_task_status(status: str) -> None:
     Args:
         status: The task status to validate
     
+    Returns:
+        TaskStatus: The status's integer code (TaskStatus.PENDING, ...).
+        You can ignore it if you only want the check.
+    
     Raises:
         ValidationError: If status is not one of the allowed values
     
     Example Usage:
-        validate_task_status("pending")      # Passes
+        validate_task_status("pending")      # Passes, returns TaskStatus.PENDING
         validate_task_status("in_progress")  # Passes
         validate_task_status("completed")    # Passes
         validate_task_status("done")         # Raises ValidationError
         validate_task_status("PENDING")      # Raises ValidationError (case-sensitive)
     
     Implementation Notes:
-    - We define the allowed values as a list
-    - We use validate_choice() to check if status is in the list
+    - The allowed values are defined once, at the top of the module
+    - Looking the text up in _STATUS_CODES is a single hash lookup that
+      both checks the value and gives us its code
+    - The isinstance() check comes first because unhashable values (like
+      a list from a JSON body) can't be looked up in a dictionary
+    - The database still stores the text ('pending'), so the code is for
+      use inside Python, e.g. comparing or sorting statuses
     - The validation is case-sensitive (by design)
     - The error message will show all allowed values
     - This pattern works for any enum-like field
     """
-    # Define the allowed status values
-    allowed_statuses = ["pending", "in_progress", "completed"]
-    
-    # Use validate_choice() to check if status is in the allowed list
-    # This will raise ValidationError with a message like:
-    # "Status must be one of: pending, in_progress, completed"
-    validate_choice(status, "Status", allowed_statuses)
+    code = _STATUS_CODES.get(status) if isinstance(status, str) else None
+    if code is None:
+        raise ValidationError(_STATUS_ERROR)
+    return code
 
 
-def validate_task_priority(priority: str) -> None:
+def validate_task_priority(priority: str) -> TaskPriority:
     """
     Validate that a task priority is one of the allowed values.
     
@@ -148,11 +192,14 @@ def validate_task_priority(priority: str) -> None:
     Args:
         priority: The task priority to validate
     
+    Returns:
+        TaskPriority: The priority's integer code (TaskPriority.LOW, ...)
+    
     Raises:
         ValidationError: If priority is not one of the allowed values
     
     Example Usage:
-        validate_task_priority("low")      # Passes
+        validate_task_priority("low")      # Passes, returns TaskPriority.LOW
         validate_task_priority("medium")   # Passes
         validate_task_priority("high")     # Passes
         validate_task_priority("urgent")   # Raises ValidationError
@@ -164,13 +211,10 @@ def validate_task_priority(priority: str) -> None:
     - This shows how validation patterns are reusable
     - Consider creating a helper function if you have many enum fields
     """
-    # Define the allowed priority values
-    allowed_priorities = ["low", "medium", "high"]
-    
-    # Use validate_choice() to check if priority is in the allowed list
-    # This will raise ValidationError with a message like:
-    # "Priority must be one of: low, medium, high"
-    validate_choice(priority, "Priority", allowed_priorities)
+    code = _PRIORITY_CODES.get(priority) if isinstance(priority, str) else None
+    if code is None:
+        raise ValidationError(_PRIORITY_ERROR)
+    return code
 
 
 # ============================================================================
@@ -194,14 +238,22 @@ def validate_task_description(description: str) -> None:
         ValidationError: If description exceeds maximum length
     
     Implementation Notes:
-    - We only validate if description is not empty
+    - Like validate_task_title(), a fast path first: a missing or short
+      enough description (the usual case) returns without calling anything
+    - We only validate if description is not empty (or only whitespace)
+    - isspace() checks "only whitespace?" without building a stripped copy
+      of a possibly long description, as strip() would
     - We use validate_length() with only max_len parameter
     - We don't use min_len because empty descriptions are allowed
     - This pattern works for any optional field with constraints
     """
-    # Only validate length if description is provided and not empty
-    # Empty strings and None are allowed for optional fields
-    if description and description.strip():
+    # Fast path: empty, None, or within the limit - nothing to report
+    if not description or len(description) <= 1000:
+        return
+    
+    # Too long - unless it's only whitespace, which counts as empty.
+    # validate_length() raises ValidationError with its usual message
+    if not description.isspace():
         # Check maximum length only (no minimum for optional fields)
         validate_length(description, "Description", max_len=1000)
 
@@ -215,11 +267,12 @@ def validate_complete_task(
     """
     Validate all task fields at once.
     
-    BONUS SOLUTION: This demonstrates composing multiple validation functions.
+    BONUS SOLUTION: This demonstrates collecting all validation errors at once.
     
     This function validates an entire task object before creating or updating it.
-    It's useful when you want to validate everything upfront and get all
-    validation errors at once (though this simple version stops at first error).
+    Unlike calling the single-field validators one after another, it checks
+    EVERY field and reports all problems together, so the user can fix
+    everything in one go instead of one error per attempt.
     
     Args:
         title: Task title
@@ -228,7 +281,8 @@ def validate_complete_task(
         description: Task description (optional)
     
     Raises:
-        ValidationError: If any field validation fails
+        ValidationError: If any field is invalid. The message lists every
+            problem, separated by "; "
     
     Example Usage:
         # Validate a complete task
@@ -239,52 +293,87 @@ def validate_complete_task(
             description="Get milk, eggs, and bread"
         )
         
-        # This will raise ValidationError if any field is invalid
+        # This raises ONE ValidationError that mentions both problems:
+        # "Title cannot be empty; Status must be one of: pending, in_progress, completed"
         validate_complete_task(
-            title="",  # Invalid - empty title
-            status="pending",
+            title="",        # Invalid - empty title
+            status="done",   # Invalid - unknown status
             priority="medium"
         )
     
     Implementation Notes:
-    - We call each validation function in sequence
-    - If any validation fails, the error propagates immediately
-    - This is a simple approach - stops at first error
-    - For better UX, you could collect all errors and return them together
-    - This pattern is commonly used in model create/update methods
-    
-    Advanced Pattern (collecting all errors):
-        errors = []
-        try:
-            validate_task_title(title)
-        except ValidationError as e:
-            errors.append(str(e))
-        
+    - Each field is checked by its own single-field validator, so every
+      rule and message lives in exactly one place
+    - Each ValidationError is caught and its message added to a list,
+      instead of letting the first one stop the whole check
+    - We raise once at the end if the list isn't empty
+    """
+    # (validator, value) pairs - the description validator accepts None
+    checks = (
+        (validate_task_title, title),
+        (validate_task_status, status),
+        (validate_task_priority, priority),
+        (validate_task_description, description),
+    )
+    
+    errors = []
+    for validator, value in checks:
         try:
-            validate_task_status(status)
+            validator(value)
         except ValidationError as e:
             errors.append(str(e))
-        
-        if errors:
-            raise ValidationError("; ".join(errors))
-    """
-    # Validate each field in sequence
-    # If any validation fails, the error will propagate up
     
-    # Validate required fields
-    validate_task_title(title)
-    validate_task_status(status)
-    validate_task_priority(priority)
-    
-    # Validate optional fields if provided
-    if description is not None:
-        validate_task_description(description)
+    if errors:
+        raise ValidationError("; ".join(errors))
 
 
 # ============================================================================
 # Additional Validation Functions (Extra Practice)
 # ============================================================================
 
+# Days in each month of a non-leap year (January first)
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_due_date(due_date: str):
+    """
+    Split a 'YYYY-MM-DD' string into (year, month, day), or return None.
+    
+    The string always has the same shape - 4 digits, '-', 2 digits, '-',
+    2 digits - so we can check each position directly instead of running
+    a general-purpose date parser.
+    
+    The same few dates come up again and again (today, end of the month,
+    ...), so lru_cache remembers the answer for the last 1024 strings.
+    Only pass strings: lru_cache needs arguments it can hash.
+    """
+    # Shape: exactly 10 ASCII characters with dashes at positions 4 and 7
+    if (len(due_date) != 10 or not due_date.isascii()
+            or due_date[4] != "-" or due_date[7] != "-"):
+        return None
+    
+    year_text, month_text, day_text = due_date[:4], due_date[5:7], due_date[8:]
+    # isdigit() rejects signs, spaces and underscores, which int() would accept
+    if not (year_text.isdigit() and month_text.isdigit() and day_text.isdigit()):
+        return None
+    
+    year, month, day = int(year_text), int(month_text), int(day_text)
+    if year < 1 or not 1 <= month <= 12:
+        return None
+    
+    # February has 29 days in leap years: every 4th year, except
+    # centuries that aren't divisible by 400 (2000 was leap, 1900 wasn't)
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        last_day = 29
+    else:
+        last_day = _MONTH_DAYS[month - 1]
+    
+    if not 1 <= day <= last_day:
+        return None
+    return year, month, day
+
+
 def validate_task_due_date(due_date: str) -> None:
     """
     Validate that a due date is in the correct format.
@@ -301,19 +390,53 @@ def validate_task_due_date(due_date: str) -> None:
         validate_task_due_date("2024-12-31")  # Passes
         validate_task_due_date("12/31/2024")  # Raises ValidationError
         validate_task_due_date("2024-13-01")  # Raises ValidationError (invalid month)
-    """
-    from datetime import datetime
     
-    try:
-        # Try to parse the date string
-        # This will raise ValueError if the format is wrong or date is invalid
-        datetime.strptime(due_date, "%Y-%m-%d")
-    except ValueError:
+    Implementation Notes:
+    - datetime.strptime() would also work, but it interprets the format
+      string ("%Y-%m-%d") on every call and builds a datetime object we
+      would throw away
+    - _parse_due_date() checks the fixed shape position by position and
+      does the month-length and leap-year checks itself
+    - Its results are cached, so a date seen before costs one dictionary
+      lookup. The isinstance() check keeps non-strings (None, lists, ...)
+      away from the cache, which can only store hashable arguments
+    """
+    if not isinstance(due_date, str) or _parse_due_date(due_date) is None:
         raise ValidationError(
             "Due date must be in YYYY-MM-DD format (e.g., 2024-12-31)"
         )
 
 
+def validate_task_due_dates(due_dates) -> None:
+    """
+    Validate a whole list of due dates (e.g. from a CSV import).
+
+    EXTRA: The batch version of validate_task_due_date().
+
+    Args:
+        due_dates: Any iterable of date strings
+
+    Raises:
+        ValidationError: For the first invalid date, saying where it is
+
+    Example Usage:
+        validate_task_due_dates(["2024-12-31", "2025-01-01"])  # Passes
+        validate_task_due_dates(["2024-12-31", "31/12/2024"])  # Raises: "Due date #2 ..."
+
+    Implementation Notes:
+    - Like validate_task_ids(), everything happens in one loop instead of
+      one validate_task_due_date() call (and message setup) per row
+    - Imported files tend to repeat the same few dates, which the
+      lru_cache on _parse_due_date() answers without re-parsing
+    """
+    parse = _parse_due_date  # local name: looked up once, not once per row
+    for position, due_date in enumerate(due_dates, start=1):
+        if not isinstance(due_date, str) or parse(due_date) is None:
+            raise ValidationError(
+                f"Due date #{position} must be in YYYY-MM-DD format (e.g., 2024-12-31)"
+            )
+
+
 def validate_task_id(task_id: int) -> None:
     """
     Validate that a task ID is a positive integer.
@@ -339,10 +462,95 @@ def validate_task_id(task_id: int) -> None:
         raise ValidationError("Task ID must be a positive integer")
 
 
+def validate_task_ids(task_ids) -> None:
+    """
+    Validate a whole list of task IDs (e.g. for "complete all selected").
+    
+    EXTRA: This demonstrates validating many values in one pass.
+    
+    Args:
+        task_ids: Any iterable of task IDs (list, tuple, generator, ...)
+    
+    Raises:
+        ValidationError: For the first invalid ID, saying where it is
+    
+    Example Usage:
+        validate_task_ids([1, 2, 3])   # Passes
+        validate_task_ids([1, 0, 3])   # Raises: "Task ID #2 must be a positive integer"
+    
+    Implementation Notes:
+    - Calling validate_task_id() for each ID costs one function call per
+      ID; here the whole list is checked inside a single loop
+    - The position in the message tells the caller which ID to fix
+    """
+    for position, task_id in enumerate(task_ids, start=1):
+        if not isinstance(task_id, int):
+            raise ValidationError(f"Task ID #{position} must be an integer")
+        if task_id <= 0:
+            raise ValidationError(f"Task ID #{position} must be a positive integer")
+
+
 # ============================================================================
 # Testing Functions
 # ============================================================================
 
+# Test cases for run_tests(), one row per validator:
+#   (section heading, label, validator, valid inputs, invalid inputs)
+# Each input is the single argument to pass, or a dict of keyword
+# arguments. Invalid inputs are (input, reason) pairs.
+# Adding a case is one more entry here - no new try/except block needed.
+_TEST_CASES = [
+    ("validate_task_title()", "title", validate_task_title,
+     ["Buy groceries",
+      "Complete Python tutorial",
+      "A",          # Minimum length
+      "X" * 200],   # Maximum length
+     [("", "empty string"),
+      ("   ", "whitespace only"),
+      ("X" * 201, "too long")]),
+    ("validate_task_status()", "status", validate_task_status,
+     ["pending", "in_progress", "completed"],
+     [("done", "invalid value"),
+      ("PENDING", "wrong case"),
+      ("in progress", "space instead of underscore")]),
+    ("validate_task_priority()", "priority", validate_task_priority,
+     ["low", "medium", "high"],
+     [("urgent", "invalid value"),
+      ("HIGH", "wrong case"),
+      ("normal", "not in allowed list")]),
+    ("validate_task_description() (BONUS)", "description", validate_task_description,
+     ["",           # Empty is allowed
+      "Short description",
+      "X" * 1000],  # Maximum length
+     [("X" * 1001, "too long")]),
+    ("validate_complete_task() (BONUS)", "complete task", validate_complete_task,
+     [{"title": "Buy groceries", "status": "pending", "priority": "medium",
+       "description": "Get milk, eggs, and bread"}],
+     [({"title": "", "status": "pending", "priority": "medium"}, "empty title"),
+      ({"title": "Valid title", "status": "done", "priority": "medium"}, "invalid status")]),
+    ("validate_task_due_date() (EXTRA)", "date", validate_task_due_date,
+     ["2024-12-31", "2025-01-01", "2024-02-29"],  # 2024 is a leap year
+     [("12/31/2024", "wrong format"),
+      ("2024-13-01", "invalid month"),
+      ("2024-02-30", "invalid day"),
+      ("not-a-date", "not a date")]),
+    ("validate_task_id() (EXTRA)", "ID", validate_task_id,
+     [1, 100, 999999],
+     [(0, "zero"),
+      (-5, "negative"),
+      ("1", "string instead of int")]),
+]
+
+
+def _preview(value) -> str:
+    """Show a test input in the report (long strings are cut at 50 characters)."""
+    if isinstance(value, dict):
+        return ""
+    if not isinstance(value, str):
+        return f": {value}"
+    return f": '{value[:50]}...' " if len(value) > 50 else f": '{value}'"
+
+
 def run_tests():
     """
     Test all validation functions with various inputs.
@@ -356,224 +564,86 @@ def run_tests():
     Or add at the bottom of the file:
         if __name__ == "__main__":
             run_tests()
-    """
-    print("\n" + "=" * 70)
-    print("TESTING TODO VALIDATORS - COMPLETE SOLUTION")
-    print("=" * 70)
-    
-    # Test validate_task_title
-    print("\n--- Testing validate_task_title() ---")
-    
-    # Test valid titles
-    valid_titles = [
-        "Buy groceries",
-        "Complete Python tutorial",
-        "A",  # Minimum length
-        "X" * 200  # Maximum length
-    ]
-    
-    for title in valid_titles:
-        try:
-            validate_task_title(title)
-            print(f"✓ Valid title passed: '{title[:50]}...' " if len(title) > 50 else f"✓ Valid title passed: '{title}'")
-        except ValidationError as e:
-            print(f"✗ Unexpected error for '{title[:50]}...': {e}")
-    
-    # Test invalid titles
-    invalid_titles = [
-        ("", "empty string"),
-        ("   ", "whitespace only"),
-        ("X" * 201, "too long")
-    ]
-    
-    for title, reason in invalid_titles:
-        try:
-            validate_task_title(title)
-            print(f"✗ Should have raised ValidationError for {reason}")
-        except ValidationError as e:
-            print(f"✓ Invalid title caught ({reason}): {e}")
-    
-    # Test validate_task_status
-    print("\n--- Testing validate_task_status() ---")
-    
-    # Test valid statuses
-    valid_statuses = ["pending", "in_progress", "completed"]
-    
-    for status in valid_statuses:
-        try:
-            validate_task_status(status)
-            print(f"✓ Valid status passed: '{status}'")
-        except ValidationError as e:
-            print(f"✗ Unexpected error for '{status}': {e}")
-    
-    # Test invalid statuses
-    invalid_statuses = [
-        ("done", "invalid value"),
-        ("PENDING", "wrong case"),
-        ("in progress", "space instead of underscore")
-    ]
-    
-    for status, reason in invalid_statuses:
-        try:
-            validate_task_status(status)
-            print(f"✗ Should have raised ValidationError for {reason}")
-        except ValidationError as e:
-            print(f"✓ Invalid status caught ({reason}): {e}")
-    
-    # Test validate_task_priority
-    print("\n--- Testing validate_task_priority() ---")
-    
-    # Test valid priorities
-    valid_priorities = ["low", "medium", "high"]
-    
-    for priority in valid_priorities:
-        try:
-            validate_task_priority(priority)
-            print(f"✓ Valid priority passed: '{priority}'")
-        except ValidationError as e:
-            print(f"✗ Unexpected error for '{priority}': {e}")
-    
-    # Test invalid priorities
-    invalid_priorities = [
-        ("urgent", "invalid value"),
-        ("HIGH", "wrong case"),
-        ("normal", "not in allowed list")
-    ]
-    
-    for priority, reason in invalid_priorities:
-        try:
-            validate_task_priority(priority)
-            print(f"✗ Should have raised ValidationError for {reason}")
-        except ValidationError as e:
-            print(f"✓ Invalid priority caught ({reason}): {e}")
-    
-    # Test validate_task_description (bonus)
-    print("\n--- Testing validate_task_description() (BONUS) ---")
-    
-    # Test valid descriptions
-    valid_descriptions = [
-        "",  # Empty is allowed
-        "Short description",
-        "X" * 1000  # Maximum length
-    ]
-    
-    for desc in valid_descriptions:
-        try:
-            validate_task_description(desc)
-            print(f"✓ Valid description passed: '{desc[:50]}...' " if len(desc) > 50 else f"✓ Valid description passed: '{desc}'")
-        except ValidationError as e:
-            print(f"✗ Unexpected error: {e}")
-    
-    # Test invalid descriptions
-    try:
-        validate_task_description("X" * 1001)  # Too long
-        print("✗ Should have raised ValidationError for too long description")
-    except ValidationError as e:
-        print(f"✓ Invalid description caught (too long): {e}")
-    
-    # Test validate_complete_task (bonus)
-    print("\n--- Testing validate_complete_task() (BONUS) ---")
     
-    # Test valid complete task
-    try:
-        validate_complete_task(
-            title="Buy groceries",
-            status="pending",
-            priority="medium",
-            description="Get milk, eggs, and bread"
-        )
-        print("✓ Valid complete task passed")
-    except ValidationError as e:
-        print(f"✗ Unexpected error: {e}")
-    
-    # Test invalid complete task (empty title)
-    try:
-        validate_complete_task(
-            title="",
-            status="pending",
-            priority="medium"
-        )
-        print("✗ Should have raised ValidationError for empty title")
-    except ValidationError as e:
-        print(f"✓ Invalid complete task caught (empty title): {e}")
-    
-    # Test invalid complete task (invalid status)
-    try:
-        validate_complete_task(
-            title="Valid title",
-            status="done",  # Invalid
-            priority="medium"
-        )
-        print("✗ Should have raised ValidationError for invalid status")
-    except ValidationError as e:
-        print(f"✓ Invalid complete task caught (invalid status): {e}")
-    
-    # Test validate_task_due_date (extra)
-    print("\n--- Testing validate_task_due_date() (EXTRA) ---")
-    
-    # Test valid dates
-    valid_dates = ["2024-12-31", "2025-01-01", "2024-02-29"]  # 2024 is a leap year
-    
-    for date_str in valid_dates:
-        try:
-            validate_task_due_date(date_str)
-            print(f"✓ Valid date passed: '{date_str}'")
-        except ValidationError as e:
-            print(f"✗ Unexpected error for '{date_str}': {e}")
-    
-    # Test invalid dates
-    invalid_dates = [
-        ("12/31/2024", "wrong format"),
-        ("2024-13-01", "invalid month"),
-        ("2024-02-30", "invalid day"),
-        ("not-a-date", "not a date")
-    ]
+    Raises:
+        AssertionError: If any case did not behave as expected (the report
+            marks each failing case with ✗)
     
-    for date_str, reason in invalid_dates:
-        try:
-            validate_task_due_date(date_str)
-            print(f"✗ Should have raised ValidationError for {reason}")
-        except ValidationError as e:
-            print(f"✓ Invalid date caught ({reason}): {e}")
+    Implementation Notes:
+    - The cases live in the _TEST_CASES table above; one loop runs them all
+      with a single try/except, instead of one block per case
+    - Failures are counted, and the run ends with an AssertionError if
+      there were any - a report full of ✗ should never look like a pass
+    - The same table could feed @pytest.mark.parametrize later
+    """
+    # Collect the report in memory and write it a section at a time:
+    # one write per section instead of one print() per line.
+    out = io.StringIO()
     
-    # Test validate_task_id (extra)
-    print("\n--- Testing validate_task_id() (EXTRA) ---")
+    # Bind the method to a local name once and use it for every line:
+    # a local is found directly, while print / out.write are looked up
+    # on every call (and print() has its own argument handling on top)
+    write = out.write
     
-    # Test valid IDs
-    valid_ids = [1, 100, 999999]
+    def flush():
+        """Write everything collected so far to the screen in one go."""
+        sys.stdout.write(out.getvalue())
+        out.seek(0)
+        out.truncate()
     
-    for task_id in valid_ids:
-        try:
-            validate_task_id(task_id)
-            print(f"✓ Valid ID passed: {task_id}")
-        except ValidationError as e:
-            print(f"✗ Unexpected error for {task_id}: {e}")
+    write("\n" + "=" * 70 + "\n")
+    write("TESTING TODO VALIDATORS - COMPLETE SOLUTION\n")
+    write("=" * 70 + "\n")
     
-    # Test invalid IDs
-    invalid_ids = [
-        (0, "zero"),
-        (-5, "negative"),
-        ("1", "string instead of int")
-    ]
+    flush()
     
-    for task_id, reason in invalid_ids:
-        try:
-            validate_task_id(task_id)
-            print(f"✗ Should have raised ValidationError for {reason}")
-        except ValidationError as e:
-            print(f"✓ Invalid ID caught ({reason}): {e}")
+    failures = 0
     
-    print("\n" + "=" * 70)
-    print("TESTING COMPLETE")
-    print("=" * 70)
-    print("\nAll validation functions are working correctly!")
-    print("\nKey Takeaways:")
-    print("1. Validation functions should be simple and focused")
-    print("2. Reuse existing validation utilities when possible")
-    print("3. Provide clear, helpful error messages")
-    print("4. Compose simple validations to create complex ones")
-    print("5. Test both valid and invalid inputs")
-    print()
+    for heading, label, validator, valid_inputs, invalid_inputs in _TEST_CASES:
+        write(f"\n--- Testing {heading} ---\n")
+        
+        # Valid inputs come first (reason None), then the invalid ones
+        cases = [(value, None) for value in valid_inputs] + invalid_inputs
+        
+        for value, reason in cases:
+            try:
+                if isinstance(value, dict):
+                    validator(**value)
+                else:
+                    validator(value)
+                error = None
+            except ValidationError as e:
+                error = e
+            
+            if reason is None and error is None:
+                write(f"✓ Valid {label} passed{_preview(value)}\n")
+            elif reason is None:
+                failures += 1
+                write(f"✗ Unexpected error for {label}{_preview(value)}: {error}\n")
+            elif error is None:
+                failures += 1
+                write(f"✗ Should have raised ValidationError for {reason}\n")
+            else:
+                write(f"✓ Invalid {label} caught ({reason}): {error}\n")
+        
+        flush()
+    
+    write("\n" + "=" * 70 + "\n")
+    write("TESTING COMPLETE\n")
+    write("=" * 70 + "\n")
+    if failures:
+        write(f"\n{failures} check(s) FAILED - see the ✗ lines above\n")
+        flush()
+        raise AssertionError(f"{failures} validator check(s) failed")
+    write("\nAll validation functions are working correctly!\n")
+    write("\nKey Takeaways:\n")
+    write("1. Validation functions should be simple and focused\n")
+    write("2. Reuse existing validation utilities when possible\n")
+    write("3. Provide clear, helpful error messages\n")
+    write("4. Compose simple validations to create complex ones\n")
+    write("5. Test both valid and invalid inputs\n")
+    write("\n")
+    flush()
 
 
 # ============================================================================
@@ -635,16 +705,22 @@ Key Patterns Demonstrated:
 4. **Optional Field Validation**:
    ```python
    def validate_description(desc):
-       if desc and desc.strip():
+       if desc and not desc.isspace():
            validate_length(desc, "Description", max_len=1000)
    ```
 
-5. **Complete Object Validation**:
+5. **Complete Object Validation** (report every problem at once):
    ```python
    def validate_complete_task(title, status, priority):
-       validate_task_title(title)
-       validate_task_status(status)
-       validate_task_priority(priority)
+       errors = []
+       for validator, value in ((validate_task_title, title),
+                                (validate_task_status, status)):
+           try:
+               validator(value)
+           except ValidationError as e:
+               errors.append(str(e))
+       if errors:
+           raise ValidationError("; ".join(errors))
    ```
 
 Comparison with Exercise File:
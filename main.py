@@ -15,21 +15,18 @@ LEARNING OBJECTIVES:
 HOW TO USE:
 1. Make sure you've run setup.py to initialize the database
 2. Run this script: python main.py
+   (or just one part: python main.py --demo library / --demo todo)
 3. Observe the output and study the code
 4. Complete the TODO sections to add Todo operations
 """
 
+import argparse
 import sys
 from datetime import datetime
 
-# Import Library System models (complete reference implementation)
-from models.library import Book, Member, Loan, ValidationError, DuplicateError, NotFoundError
-
-# Import Todo System models (you'll implement these!)
-from models.todo import Task
-
-# Import error handlers for consistent error messages
-from utils.error_handlers import handle_database_error
+# The models are imported inside the demo functions below, not here.
+# "python main.py --demo todo" then never loads models/library.py (and
+# vice versa) - a module costs nothing until the first import of it.
 
 
 # ============================================================================
@@ -58,33 +55,55 @@ def print_info(message: str) -> None:
     print(f"ℹ {message}")
 
 
+# The print_<record> helpers below build the whole record as one string
+# and write it in a single call, instead of one print() per line. That
+# matters when they run in a loop over every book in the database.
+
+def format_book(book: dict) -> str:
+    """Return book details as formatted text (one line per field)."""
+    # Every row from the books table has these keys, so we index directly.
+    # published_year may be None (unknown year) - then the line is skipped
+    available = "Available" if book['available'] else "Checked Out"
+    text = (
+        f"  [{book['id']}] {book['title']}\n"
+        f"      Author: {book['author']}\n"
+        f"      ISBN: {book['isbn']}\n"
+    )
+    if book['published_year'] is not None:
+        text += f"      Published: {book['published_year']}\n"
+    text += f"      Status: {available}\n"
+    return text
+
+
 def print_book(book: dict) -> None:
     """Print book details in a formatted way."""
-    available = "Available" if book.get('available', 1) else "Checked Out"
-    print(f"  [{book['id']}] {book['title']}")
-    print(f"      Author: {book['author']}")
-    print(f"      ISBN: {book['isbn']}")
-    if book.get('published_year'):
-        print(f"      Published: {book['published_year']}")
-    print(f"      Status: {available}")
+    sys.stdout.write(format_book(book))
+
+
+def print_books(books: list) -> None:
+    """Print a whole list of books with a single write."""
+    sys.stdout.write("".join(map(format_book, books)))
 
 
 def print_member(member: dict) -> None:
     """Print member details in a formatted way."""
-    print(f"  [{member['id']}] {member['name']}")
-    print(f"      Email: {member['email']}")
-    print(f"      Joined: {member['join_date']}")
+    sys.stdout.write(
+        f"  [{member['id']}] {member['name']}\n"
+        f"      Email: {member['email']}\n"
+        f"      Joined: {member['join_date']}\n"
+    )
 
 
 def print_task(task: dict) -> None:
     """Print task details in a formatted way."""
-    print(f"  [{task['id']}] {task['title']}")
+    text = f"  [{task['id']}] {task['title']}\n"
     if task.get('description'):
-        print(f"      Description: {task['description']}")
+        text += f"      Description: {task['description']}\n"
     if task.get('status'):
-        print(f"      Status: {task['status']}")
+        text += f"      Status: {task['status']}\n"
     if task.get('priority'):
-        print(f"      Priority: {task['priority']}")
+        text += f"      Priority: {task['priority']}\n"
+    sys.stdout.write(text)
 
 
 # ============================================================================
@@ -103,6 +122,9 @@ def demo_library_system():
     - Working with relationships (loans)
     """
     
+    # Import Library System models (complete reference implementation)
+    from models.library import Book, Member, Loan, ValidationError, DuplicateError, NotFoundError
+    
     print_header("LIBRARY SYSTEM DEMONSTRATION")
     print_info("This demonstrates the complete Library System implementation.")
     print_info("Study this code to understand CRUD operations!\n")
@@ -167,15 +189,13 @@ def demo_library_system():
         print_info("\nGetting all books...")
         all_books = Book.get_all()
         print_success(f"Found {len(all_books)} books:")
-        for book in all_books:
-            print_book(book)
+        print_books(all_books)
         
         # Search for books
         print_info("\nSearching for books with 'Python' in title...")
         python_books = Book.search("Python", search_field="title")
         print_success(f"Found {len(python_books)} matching books:")
-        for book in python_books:
-            print_book(book)
+        print_books(python_books)
             
     except Exception as e:
         print_error(f"Error reading books: {e}")
@@ -304,7 +324,8 @@ def demo_todo_system():
     6. Handle errors appropriately
     
     HINTS:
-    - Import Task from models.todo at the top of this file (already done!)
+    - Task and ValidationError are imported from models.todo at the top
+      of this function (already done!)
     - Use the same error handling patterns as Library System
     - Use the print_task() helper function to display tasks
     - Study the demo_library_system() function for the pattern
@@ -333,6 +354,12 @@ def demo_todo_system():
     # TODO: Add more operations (read, update, delete)
     """
     
+    # Import Todo System models (you'll implement these!)
+    from models.todo import Task, ValidationError
+    
+    # Import error handlers for consistent error messages
+    from utils.error_handlers import handle_database_error
+    
     print_header("TODO SYSTEM DEMONSTRATION")
     print_info("This section is for YOU to implement!")
     print_info("Follow the pattern from the Library System above.")
@@ -401,12 +428,24 @@ def demo_todo_system():
 # MAIN FUNCTION
 # ============================================================================
 
-def main():
+def main(argv=None):
     """
     Main entry point for the demo script.
     
-    This function runs all demonstrations in sequence.
+    This function runs all demonstrations in sequence, or only the one
+    chosen with --demo.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
     """
+    parser = argparse.ArgumentParser(description="Backend learning project demo script")
+    parser.add_argument(
+        '--demo',
+        choices=['all', 'library', 'todo'],
+        default='all',
+        help="Which demonstration to run (default: all)"
+    )
+    args = parser.parse_args(argv)
     
     print("\n" + "=" * 70)
     print("  PYTHON BACKEND LEARNING PROJECT - DEMO SCRIPT")
@@ -416,10 +455,12 @@ def main():
     
     try:
         # Run Library System demonstration (complete reference)
-        demo_library_system()
+        if args.demo in ('all', 'library'):
+            demo_library_system()
         
         # Run Todo System demonstration (for students to complete)
-        demo_todo_system()
+        if args.demo in ('all', 'todo'):
+            demo_todo_system()
         
         # Final message
         print_header("DEMONSTRATION COMPLETE")
@@ -31,7 +31,9 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime, date, timedelta
 
 # Import database connection utilities
-from database.connection import execute_query, execute_insert, execute_update, QueryExecutionError
+from database.connection import (
+    execute_query, execute_insert, execute_update, transaction, QueryExecutionError
+)
 
 
 # ============================================================================
@@ -99,6 +101,13 @@ def validate_not_empty(value: str, field_name: str) -> None:
         raise ValidationError(f"{field_name} cannot be empty")
 
 
+# Translation table that deletes hyphens and spaces (built once, used by str.translate)
+_ISBN_SEPARATORS = str.maketrans("", "", "- ")
+
+# Valid ISBN lengths: ISBN-10 and ISBN-13
+_ISBN_LENGTHS = frozenset({10, 13})
+
+
 def validate_isbn(isbn: str) -> None:
     """
     Validate ISBN format (basic validation).
@@ -128,14 +137,15 @@ def validate_isbn(isbn: str) -> None:
         raise ValidationError("ISBN cannot be empty")
     
     # Remove hyphens and spaces for length checking
-    isbn_digits = isbn.replace("-", "").replace(" ", "")
+    # translate() removes both in a single pass over the string
+    isbn_digits = isbn.translate(_ISBN_SEPARATORS)
     
     # Check if it contains only digits
     if not isbn_digits.isdigit():
         raise ValidationError("ISBN must contain only digits and hyphens")
     
     # Check length (ISBN-10 or ISBN-13)
-    if len(isbn_digits) not in [10, 13]:
+    if len(isbn_digits) not in _ISBN_LENGTHS:
         raise ValidationError("ISBN must be 10 or 13 digits")
 
 
@@ -170,6 +180,87 @@ def validate_year(year: Optional[int]) -> None:
         raise ValidationError(f"Publication year cannot be after {current_year + 1}")
 
 
+# Full-text search index for Book.search(). It is not part of
+# library_schema.sql: FTS5 with the trigram tokenizer needs SQLite 3.34+
+# built with FTS5, so it is created here on first use - and only if this
+# SQLite can build it.
+#   - content='books': the index stores no copy of the text, it reads books
+#   - tokenize='trigram': indexes every 3-character piece of the text, so
+#     any substring of 3+ characters can be found (just like LIKE '%term%')
+# The triggers keep the index in sync whenever books change.
+_BOOKS_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+        title, author, content='books', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts (rowid, title, author)
+        VALUES (new.id, new.title, new.author);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, author)
+        VALUES ('delete', old.id, old.title, old.author);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS books_fts_update AFTER UPDATE OF title, author ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, author)
+        VALUES ('delete', old.id, old.title, old.author);
+        INSERT INTO books_fts (rowid, title, author)
+        VALUES (new.id, new.title, new.author);
+    END""",
+    # A new index starts empty - fill it from the books that already exist
+    "INSERT INTO books_fts (books_fts) VALUES ('rebuild')",
+)
+
+# Becomes False once SQLite has said it can't build the index (no FTS5
+# module, or no trigram tokenizer). That can't change while the program
+# runs, so we stop trying and Book.search() keeps using LIKE.
+_books_fts_supported = True
+
+
+def ensure_books_fts() -> bool:
+    """
+    Make sure the books_fts search index exists, creating it if needed.
+    
+    Returns:
+        bool: True if Book.search() can use the index, False if it has
+        to fall back to LIKE
+    
+    Learning Notes:
+    - The existence check runs on every call (one small sqlite_master
+      lookup), because the database file may have been reset since the
+      last search; only "this SQLite can't do it" is remembered
+    - A SAVEPOINT undoes a half-built index if a statement fails, even
+      when we are running inside the caller's own transaction() block
+    """
+    global _books_fts_supported
+    if not _books_fts_supported:
+        return False
+    
+    if execute_query(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books_fts'",
+        as_dict=False
+    ):
+        return True
+    
+    try:
+        with transaction() as conn:
+            conn.execute("SAVEPOINT books_fts")
+            try:
+                for statement in _BOOKS_FTS_DDL:
+                    conn.execute(statement)
+            except sqlite3.Error:
+                conn.execute("ROLLBACK TO books_fts")
+                raise
+            finally:
+                conn.execute("RELEASE books_fts")
+    except (sqlite3.Error, QueryExecutionError) as e:
+        message = str(e).lower()
+        if "fts5" in message or "tokenize" in message:
+            _books_fts_supported = False
+        return False
+    
+    return True
+
+
 # ============================================================================
 # Book Model Class
 # ============================================================================
@@ -642,17 +733,31 @@ class Book:
         - Use % as wildcard (matches any characters)
         - SQLite LIKE is case-insensitive by default
         - For case-sensitive search, use GLOB instead of LIKE
+        - LIKE '%...%' must read every row; when SQLite supports the
+          books_fts full-text index (see ensure_books_fts()), terms of 3+
+          characters are looked up in the index instead
         """
         # Validate search field
         if search_field not in ["title", "author"]:
             raise ValidationError("search_field must be 'title' or 'author'")
         
-        # Build query with LIKE for partial matching
-        # %search_term% matches any text containing search_term
-        query = f"SELECT * FROM books WHERE {search_field} LIKE ? ORDER BY {search_field}"
-        
-        # Add wildcards to search term
-        search_pattern = f"%{search_term}%"
+        if len(search_term) >= 3 and ensure_books_fts():
+            # Fast path: ask the full-text index which rows contain the term
+            # 'title : "term"' limits the match to one column; the quotes make
+            # the term a plain string (a " inside it is written as "")
+            query = (
+                "SELECT books.* FROM books "
+                "JOIN books_fts ON books.id = books_fts.rowid "
+                f"WHERE books_fts MATCH ? ORDER BY books.{search_field}"
+            )
+            search_pattern = '{} : "{}"'.format(search_field, search_term.replace('"', '""'))
+        else:
+            # Build query with LIKE for partial matching
+            # %search_term% matches any text containing search_term
+            query = f"SELECT * FROM books WHERE {search_field} LIKE ? ORDER BY {search_field}"
+            
+            # Add wildcards to search term
+            search_pattern = f"%{search_term}%"
         
         try:
             results = execute_query(query, (search_pattern,))
@@ -197,6 +197,59 @@ def validate_title_length(title: str) -> None:
     pass
 
 
+# ============================================================================
+# Request Body Validation (used by the API examples)
+# ============================================================================
+# The examples in examples/ accept tasks as JSON. This complete helper lets
+# them work before you have finished the TODOs above - compare it with your
+# validate_title_length() once you're done.
+
+# Length limits from the todo exercise (see Task.create() below)
+TASK_TITLE_MAX_LENGTH = 200
+TASK_DESCRIPTION_MAX_LENGTH = 1000
+
+
+def task_row(task: Dict[str, Any]) -> tuple:
+    """
+    Validate one task from a request body and return its (title, description).
+    
+    Both API examples (Flask and async) use this for POST /api/tasks and
+    POST /api/tasks/bulk, so a task is accepted or rejected the same way
+    everywhere. The rules are the ones Task.create() asks for: the title
+    is a non-empty string of at most 200 characters (surrounding spaces
+    removed), the optional description a string of at most 1000 characters.
+    
+    Args:
+        task: One task as decoded from JSON, e.g. {"title": "Buy milk"}
+        
+    Returns:
+        tuple: (title, description), ready to use as INSERT parameters
+        
+    Raises:
+        ValidationError: If a field is missing, not a string, or too long
+        
+    Learning Notes:
+    - JSON can send anything: {"title": 42} is valid JSON, so we check
+      the type before calling string methods such as strip()
+    """
+    title = task.get('title')
+    description = task.get('description')
+    
+    if title is not None and not isinstance(title, str):
+        raise ValidationError("Title must be a string")
+    if description is not None and not isinstance(description, str):
+        raise ValidationError("Description must be a string")
+    
+    validate_not_empty(title, "Title")
+    title = title.strip()
+    if len(title) > TASK_TITLE_MAX_LENGTH:
+        raise ValidationError(f"Title must be at most {TASK_TITLE_MAX_LENGTH} characters")
+    if description and len(description) > TASK_DESCRIPTION_MAX_LENGTH:
+        raise ValidationError(f"Description must be at most {TASK_DESCRIPTION_MAX_LENGTH} characters")
+    
+    return title, description
+
+
 # ============================================================================
 # Task Model Class
 # ============================================================================
@@ -31,7 +31,7 @@ from pathlib import Path
 from typing import List, Tuple
 
 # Import our database configuration
-from config.database import get_database_path, DATABASE_PATH
+from config.database import get_database_path, DATABASE_PATH, DATABASE_CONFIG
 
 
 def print_header():
@@ -141,11 +141,10 @@ def execute_schema(conn: sqlite3.Connection, schema_sql: str, schema_name: str)
     - Different from execute() which runs one statement at a time
     """
     try:
-        cursor = conn.cursor()
-        
         # executescript() runs multiple SQL statements separated by semicolons
         # It's perfect for schema files that contain multiple CREATE TABLE statements
-        cursor.executescript(schema_sql)
+        # conn.executescript() creates the cursor for us behind the scenes
+        conn.executescript(schema_sql)
         
         print_success(f"Executed schema: {schema_name}")
         
@@ -172,12 +171,11 @@ def verify_setup(conn: sqlite3.Connection) -> Tuple[bool, List[str]]:
     - Querying it is a good way to verify database structure
     """
     try:
-        cursor = conn.cursor()
-        
         # Query the sqlite_master table to get all table names
         # type='table' filters out indexes, views, etc.
         # name NOT LIKE 'sqlite_%' excludes internal SQLite tables
-        cursor.execute("""
+        # conn.execute() is a shortcut that creates the cursor for us
+        cursor = conn.execute("""
             SELECT name FROM sqlite_master 
             WHERE type='table' 
             AND name NOT LIKE 'sqlite_%'
@@ -222,6 +220,13 @@ def initialize_database(force: bool = False) -> bool:
         # Delete the existing database
         try:
             db_path.unlink()
+            # WAL mode keeps two helper files next to the database
+            # They belong to the old database, so remove them as well
+            for suffix in ("-wal", "-shm"):
+                try:
+                    Path(str(db_path) + suffix).unlink()
+                except FileNotFoundError:
+                    pass  # Not there (e.g. WAL was never used) - nothing to remove
             print_success("Removed existing database")
         except OSError as e:
             print_error(f"Failed to remove existing database: {e}")
@@ -264,6 +269,12 @@ def initialize_database(force: bool = False) -> bool:
         # Enable foreign key constraints
         conn.execute("PRAGMA foreign_keys = ON")
         
+        if DATABASE_CONFIG["wal"]:
+            # Start the new file in WAL mode (stored in the file itself), as
+            # database/connection.py expects; its read-only connections can't
+            # switch the journal mode themselves
+            conn.execute("PRAGMA journal_mode = WAL")
+        
     except sqlite3.Error as e:
         print_error(f"Failed to connect to database: {e}")
         return False
@@ -193,13 +193,12 @@ def test_todo_model(verbose=False):
     # Initialize test database
     try:
         conn = sqlite3.connect(test_db)
-        cursor = conn.cursor()
         
         # Read and execute schema
         schema_file = Path("database/schemas/todo_schema.sql")
         if schema_file.exists():
             with open(schema_file) as f:
-                cursor.executescript(f.read())
+                conn.executescript(f.read())
             conn.commit()
             print_success("Test database initialized")
         else:
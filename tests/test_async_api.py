@@ -0,0 +1,88 @@
+"""
+Smoke test for the async Task API (examples/async_api_example.py).
+
+Runs every endpoint once through Quart's test client, against a
+temporary database with a completed tasks table. Skipped when quart or
+aiosqlite isn't installed (they are optional, like Flask).
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+pytest.importorskip("quart")
+pytest.importorskip("aiosqlite")
+
+import examples.async_api_example as async_api
+
+
+# The tasks table as it looks once todo_schema.sql TODO 1 is done
+TASKS_TABLE = """
+    CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+async def _exercise_endpoints():
+    """Create, read, update and delete one task; check the error answers."""
+    async with async_api.app.test_app() as test_app:
+        client = test_app.test_client()
+
+        response = await client.post('/api/tasks', json={"title": "  Buy milk  "})
+        assert response.status_code == 201
+        task_id = (await response.get_json())["data"]["id"]
+
+        response = await client.get(f'/api/tasks/{task_id}')
+        task = (await response.get_json())["data"]
+        # Only the named columns, with the title trimmed by task_row()
+        assert set(task) == {"id", "title", "description", "status", "created_at"}
+        assert task["title"] == "Buy milk"
+
+        response = await client.get('/api/tasks?status=pending')
+        assert [t["id"] for t in (await response.get_json())["data"]] == [task_id]
+
+        response = await client.put(f'/api/tasks/{task_id}', json={"status": "completed"})
+        assert response.status_code == 200
+        response = await client.put(f'/api/tasks/{task_id}', json={"status": "bogus"})
+        assert response.status_code == 400
+
+        # Bodies the shared validators reject
+        for body in ({"title": 42}, {"title": "x" * 201}, ["not", "an", "object"]):
+            response = await client.post('/api/tasks', json=body)
+            assert response.status_code == 400, body
+        response = await client.post(
+            '/api/tasks', data="{bad", headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 400
+
+        response = await client.delete(f'/api/tasks/{task_id}')
+        assert response.status_code == 200
+        response = await client.delete(f'/api/tasks/{task_id}')
+        assert response.status_code == 404
+
+
+def test_async_task_endpoints():
+    """Every async Task endpoint answers as the Flask API does."""
+    saved = async_api.get_database_path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "async.db")
+        conn = sqlite3.connect(path)
+        conn.execute(TASKS_TABLE)
+        conn.close()
+
+        # connect() looks the path up on every request
+        async_api.get_database_path = lambda: path
+        try:
+            asyncio.run(_exercise_endpoints())
+            print("✓ Async Task endpoints work end to end")
+        finally:
+            async_api.get_database_path = saved
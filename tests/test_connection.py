@@ -0,0 +1,347 @@
+"""
+Test script for database connection utilities.
+
+This script checks that the connection helpers in database/connection.py
+reuse connections correctly and keep the database consistent.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+
+import database.connection as connection
+from database.connection import (
+    get_connection,
+    release_connection,
+    close_pool,
+    execute_query,
+    execute_query_json,
+    execute_query_rows,
+    iter_query,
+    iter_query_json,
+    execute_update,
+    execute_many,
+    execute_insert_many,
+    execute_script,
+    transaction,
+    QueryExecutionError,
+    DatabaseConnection,
+    _get_reader
+)
+
+
+def test_released_connection_is_reused():
+    """A connection given back to the pool is handed out again."""
+    close_pool()
+
+    conn = get_connection()
+    release_connection(conn)
+
+    again = get_connection()
+    try:
+        assert again is conn
+        print("✓ Released connection was reused")
+    finally:
+        release_connection(again)
+
+
+def test_closed_connection_is_not_pooled():
+    """A connection closed by the caller never goes back into the pool."""
+    close_pool()
+
+    conn = get_connection()
+    conn.close()
+    release_connection(conn)
+
+    fresh = get_connection()
+    try:
+        assert fresh is not conn
+        assert execute_query("SELECT 1 AS one") == [{"one": 1}]
+        print("✓ Closed connection was discarded")
+    finally:
+        release_connection(fresh)
+
+
+def test_release_rolls_back_open_transaction():
+    """Uncommitted work is discarded when a connection is released."""
+    close_pool()
+
+    conn = get_connection()
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS pool_probe (x INTEGER)")
+    conn.execute("INSERT INTO pool_probe (x) VALUES (1)")
+    assert conn.in_transaction
+    release_connection(conn)
+
+    assert not conn.in_transaction
+    count = conn.execute("SELECT COUNT(*) FROM pool_probe").fetchone()[0]
+    assert count == 0
+    print("✓ Open transaction rolled back on release")
+
+
+def test_context_manager_returns_connection_to_pool():
+    """DatabaseConnection gives its connection back instead of closing it."""
+    close_pool()
+
+    with DatabaseConnection() as conn:
+        conn.execute("SELECT 1")
+
+    again = get_connection()
+    try:
+        assert again is conn
+        print("✓ Context manager returned its connection to the pool")
+    finally:
+        release_connection(again)
+
+
+def test_repeated_query_reuses_prepared_cursor():
+    """Running the same SQL twice goes through the same cached cursor."""
+    close_pool()
+
+    with DatabaseConnection() as conn:
+        execute_query("SELECT 1 AS one")
+        first = conn.statement_cache["SELECT 1 AS one"]
+        assert conn.cached_cursor("SELECT 1 AS one") is first
+        print("✓ Prepared cursor reused for identical SQL")
+
+
+def test_schema_change_clears_statement_cache():
+    """DDL through execute_update throws away previously prepared cursors."""
+    close_pool()
+
+    with DatabaseConnection() as conn:
+        execute_query("SELECT 1 AS one")
+        execute_update("CREATE TEMP TABLE IF NOT EXISTS cache_probe (x INTEGER)")
+        execute_query("SELECT 2 AS two")
+        assert "SELECT 1 AS one" not in conn.statement_cache
+        print("✓ Statement cache cleared after schema change")
+
+
+def test_execute_query_can_return_rows():
+    """as_dict=False hands back sqlite3.Row objects instead of dicts."""
+    rows = execute_query("SELECT 1 AS one, 'a' AS letter", as_dict=False)
+
+    assert isinstance(rows[0], sqlite3.Row)
+    assert rows[0]["letter"] == "a"
+    assert execute_query("SELECT 1 AS one") == [{"one": 1}]
+    print("✓ execute_query returns rows or dicts on request")
+
+
+def test_execute_many_inserts_batch_in_one_transaction():
+    """execute_many saves every row, or none of them on error."""
+    close_pool()
+    execute_script("""
+        CREATE TEMP TABLE IF NOT EXISTS batch_probe (x INTEGER UNIQUE);
+        DELETE FROM batch_probe;
+    """)
+
+    inserted = execute_many(
+        "INSERT INTO batch_probe (x) VALUES (?)",
+        ((i,) for i in range(10))
+    )
+    assert inserted == 10
+
+    try:
+        execute_many("INSERT INTO batch_probe (x) VALUES (?)", [(100,), (1,)])
+        assert False, "Duplicate value should have failed"
+    except QueryExecutionError as e:
+        assert "Duplicate entry" in str(e)
+
+    # TEMP tables live on the writer's connection, not on the readers
+    with DatabaseConnection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM batch_probe").fetchone()[0]
+    assert count == 10
+    print("✓ execute_many is all-or-nothing")
+
+
+def test_nested_blocks_share_one_connection():
+    """Nested blocks and helpers inside a block reuse the block's connection."""
+    close_pool()
+
+    with DatabaseConnection() as outer:
+        with DatabaseConnection() as inner:
+            assert inner is outer
+        # Leaving the inner block must not release the outer connection
+        assert outer.execute("SELECT 1").fetchone()[0] == 1
+
+        outer.execute("CREATE TEMP TABLE IF NOT EXISTS nest_probe (x INTEGER)")
+        outer.execute("INSERT INTO nest_probe (x) VALUES (1)")
+        # The uncommitted row is visible because the helper uses the same connection
+        count = execute_query("SELECT COUNT(*) AS n FROM nest_probe")[0]["n"]
+        assert count >= 1
+
+    again = get_connection()
+    try:
+        assert again is outer
+        print("✓ Nested blocks share one connection")
+    finally:
+        release_connection(again)
+
+
+def test_execute_query_json_matches_execute_query():
+    """SQLite-built JSON holds the same rows as execute_query."""
+    query = "SELECT 1 AS one, 'it''s' AS text UNION ALL SELECT 2, NULL"
+
+    assert json.loads(execute_query_json(query)) == execute_query(query)
+    assert execute_query_json("SELECT 1 AS one WHERE 0 = ?", (1,)) == "[]"
+    print("✓ execute_query_json returns the same rows as JSON")
+
+
+def test_reads_use_read_only_connections():
+    """execute_query runs on a read-only connection from its own pool."""
+    close_pool()
+
+    execute_query("SELECT 1 AS one")
+    reader = _get_reader()
+    try:
+        assert reader.readonly
+        # A write that would otherwise succeed on any database (no table
+        # needed), so the only possible error is the read-only one
+        reader.execute("PRAGMA user_version = 1")
+        assert False, "Read-only connection should refuse writes"
+    except sqlite3.OperationalError as e:
+        assert "readonly" in str(e) or "attempt to write" in str(e), e
+        print("✓ Reads go through read-only connections")
+    finally:
+        release_connection(reader)
+
+    conn = get_connection()
+    try:
+        assert not conn.readonly
+    finally:
+        release_connection(conn)
+
+
+def test_reads_work_on_a_fresh_rollback_journal_database():
+    """Reading first works on a database that isn't in WAL mode yet (or doesn't exist)."""
+    close_pool()
+    saved = connection._DB_PATH, connection._DB_READONLY_URI
+
+    def use_database(path):
+        close_pool()
+        connection._DB_PATH = path
+        connection._DB_READONLY_URI = Path(path).as_uri() + "?mode=ro"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Like `python setup.py --force` used to leave it: journal_mode=delete
+        fresh = os.path.join(tmp, "fresh.db")
+        setup_conn = sqlite3.connect(fresh)
+        setup_conn.execute("CREATE TABLE probe (x INTEGER)")
+        setup_conn.execute("INSERT INTO probe (x) VALUES (1)")
+        setup_conn.commit()
+        assert setup_conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        setup_conn.close()
+
+        try:
+            use_database(fresh)
+            assert execute_query("SELECT x FROM probe") == [{"x": 1}]
+            # The first writer switches the file to WAL
+            execute_update("INSERT INTO probe (x) VALUES (2)")
+            check = sqlite3.connect(fresh)
+            assert check.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            check.close()
+            assert execute_query("SELECT COUNT(*) AS n FROM probe") == [{"n": 2}]
+
+            # No database file at all: reads still work, as they did before
+            # read-only connections existed
+            use_database(os.path.join(tmp, "missing.db"))
+            assert execute_query("SELECT 1 AS one") == [{"one": 1}]
+            print("✓ Reads work before the first write")
+        finally:
+            close_pool()
+            connection._DB_PATH, connection._DB_READONLY_URI = saved
+
+
+def test_iter_query_yields_every_row_in_chunks():
+    """iter_query streams all rows, and gives its connection back early."""
+    close_pool()
+    query = """
+        WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 2500)
+        SELECT x FROM n
+    """
+
+    values = [row["x"] for row in iter_query(query, chunk=1000)]
+    assert values == list(range(1, 2501))
+
+    # Stopping after the first row must still release the connection
+    rows = iter_query(query)
+    next(rows)
+    rows.close()
+    reader = _get_reader()
+    try:
+        assert reader.execute("SELECT 1").fetchone()[0] == 1
+        print("✓ iter_query streams rows in chunks")
+    finally:
+        release_connection(reader)
+
+
+def test_iter_query_json_yields_one_json_object_per_row():
+    """iter_query_json streams the same rows as iter_query, as JSON text."""
+    query = "SELECT 1 AS one, 'it''s' AS text UNION ALL SELECT 2, NULL"
+
+    rows = [json.loads(row) for row in iter_query_json(query)]
+    assert rows == [dict(row) for row in iter_query(query)]
+    assert list(iter_query_json("SELECT 1 AS one WHERE 0 = ?", (1,))) == []
+    print("✓ iter_query_json yields each row as JSON")
+
+
+def test_execute_insert_many_returns_new_ids_in_order():
+    """execute_insert_many hands back one ID per inserted row."""
+    close_pool()
+
+    with DatabaseConnection() as conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS ids_probe (id INTEGER PRIMARY KEY, x TEXT)")
+        first = execute_insert_many("INSERT INTO ids_probe (x) VALUES (?)", [("a",), ("b",)])
+        second = execute_insert_many("INSERT INTO ids_probe (x) VALUES (?)", [("c",)])
+
+        assert len(first) == 2 and second == [first[-1] + 1]
+        stored = [row[0] for row in conn.execute("SELECT x FROM ids_probe WHERE id IN (?, ?, ?) ORDER BY id",
+                                                 (*first, *second))]
+        assert stored == ["a", "b", "c"]
+        assert execute_insert_many("INSERT INTO ids_probe (x) VALUES (?)", []) == []
+        print("✓ execute_insert_many returns the new IDs")
+
+
+def test_execute_query_rows_builds_namedtuples_in_select_order():
+    """execute_query_rows maps columns to fields by position."""
+    Pair = namedtuple("Pair", "number word")
+
+    rows = execute_query_rows("SELECT 1, 'one' UNION ALL SELECT ?, ?", (2, "two"), Pair)
+    assert rows == [Pair(1, "one"), Pair(2, "two")]
+    assert rows[1].word == "two"
+    # The shared connection still hands out sqlite3.Row objects afterwards
+    assert execute_query("SELECT 1 AS one") == [{"one": 1}]
+    print("✓ execute_query_rows returns namedtuples")
+
+
+def test_transaction_commits_or_rolls_back_writes_together():
+    """Writes inside transaction() are saved together, or not at all."""
+    close_pool()
+
+    with DatabaseConnection() as conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS tx_probe (x TEXT)")
+        conn.commit()
+
+        with transaction():
+            execute_update("INSERT INTO tx_probe (x) VALUES (?)", ("a",))
+            execute_update("INSERT INTO tx_probe (x) VALUES (?)", ("b",))
+            # Not committed yet - the helpers left that to transaction()
+            assert conn.in_transaction
+
+        assert not conn.in_transaction
+
+        try:
+            with transaction():
+                execute_update("INSERT INTO tx_probe (x) VALUES (?)", ("c",))
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        stored = [row[0] for row in conn.execute("SELECT x FROM tx_probe ORDER BY x")]
+        assert stored == ["a", "b"]
+        # Outside transaction() the helpers commit on their own again
+        execute_update("INSERT INTO tx_probe (x) VALUES (?)", ("d",))
+        assert not conn.in_transaction
+        print("✓ transaction() commits all writes at once")
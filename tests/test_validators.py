@@ -151,6 +151,16 @@ def test_validate_isbn():
             print(f"  ✓ Invalid ISBN fails correctly: {isbn}")
 
 
+def test_todo_validators_solution_run_tests():
+    """The reference solution's own run_tests() must report no failures."""
+    from exercises.solutions.todo_validators_complete import run_tests
+    
+    print("Testing todo_validators_complete.run_tests()...")
+    # run_tests() raises AssertionError if any of its cases fails
+    run_tests()
+    print("  ✓ run_tests() reported no failures")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Validation Functions Test Suite")
@@ -161,6 +171,7 @@ if __name__ == "__main__":
     test_validate_choice()
     test_validate_email()
     test_validate_isbn()
+    test_todo_validators_solution_run_tests()
     
     print("\n" + "=" * 60)
     print("Test suite completed!")
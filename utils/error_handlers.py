@@ -642,8 +642,7 @@ def example_context_manager_error_handling():
     try:
         # The 'with' statement ensures connection is closed automatically
         with DatabaseConnection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM books")
+            cursor = conn.execute("SELECT * FROM books")
             books = cursor.fetchall()
             
             # Even if an error occurs here, connection will be closed
@@ -35,7 +35,7 @@ Example Usage:
 """
 
 import re
-from typing import List
+from typing import Collection
 
 
 # Custom exception for validation errors
@@ -123,7 +123,7 @@ def validate_length(value: str, field_name: str, min_len: int = None, max_len: i
         raise ValidationError(f"{field_name} must be at most {max_len} characters")
 
 
-def validate_choice(value: str, field_name: str, allowed_values: List[str]) -> None:
+def validate_choice(value: str, field_name: str, allowed_values: Collection[str]) -> None:
     """
     Validate that a value is one of the allowed choices.
     
@@ -138,7 +138,7 @@ def validate_choice(value: str, field_name: str, allowed_values: List[str]) -> N
     Args:
         value: The value to validate
         field_name: Name of the field (used in error message)
-        allowed_values: List of valid choices
+        allowed_values: Valid choices - a list, tuple, set or frozenset
     
     Raises:
         ValidationError: If value is not in allowed_values
@@ -150,11 +150,16 @@ def validate_choice(value: str, field_name: str, allowed_values: List[str]) -> N
     
     Learning Notes:
         - The 'in' operator checks if a value exists in a list
+        - For a set/frozenset, 'in' is a single hash lookup instead of a scan;
+          define it once at module level, e.g. STATUSES = frozenset({...})
         - We use ', '.join() to create a readable list in the error message
         - This pattern is better than using if/elif chains for multiple values
         - Consider using Python's Enum class for more complex scenarios
     """
     if value not in allowed_values:
+        # Sets have no order, so sort them for a predictable message
+        if isinstance(allowed_values, (set, frozenset)):
+            allowed_values = sorted(allowed_values)
         raise ValidationError(
             f"{field_name} must be one of: {', '.join(allowed_values)}"
         )